@@ -0,0 +1,60 @@
+# 타임스탬프 파서 마이크로 벤치마크
+# 합성 로그(기본 1천만 줄)를 만들고, 기존 방식(extract_timestamp 두 번 + 튜플 정렬)과
+# 컬럼형 파서(한 번 파싱 + 배열 정렬/필터)의 초당 처리 줄 수를 비교한다.
+#
+# 사용 예: python bench_parser.py --lines 10000000
+
+import argparse
+import os
+import tempfile
+import time
+
+from log_generator import write_synthetic_log
+from log_parser import np, parse_log_columns, reverse_chronological_order, select_problematic
+from main import extract_timestamp, filter_problematic_logs
+
+
+# 기존 방식: readlines → 헤더 제외 → extract_timestamp 두 번 → 정렬 → 필터
+def bench_legacy(path):
+    with open(path, 'r', encoding='utf-8') as file:
+        log_data = file.readlines()
+    log_data = [line for line in log_data if "timestamp,event,message" not in line]
+    sorted_log_data = sorted(
+        [(extract_timestamp(line), line) for line in log_data if extract_timestamp(line) is not None],
+        key=lambda x: x[0], reverse=True
+    )
+    return len(sorted_log_data), len(filter_problematic_logs(sorted_log_data))
+
+
+# 컬럼형 방식: 한 번 파싱 → 배열 정렬 → 배열 필터
+def bench_columnar(path):
+    columns = parse_log_columns(path)
+    order = reverse_chronological_order(columns)
+    return len(order), len(select_problematic(columns, order))
+
+
+def measure(name, func, path, line_count):
+    started = time.perf_counter()
+    rows, problems = func(path)
+    elapsed = time.perf_counter() - started
+    print(f"{name:<10} {elapsed:8.2f}s  {line_count / elapsed:12,.0f} lines/sec  "
+          f"(rows={rows:,}, problematic={problems:,})")
+    return elapsed
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Timestamp parser micro-benchmark')
+    parser.add_argument('--lines', type=int, default=10_000_000, help='합성 로그 줄 수')
+    parser.add_argument('--skip-legacy', action='store_true', help='기존 방식 측정 생략 (메모리가 부족할 때)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        log_path = os.path.join(tmp_dir, 'synthetic.log')
+        print(f"Generating {args.lines:,} synthetic log lines...")
+        write_synthetic_log(log_path, args.lines)
+        print(f"NumPy: {'yes' if np is not None else 'no (array fallback)'}")
+
+        columnar_time = measure('columnar', bench_columnar, log_path, args.lines)
+        if not args.skip_legacy:
+            legacy_time = measure('legacy', bench_legacy, log_path, args.lines)
+            print(f"speedup    {legacy_time / columnar_time:8.2f}x")
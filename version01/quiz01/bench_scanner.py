@@ -0,0 +1,62 @@
+# mmap 스캐너 벤치마크
+# 여러 크기의 합성 로그에서 기존 방식(readlines() + strip() 후 키워드 검사)과
+# mmap 스캐너(bytes 키워드 검색 후 결과 줄만 디코딩)의 문제 로그 스캔 시간을 비교한다.
+# 보고서 전체를 쓰는 시간(--stream 경로와 --mmap 경로)도 함께 잰다.
+#
+# 사용 예: python bench_scanner.py --sizes 100000 1000000 5000000
+
+import argparse
+import os
+import tempfile
+import time
+
+from log_generator import write_synthetic_log
+from log_pipeline import parse_log_line, run_streaming_analysis
+from mmap_scanner import run_mmap_analysis, scan_problematic_records
+
+
+# 기존 방식: readlines → strip → 키워드 검사 → 문제 로그만 파싱
+def scan_readlines(path):
+    with open(path, 'r', encoding='utf-8') as file:
+        lines = [line.strip() for line in file.readlines()]
+    return sum(1 for line in lines
+               if ('ERROR' in line or 'CRITICAL' in line or 'WARNING' in line) and parse_log_line(line) is not None)
+
+
+# mmap 방식: 키워드 위치만 찾고 해당 줄만 디코딩
+def scan_mmap(path):
+    return sum(1 for _ in scan_problematic_records(path))
+
+
+def timed(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - started, result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='mmap scanner benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000],
+                        help='합성 로그 줄 수 목록')
+    parser.add_argument('--skip-report', action='store_true', help='보고서 작성 시간 측정 생략')
+    args = parser.parse_args()
+
+    print(f"{'lines':>12} {'readlines':>10} {'mmap':>10} {'speedup':>8} "
+          f"{'stream rpt':>11} {'mmap rpt':>10} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        log_path = os.path.join(tmp_dir, 'synthetic.log')
+        report_path = os.path.join(tmp_dir, 'report.md')
+        for size in args.sizes:
+            write_synthetic_log(log_path, size)
+            legacy_time, legacy_count = timed(scan_readlines, log_path)
+            mmap_time, mmap_count = timed(scan_mmap, log_path)
+            if legacy_count != mmap_count:
+                print(f"warning: problematic line counts differ ({legacy_count} vs {mmap_count})")
+            row = (f"{size:>12,} {legacy_time:>9.3f}s {mmap_time:>9.3f}s "
+                   f"{legacy_time / mmap_time:>7.1f}x")
+            if not args.skip_report:
+                stream_time, _ = timed(run_streaming_analysis, log_path, report_path)
+                mmap_report_time, _ = timed(run_mmap_analysis, log_path, report_path)
+                row += (f" {stream_time:>10.3f}s {mmap_report_time:>9.3f}s "
+                        f"{stream_time / mmap_report_time:>7.1f}x")
+            print(row)
@@ -0,0 +1,189 @@
+# 로그 분석기 벤치마크 모음
+# 합성 로그(기본 1만 / 100만 / 1000만 줄)에서 분석 파이프라인의 단계별 시간
+# (read, parse, sort, filter, report), 초당 처리 줄 수, 최대 메모리(peak RSS)를 잰다.
+# 크기와 파이프라인 조합마다 새 프로세스에서 실행하므로 peak RSS가 서로 섞이지 않는다.
+#
+# 파이프라인:
+#   legacy   : main.py 기본 방식 (readlines → extract_timestamp → sorted → 필터 → 문자열 보고서)
+#   columnar : --columnar 방식 (한 번 파싱 → 배열 정렬/필터 → 스트리밍 보고서), read는 parse에 포함
+#
+# 사용 예:
+#   python bench_suite.py --save-baseline baseline.json
+#   python bench_suite.py --sizes 10000 1000000 --baseline baseline.json
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+from log_generator import write_synthetic_log
+
+try:
+    import resource
+except ImportError:  # Windows에는 resource 모듈이 없다
+    resource = None
+
+DEFAULT_SIZES = [10_000, 1_000_000, 10_000_000]
+PIPELINES = ('legacy', 'columnar')
+STAGES = ('read', 'parse', 'sort', 'filter', 'report')
+
+# legacy 파이프라인은 파일 전체를 줄 튜플로 올리므로 이 크기를 넘으면 기본적으로 건너뛴다
+DEFAULT_MAX_LEGACY_LINES = 1_000_000
+
+
+# 현재 프로세스의 최대 메모리 사용량 (KB, 알 수 없으면 None)
+def peak_rss_kb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB 단위
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+# 단계별 시간 측정기
+class StageTimer:
+    def __init__(self):
+        self.timings = {}
+
+    def run(self, stage, func, *args):
+        started = time.perf_counter()
+        result = func(*args)
+        self.timings[stage] = self.timings.get(stage, 0.0) + time.perf_counter() - started
+        return result
+
+
+def run_legacy(log_path, report_path, timer):
+    from main import (extract_timestamp, filter_problematic_logs, generate_markdown_report, read_log_file,
+                      save_markdown_report)
+
+    log_data = timer.run('read', read_log_file, log_path)
+    parsed = timer.run('parse', lambda: [
+        (extract_timestamp(line), line) for line in log_data
+        if "timestamp,event,message" not in line and extract_timestamp(line) is not None
+    ])
+    sorted_log_data = timer.run('sort', lambda: sorted(parsed, key=lambda x: x[0], reverse=True))
+    problematic_lines = timer.run('filter', filter_problematic_logs, sorted_log_data)
+    timer.run('report', lambda: save_markdown_report(generate_markdown_report(sorted_log_data, problematic_lines),
+                                                     report_path))
+    return len(sorted_log_data), len(problematic_lines)
+
+
+def run_columnar(log_path, report_path, timer):
+    from log_parser import iter_records, parse_log_columns, reverse_chronological_order, select_problematic
+    from log_pipeline import write_markdown_report_stream
+
+    columns = timer.run('parse', parse_log_columns, log_path)
+    order = timer.run('sort', reverse_chronological_order, columns)
+    problem_order = timer.run('filter', select_problematic, columns, order)
+    return timer.run('report', lambda: write_markdown_report_stream(
+        iter_records(columns, order), report_path, problem_records=iter_records(columns, problem_order)))
+
+
+PIPELINE_RUNNERS = {
+    'legacy': run_legacy,
+    'columnar': run_columnar,
+}
+
+
+# 작업자 프로세스: 파이프라인 하나를 실행하고 결과를 JSON 한 줄로 출력
+def run_worker(pipeline, log_path, line_count):
+    timer = StageTimer()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        rows, problems = PIPELINE_RUNNERS[pipeline](log_path, os.path.join(tmp_dir, 'report.md'), timer)
+    total = sum(timer.timings.values())
+    print(json.dumps({
+        'pipeline': pipeline,
+        'lines': line_count,
+        'rows': rows,
+        'problematic': problems,
+        'stages': timer.timings,
+        'total': total,
+        'lines_per_sec': line_count / total if total else None,
+        'peak_rss_kb': peak_rss_kb(),
+    }))
+
+
+# 새 프로세스에서 작업자 실행
+def measure(pipeline, log_path, line_count):
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--worker', pipeline, log_path, str(line_count)],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+# 결과 표 출력 (기준 결과가 있으면 전체 시간 비율을 함께 보여 준다)
+def print_results(results, baseline=None):
+    reference = {}
+    for entry in (baseline or {}).get('results', []):
+        reference[(entry['pipeline'], entry['lines'])] = entry
+    print(f"{'pipeline':<9} {'lines':>11} " + ' '.join(f"{stage:>8}" for stage in STAGES)
+          + f" {'total':>8} {'lines/s':>11} {'peak RSS':>10}" + (f" {'vs base':>8}" if baseline else ''))
+    for entry in results:
+        stages = ' '.join(f"{entry['stages'][stage]:>7.2f}s" if stage in entry['stages'] else f"{'-':>8}"
+                          for stage in STAGES)
+        rss = f"{entry['peak_rss_kb'] / 1024:>8.1f}MB" if entry['peak_rss_kb'] is not None else f"{'-':>10}"
+        row = (f"{entry['pipeline']:<9} {entry['lines']:>11,} {stages} {entry['total']:>7.2f}s "
+               f"{entry['lines_per_sec']:>11,.0f} {rss}")
+        if baseline:
+            base = reference.get((entry['pipeline'], entry['lines']))
+            row += f" {base['total'] / entry['total']:>7.2f}x" if base else f" {'-':>8}"
+        print(row)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Log analyzer benchmark suite')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='합성 로그 줄 수 목록')
+    parser.add_argument('--pipelines', nargs='+', choices=PIPELINES, default=list(PIPELINES))
+    parser.add_argument('--max-legacy-lines', type=int, default=DEFAULT_MAX_LEGACY_LINES,
+                        help='legacy 파이프라인을 실행할 최대 줄 수 (메모리 보호)')
+    parser.add_argument('--mix', help='심각도 비율 (예: INFO=90,WARNING=6,ERROR=3,CRITICAL=1)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--save-baseline', help='결과를 기준 JSON 파일로 저장')
+    parser.add_argument('--baseline', help='비교할 기준 JSON 파일')
+    parser.add_argument('--worker', nargs=3, metavar=('PIPELINE', 'LOG', 'LINES'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        pipeline, log_path, line_count = args.worker
+        run_worker(pipeline, log_path, int(line_count))
+        exit(0)
+
+    from log_generator import parse_mix
+    from log_parser import np
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        log_path = os.path.join(tmp_dir, 'synthetic.log')
+        for size in args.sizes:
+            print(f"Generating {size:,} synthetic log lines...", file=sys.stderr)
+            write_synthetic_log(log_path, size, seed=args.seed, mix=parse_mix(args.mix) if args.mix else None)
+            for pipeline in args.pipelines:
+                if pipeline == 'legacy' and size > args.max_legacy_lines:
+                    print(f"Skipping legacy at {size:,} lines (--max-legacy-lines {args.max_legacy_lines:,}).",
+                          file=sys.stderr)
+                    continue
+                results.append(measure(pipeline, log_path, size))
+
+    print_results(results, baseline)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'numpy': np.__version__ if np is not None else None,
+                'seed': args.seed,
+                'mix': args.mix,
+                'results': results,
+            }, f, indent=2)
+        print(f"Baseline saved to '{args.save_baseline}'.")
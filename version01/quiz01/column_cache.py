@@ -0,0 +1,198 @@
+# 파싱된 로그 컬럼의 바이너리 캐시
+# 같은 로그를 다시 분석할 때마다 텍스트를 새로 파싱하지 않도록, 컬럼형 파서의 결과를
+# 로그 옆 '<로그 파일>.colcache' 파일에 저장해 두고 다음 실행 때 mmap으로 바로 불러온다.
+# 원본의 크기, 수정 시각(mtime), 앞/뒤 일부의 해시, 그리고 심각도 규칙이 모두 같을 때만 캐시를 쓴다.
+#
+# 캐시 파일 형식 (리틀 엔디언, 각 컬럼은 8바이트 경계에서 시작):
+#   헤더     : magic(4s) version(H) source_size(Q) source_mtime_ns(q) source_hash(20s) rules_hash(20s)
+#              row_count(Q) event_count(I) string_count(I) blob_size(Q)
+#   문자열 표: string_offsets(q) × (string_count + 1), 이어서 UTF-8 문자열을 이어 붙인 blob
+#              (앞의 event_count개는 이벤트 이름, 나머지는 서로 다른 메시지)
+#   컬럼     : epoch(q) line_offsets(q) message_offsets(q) message_ids(i) line_lengths(i) events(i) problems(b)
+#              가 각각 row_count개
+# NumPy가 있으면 np.frombuffer, 없으면 memoryview.cast로 mmap 위에서 복사 없이 컬럼을 본다.
+
+import hashlib
+import mmap
+import os
+import struct
+from array import array
+
+from log_parser import LogColumns, np, parse_log_columns
+from rules import default_rules
+
+CACHE_MAGIC = b'MLCC'
+CACHE_VERSION = 2
+CACHE_HEADER = struct.Struct('<4sHQq20s20sQIIQ')
+
+# 원본 해시에 쓰는 앞/뒤 바이트 수 (파일 전체를 읽지 않고 내용이 바뀌었는지 확인)
+SAMPLE_BYTES = 64 * 1024
+
+# 문자열 표에 넣는 서로 다른 메시지의 최대 개수 (넘으면 message_id는 -1, 메시지는 원본에서 읽는다)
+MAX_MESSAGES = 65536
+NO_MESSAGE = -1
+
+# (이름, array 타입 코드) 저장 순서
+COLUMN_LAYOUT = (
+    ('epoch', 'q'),
+    ('line_offsets', 'q'),
+    ('message_offsets', 'q'),
+    ('message_ids', 'i'),
+    ('line_lengths', 'i'),
+    ('events', 'i'),
+    ('problems', 'b'),
+)
+
+NUMPY_TYPES = {'q': '<i8', 'i': '<i4', 'b': 'i1'}
+
+
+# 캐시 파일 기본 경로
+def cache_path_for(log_path):
+    return log_path + '.colcache'
+
+
+# 원본 앞/뒤 일부의 해시
+def source_hash(file_path, size):
+    digest = hashlib.sha1()
+    with open(file_path, 'rb') as file:
+        digest.update(file.read(SAMPLE_BYTES))
+        if size > SAMPLE_BYTES:
+            file.seek(max(SAMPLE_BYTES, size - SAMPLE_BYTES))
+            digest.update(file.read(SAMPLE_BYTES))
+    return digest.digest()
+
+
+# 심각도 규칙의 해시 (problems 컬럼은 규칙에 따라 달라진다)
+def rules_hash(rules):
+    text = '\n'.join(sorted(rules.severity_keywords())) + f"\nignore_case={rules.ignore_case}"
+    return hashlib.sha1(text.encode('utf-8')).digest()
+
+
+# 8바이트 경계까지 채울 바이트 수
+def padding(size):
+    return -size % 8
+
+
+# 컬럼 값을 바이트로 (NumPy 배열이든 array / 리스트든)
+def column_bytes(values, typecode):
+    if np is not None and isinstance(values, np.ndarray):
+        return values.astype(NUMPY_TYPES[typecode]).tobytes()
+    return array(typecode, values).tobytes()
+
+
+# 메시지마다 문자열 표 번호 붙이기 (원본을 mmap으로 열어 메시지 부분만 본다)
+# 로그 줄이 없으면 (빈 파일은 mmap할 수 없으므로) 파일을 열지 않고 빈 표를 돌려준다.
+def build_message_table(columns):
+    ids = array('i')
+    table = {}
+    if len(columns.line_offsets) == 0:
+        return ids, []
+    with open(columns.path, 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for start, length, message_start in zip(columns.line_offsets, columns.line_lengths,
+                                                 columns.message_offsets):
+            message = mm[int(message_start):int(start) + int(length)].strip()
+            message_id = table.get(message)
+            if message_id is None:
+                if len(table) >= MAX_MESSAGES:
+                    ids.append(NO_MESSAGE)
+                    continue
+                message_id = table[message] = len(table)
+            ids.append(message_id)
+    return ids, list(table)
+
+
+# 컬럼을 캐시 파일로 저장 (임시 파일에 쓴 뒤 교체)
+def save_column_cache(columns, cache_path, rules):
+    stat = os.stat(columns.path)
+    message_ids, messages = build_message_table(columns)
+    event_count = len(columns.event_names)
+    # 메시지 번호는 문자열 표 전체에서의 번호 (앞쪽은 이벤트 이름)
+    message_ids = array('i', (NO_MESSAGE if message_id < 0 else message_id + event_count
+                              for message_id in message_ids))
+    strings = [name.encode('utf-8') for name in columns.event_names] + messages
+
+    string_offsets = array('q', [0])
+    for string in strings:
+        string_offsets.append(string_offsets[-1] + len(string))
+    blob = b''.join(strings)
+
+    values = dict(columns._asdict(), message_ids=message_ids)
+    tmp_path = cache_path + '.tmp'
+    with open(tmp_path, 'wb') as file:
+        file.write(CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, stat.st_size, stat.st_mtime_ns,
+                                     source_hash(columns.path, stat.st_size), rules_hash(rules),
+                                     len(columns.epoch), event_count, len(strings), len(blob)))
+        file.write(b'\0' * padding(CACHE_HEADER.size))
+        file.write(string_offsets.tobytes())
+        file.write(blob + b'\0' * padding(len(blob)))
+        for name, typecode in COLUMN_LAYOUT:
+            data = column_bytes(values[name], typecode)
+            file.write(data + b'\0' * padding(len(data)))
+    os.replace(tmp_path, cache_path)
+
+
+# mmap 위의 한 구간을 컬럼으로 보기 (복사 없음)
+def column_view(mm, offset, count, typecode):
+    if np is not None:
+        return np.frombuffer(mm, dtype=NUMPY_TYPES[typecode], count=count, offset=offset)
+    return memoryview(mm)[offset:offset + count * array(typecode).itemsize].cast(typecode)
+
+
+# 캐시 불러오기 (없거나, 형식이 다르거나, 원본/규칙이 바뀌었으면 None)
+def load_column_cache(log_path, cache_path, rules):
+    try:
+        stat = os.stat(log_path)
+        with open(cache_path, 'rb') as file:
+            header = file.read(CACHE_HEADER.size)
+            if len(header) < CACHE_HEADER.size:
+                return None
+            (magic, version, size, mtime_ns, source_digest, rules_digest,
+             row_count, event_count, string_count, blob_size) = CACHE_HEADER.unpack(header)
+            if (magic, version) != (CACHE_MAGIC, CACHE_VERSION):
+                return None
+            if (size, mtime_ns, rules_digest) != (stat.st_size, stat.st_mtime_ns, rules_hash(rules)):
+                return None
+            if source_digest != source_hash(log_path, stat.st_size):
+                return None
+            mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError:
+        return None
+
+    offset = CACHE_HEADER.size + padding(CACHE_HEADER.size)
+    string_offsets = struct.unpack_from(f'<{string_count + 1}q', mm, offset)
+    offset += 8 * (string_count + 1)
+    blob_start = offset
+    strings = [mm[blob_start + string_offsets[i]:blob_start + string_offsets[i + 1]].decode('utf-8')
+               for i in range(string_count)]
+    offset += blob_size + padding(blob_size)
+
+    views = {}
+    for name, typecode in COLUMN_LAYOUT:
+        views[name] = column_view(mm, offset, row_count, typecode)
+        size = row_count * array(typecode).itemsize
+        offset += size + padding(size)
+    if np is not None:
+        views['problems'] = views['problems'].astype(bool)
+
+    # 컬럼 뷰가 mmap을 참조하고 있으므로 mmap은 컬럼이 사라질 때 함께 정리된다
+    return LogColumns(log_path, views['epoch'], views['events'], views['problems'],
+                      views['line_offsets'], views['line_lengths'], views['message_offsets'],
+                      tuple(strings[:event_count]), views['message_ids'], tuple(strings))
+
+
+# 캐시가 최신이면 불러오고, 아니면 파싱한 뒤 캐시를 새로 쓴다
+# 반환값: (컬럼, 캐시 적중 여부)
+def load_or_parse_columns(log_path, rules=None, cache_path=None):
+    rules = rules or default_rules()
+    cache_path = cache_path or cache_path_for(log_path)
+    columns = load_column_cache(log_path, cache_path, rules)
+    if columns is not None:
+        return columns, True
+    columns = parse_log_columns(log_path, rules=rules)
+    try:
+        save_column_cache(columns, cache_path, rules)
+    except OSError as e:
+        # 로그 옆에 쓸 수 없으면 캐시 없이 진행
+        print(f"Warning: Could not write column cache '{cache_path}': {e}")
+    return columns, False
@@ -0,0 +1,96 @@
+# 메모리보다 큰 로그를 위한 외부 병합 정렬
+# 메모리 예산만큼 레코드를 모아 정렬한 뒤(run) 임시 파일로 내보내고,
+# 마지막에 heapq.merge(reverse=True)로 k-way 병합해서 시간 역순으로 내보낸다.
+
+import heapq
+import sys
+import tempfile
+from itertools import islice
+
+from log_pipeline import parse_log_lines
+
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+
+# namedtuple, 타임스탬프 튜플, 리스트 슬롯 등 문자열 외의 레코드당 대략적인 비용 (바이트)
+RECORD_OVERHEAD = 200
+
+# 한 번에 병합할 최대 run 개수 (열린 임시 파일 수 제한)
+MAX_MERGE_FAN_IN = 64
+
+
+def sort_key(record):
+    return record.timestamp
+
+
+# 레코드 하나가 메모리에서 차지하는 크기 추정
+def estimate_record_size(record):
+    return (sys.getsizeof(record.line) + sys.getsizeof(record.event)
+            + sys.getsizeof(record.message) + RECORD_OVERHEAD)
+
+
+# 정렬된 레코드들을 임시 파일(run)에 기록
+def spill_run(records, tmp_dir=None):
+    run_file = tempfile.TemporaryFile('w+', encoding='utf-8', dir=tmp_dir)
+    for record in records:
+        run_file.write(record.line)
+        run_file.write('\n')
+    run_file.seek(0)
+    return run_file
+
+
+# run 파일을 다시 LogRecord 스트림으로 읽기
+def iter_run(run_file):
+    return parse_log_lines(line.rstrip('\n') for line in run_file)
+
+
+# 여러 run을 하나의 run으로 병합 (fan-in이 너무 클 때 중간 단계로 사용)
+def merge_runs_to_file(run_files, reverse, tmp_dir=None):
+    merged = heapq.merge(*(iter_run(f) for f in run_files), key=sort_key, reverse=reverse)
+    merged_file = spill_run(merged, tmp_dir)
+    for run_file in run_files:
+        run_file.close()
+    return merged_file
+
+
+# 외부 정렬 실행
+# memory_budget: 정렬 버퍼에 쓸 최대 메모리 (바이트)
+# 데이터가 예산 안에 들어오면 임시 파일 없이 메모리에서 바로 정렬한다.
+# sorted()와 heapq.merge 모두 안정 정렬이므로 같은 시각의 로그는 원래 순서를 유지한다.
+def external_sort(records, memory_budget=DEFAULT_MEMORY_BUDGET, reverse=True, tmp_dir=None):
+    run_files = []
+    buffer = []
+    buffer_size = 0
+
+    try:
+        for record in records:
+            buffer.append(record)
+            buffer_size += estimate_record_size(record)
+            if buffer_size >= memory_budget:
+                buffer.sort(key=sort_key, reverse=reverse)
+                run_files.append(spill_run(buffer, tmp_dir))
+                buffer = []
+                buffer_size = 0
+
+        buffer.sort(key=sort_key, reverse=reverse)
+        if not run_files:
+            yield from buffer
+            return
+        if buffer:
+            run_files.append(spill_run(buffer, tmp_dir))
+            buffer = []
+
+        # run이 너무 많으면 여러 단계로 나눠 병합
+        while len(run_files) > MAX_MERGE_FAN_IN:
+            next_runs = []
+            run_iter = iter(run_files)
+            while True:
+                group = list(islice(run_iter, MAX_MERGE_FAN_IN))
+                if not group:
+                    break
+                next_runs.append(merge_runs_to_file(group, reverse, tmp_dir))
+            run_files = next_runs
+
+        yield from heapq.merge(*(iter_run(f) for f in run_files), key=sort_key, reverse=reverse)
+    finally:
+        for run_file in run_files:
+            run_file.close()
@@ -0,0 +1,246 @@
+# 압축된 미션 로그의 블록(체크포인트) 인덱스
+# gzip 파일은 여러 멤버(member)를 이어 붙여도 하나의 정상 gzip 파일이다.
+# 로그를 줄 경계에서 끊어 약 1MB씩 독립된 멤버로 압축해 두면, 각 멤버 시작 위치부터
+# 압축을 풀 수 있으므로 시간 범위 조회가 파일 처음이 아니라 목표 근처에서 시작한다.
+#
+# 사이드카 '<파일>.gz.gzidx' 형식 (리틀 엔디언):
+#   헤더  : magic(4s) version(H) entry_count(Q)
+#   엔트리: first_epoch(q) compressed_offset(Q) uncompressed_offset(Q) 가 entry_count개
+#
+# 일반 도구로 만든 단일 멤버 gzip도 인덱싱할 수 있지만 체크포인트가 파일 처음 하나뿐이라 효과는 없다.
+#
+# 사용 예:
+#   python gzip_index.py compress mission_computer_main.log mission_computer_main.log.gz
+#   python gzip_index.py index mission_computer_main.log.gz
+
+import argparse
+import calendar
+import gzip
+import os
+import struct
+import zlib
+from bisect import bisect_left
+
+from log_pipeline import iter_log_lines, parse_log_line
+
+GZIP_INDEX_MAGIC = b'MLGZ'
+GZIP_INDEX_VERSION = 1
+GZIP_INDEX_HEADER = struct.Struct('<4sHQ')
+GZIP_INDEX_ENTRY = struct.Struct('<qQQ')
+
+# 멤버 하나에 담을 원본 바이트 수
+DEFAULT_MEMBER_SIZE = 1024 * 1024
+READ_CHUNK_SIZE = 256 * 1024
+
+# 타임스탬프를 알 수 없는 체크포인트 (항상 맨 앞 취급)
+UNKNOWN_EPOCH = -(2 ** 63)
+
+
+# 사이드카 인덱스 경로
+def gzip_index_path_for(gz_path):
+    return gz_path + '.gzidx'
+
+
+# 줄에서 epoch 얻기 (로그 줄이 아니면 None)
+def line_epoch(line):
+    record = parse_log_line(line)
+    if record is None:
+        return None
+    return calendar.timegm(record.timestamp)
+
+
+# 체크포인트 목록 저장
+def save_gzip_index(entries, index_path):
+    with open(index_path, 'wb') as file:
+        file.write(GZIP_INDEX_HEADER.pack(GZIP_INDEX_MAGIC, GZIP_INDEX_VERSION, len(entries)))
+        for entry in entries:
+            file.write(GZIP_INDEX_ENTRY.pack(*entry))
+
+
+# 체크포인트 목록 불러오기 (없거나 형식이 다르면 None)
+def load_gzip_index(index_path):
+    try:
+        with open(index_path, 'rb') as file:
+            header = file.read(GZIP_INDEX_HEADER.size)
+            if len(header) < GZIP_INDEX_HEADER.size:
+                return None
+            magic, version, count = GZIP_INDEX_HEADER.unpack(header)
+            if magic != GZIP_INDEX_MAGIC or version != GZIP_INDEX_VERSION:
+                return None
+            return list(GZIP_INDEX_ENTRY.iter_unpack(file.read(GZIP_INDEX_ENTRY.size * count)))
+    except FileNotFoundError:
+        return None
+
+
+# 원본 로그를 줄 경계에서 끊어 여러 gzip 멤버로 압축하고 체크포인트 인덱스도 함께 저장
+def write_blocked_gzip(src_path, gz_path, member_size=DEFAULT_MEMBER_SIZE, index_path=None):
+    entries = []
+    uncompressed_offset = 0
+    block = []
+    block_size = 0
+    block_epoch = None
+
+    with open(src_path, 'rb') as src, open(gz_path, 'wb') as out:
+        def flush_block():
+            nonlocal uncompressed_offset, block, block_size, block_epoch
+            if not block:
+                return
+            data = b''.join(block)
+            entries.append((UNKNOWN_EPOCH if block_epoch is None else block_epoch,
+                            out.tell(), uncompressed_offset))
+            out.write(gzip.compress(data))
+            uncompressed_offset += len(data)
+            block, block_size, block_epoch = [], 0, None
+
+        for raw in src:
+            if not block:
+                block_epoch = line_epoch(raw.decode('utf-8').rstrip('\r\n'))
+            block.append(raw)
+            block_size += len(raw)
+            if block_size >= member_size:
+                flush_block()
+        flush_block()
+
+    save_gzip_index(entries, index_path or gzip_index_path_for(gz_path))
+    return entries
+
+
+# 이미 있는 gzip 파일의 멤버 경계를 찾아 인덱스 만들기 (한 번 전체를 풀어 본다)
+# 이전 멤버가 개행으로 끝나서 줄 경계에서 시작하는 멤버만 체크포인트로 쓴다.
+def build_gzip_index(gz_path, index_path=None):
+    entries = []
+    consumed = 0                # 지금까지 처리한 압축 바이트 수
+    uncompressed = 0            # 지금까지 푼 원본 바이트 수
+    member_start = (0, 0)       # 현재 멤버의 (압축 오프셋, 원본 오프셋)
+    at_line_start = True
+    first_line = b''
+    need_first_line = True
+    decompressor = zlib.decompressobj(wbits=31)
+
+    def add_checkpoint():
+        if at_line_start:
+            epoch = line_epoch(first_line.split(b'\n', 1)[0].decode('utf-8', 'replace').rstrip('\r'))
+            entries.append((UNKNOWN_EPOCH if epoch is None else epoch,) + member_start)
+
+    with open(gz_path, 'rb') as file:
+        buffer = b''
+        while True:
+            if not buffer:
+                buffer = file.read(READ_CHUNK_SIZE)
+                if not buffer:
+                    break
+            data = decompressor.decompress(buffer)
+            consumed += len(buffer) - len(decompressor.unused_data)
+            if data:
+                uncompressed += len(data)
+                last_byte = data[-1:]
+                if need_first_line:
+                    first_line += data
+                    if b'\n' in first_line:
+                        add_checkpoint()
+                        need_first_line = False
+
+            if decompressor.eof:
+                if need_first_line and first_line:
+                    add_checkpoint()
+                # 남은 바이트는 다음 멤버의 시작
+                buffer = decompressor.unused_data
+                at_line_start = last_byte == b'\n'
+                member_start = (consumed, uncompressed)
+                first_line = b''
+                need_first_line = True
+                decompressor = zlib.decompressobj(wbits=31)
+            else:
+                buffer = b''
+
+    save_gzip_index(entries, index_path or gzip_index_path_for(gz_path))
+    return entries
+
+
+# 인덱스 불러오기 (없으면 만든다)
+def ensure_gzip_index(gz_path):
+    index_path = gzip_index_path_for(gz_path)
+    if os.path.exists(index_path) and os.path.getmtime(index_path) >= os.path.getmtime(gz_path):
+        entries = load_gzip_index(index_path)
+        if entries is not None:
+            return entries
+    return build_gzip_index(gz_path, index_path)
+
+
+# 시간 범위 [start_epoch, end_epoch] 조회
+# 첫 시각이 start_epoch 이상인 첫 멤버의 바로 앞 멤버부터 압축을 풀고, 범위를 넘어가면 멈춘다
+# (시간 순서대로 쌓인 로그 가정). 같은 시각의 줄이 멤버 경계에 걸쳐 있으면 앞 멤버 끝에도 있으므로
+# 첫 시각이 start_epoch와 같은 멤버에서 시작하면 안 된다.
+def query_gzip_range(gz_path, start_epoch, end_epoch, entries=None):
+    entries = entries if entries is not None else ensure_gzip_index(gz_path)
+    position = bisect_left([entry[0] for entry in entries], start_epoch) - 1
+    compressed_offset = entries[position][1] if position >= 0 else 0
+
+    with open(gz_path, 'rb') as raw:
+        raw.seek(compressed_offset)
+        with gzip.open(raw, 'rt', encoding='utf-8') as file:
+            for line in file:
+                record = parse_log_line(line.rstrip('\r\n'))
+                if record is None:
+                    continue
+                epoch = calendar.timegm(record.timestamp)
+                if epoch > end_epoch:
+                    break
+                if epoch >= start_epoch:
+                    yield record
+
+
+# 회귀 검사: 같은 시각(10:00:03)의 줄 20개가 멤버 경계에 걸쳐 있어도 조회 결과에서 빠지지 않는지
+def check_boundary_query():
+    import tempfile
+
+    lines = ['timestamp,event,message\n']
+    lines += [f'2023-08-27 10:00:0{second},INFO,filler {second}\n' for second in range(3)]
+    lines += [f'2023-08-27 10:00:03,INFO,same second {index}\n' for index in range(20)]
+    lines += ['2023-08-27 10:00:04,INFO,after\n']
+    start = end = calendar.timegm((2023, 8, 27, 10, 0, 3))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        src_path = os.path.join(tmp_dir, 'boundary.log')
+        with open(src_path, 'w', encoding='utf-8') as file:
+            file.writelines(lines)
+        gz_path = src_path + '.gz'
+        # 멤버를 아주 작게 잡아서 10:00:03 줄들이 여러 멤버에 나뉘게 한다
+        entries = write_blocked_gzip(src_path, gz_path, member_size=200)
+        rows = sum(1 for _ in query_gzip_range(gz_path, start, end, entries))
+    ok = rows == 20
+    print(f"{'OK' if ok else 'FAIL'}: {rows}/20 rows at 10:00:03 across {len(entries)} members")
+    return ok
+
+
+# 압축 로그 시간 범위 조회: gzip은 체크포인트 인덱스를 쓰고, bz2 / xz는 처음부터 스트리밍으로 훑는다
+def query_compressed_range(log_path, start_epoch, end_epoch):
+    if log_path.lower().endswith('.gz'):
+        yield from query_gzip_range(log_path, start_epoch, end_epoch)
+        return
+    for line in iter_log_lines(log_path):
+        record = parse_log_line(line)
+        if record is not None and start_epoch <= calendar.timegm(record.timestamp) <= end_epoch:
+            yield record
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Blocked gzip archive and checkpoint index for mission logs')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    compress_parser = subparsers.add_parser('compress', help='로그를 블록 단위 gzip으로 압축하고 인덱스 생성')
+    compress_parser.add_argument('src')
+    compress_parser.add_argument('dest')
+    compress_parser.add_argument('--member-size', type=int, default=DEFAULT_MEMBER_SIZE,
+                                 help='gzip 멤버 하나의 원본 크기 (바이트)')
+    index_parser = subparsers.add_parser('index', help='기존 gzip 파일의 체크포인트 인덱스 생성')
+    index_parser.add_argument('gz')
+    subparsers.add_parser('check', help='멤버 경계에 걸친 같은 시각 조회 회귀 검사')
+    args = parser.parse_args()
+
+    if args.command == 'check':
+        exit(0 if check_boundary_query() else 1)
+    if args.command == 'compress':
+        entries = write_blocked_gzip(args.src, args.dest, args.member_size)
+    else:
+        entries = build_gzip_index(args.gz)
+    print(f"{len(entries)} checkpoints written.")
@@ -0,0 +1,155 @@
+# 증분(tail) 분석 모드
+# 미션 로그는 뒤에 추가만 되므로, 마지막으로 처리한 바이트 위치와 파일 지문(inode, 크기, 앞부분 해시)을
+# 작은 상태 파일에 저장해 두고 다음 실행 때는 새로 추가된 부분만 파싱한다.
+# 새로 찾은 ERROR / CRITICAL / WARNING 로그는 findings 파일에 누적하고, 보고서는 누적된 findings로 다시 만든다.
+#
+# 로그 교체(rotation)나 잘림(truncation)도 감지한다.
+#   - inode가 바뀜  : 로테이션. '<로그>.1'이 이전 inode라면 남은 꼬리 부분을 먼저 읽고 새 파일은 처음부터 읽는다.
+#   - 크기가 줄어듦 : 잘림. 처음부터 다시 읽는다.
+#   - 앞부분 해시 다름: 같은 inode에 다른 내용이 덮어써짐. 처음부터 다시 읽는다.
+# 같은 파일을 처음부터 다시 읽을 때(상태 없음 / 잘림 / 덮어써짐)는 findings도 비우고 새로 모은다.
+# 로테이션은 이전 파일의 findings가 여전히 유효하므로 그대로 두고 이어서 모은다.
+#
+# 상태 파일에는 findings 파일의 확정된 길이도 저장한다. findings를 덧붙인 뒤 상태를 저장하기 전에
+# 중단되었다면 다음 실행에서 그 길이로 잘라 내므로, 같은 구간을 다시 읽어도 findings가 중복되지 않는다.
+
+import hashlib
+import os
+
+from external_sort import DEFAULT_MEMORY_BUDGET, external_sort
+from log_pipeline import is_problematic, iter_log_lines, parse_log_line, parse_log_lines, write_markdown_report_stream
+
+# 파일 지문에 쓰는 앞부분 바이트 수
+FINGERPRINT_BYTES = 1024
+
+
+# 상태 파일 기본 경로
+def state_path_for(report_path):
+    return report_path + '.state'
+
+
+# 누적 findings 파일 기본 경로
+def findings_path_for(report_path):
+    return report_path + '.findings'
+
+
+# 파일 앞부분 해시 (로그가 다른 내용으로 바뀌었는지 확인)
+def head_fingerprint(file_path, length):
+    with open(file_path, 'rb') as file:
+        return hashlib.sha1(file.read(min(length, FINGERPRINT_BYTES))).hexdigest()
+
+
+# 상태 저장 (key:value 형식)
+def save_state(state_path, state):
+    tmp_path = state_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        for key, value in state.items():
+            f.write(f"{key}:{value}\n")
+    os.replace(tmp_path, state_path)
+
+
+# 상태 불러오기 (없으면 빈 딕셔너리)
+def load_state(state_path):
+    if not os.path.exists(state_path):
+        return {}
+    state = {}
+    with open(state_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if ':' in line:
+                key, value = line.strip().split(':', 1)
+                state[key] = value
+    return state
+
+
+# 지난 실행 이후 로그 파일이 어떻게 바뀌었는지 판단
+# 반환값: ('append' | 'rotated' | 'truncated' | 'replaced' | 'new', 읽기 시작할 오프셋)
+def detect_change(log_path, state):
+    if not state:
+        return 'new', 0
+    stat = os.stat(log_path)
+    offset = int(state['offset'])
+    if stat.st_ino != int(state['inode']):
+        return 'rotated', 0
+    if stat.st_size < offset:
+        return 'truncated', 0
+    if offset and head_fingerprint(log_path, offset) != state['head']:
+        return 'replaced', 0
+    return 'append', offset
+
+
+# 로테이션된 이전 파일 찾기 ('<로그>.1'이 예전 inode와 같을 때만)
+def find_rotated_file(log_path, state):
+    rotated_path = log_path + '.1'
+    try:
+        if os.stat(rotated_path).st_ino == int(state['inode']):
+            return rotated_path
+    except FileNotFoundError:
+        pass
+    return None
+
+
+# offset부터 끝까지 완성된 줄만 읽어서 문제 로그를 findings 파일에 추가
+# 반환값: (마지막으로 처리한 바이트 위치, 새로 읽은 줄 수, 새로 찾은 문제 로그 수)
+def scan_appended(log_path, offset, findings_file, rules=None):
+    lines = 0
+    found = 0
+    with open(log_path, 'rb') as file:
+        file.seek(offset)
+        for raw in file:
+            # 아직 쓰이는 중인 마지막 줄은 다음 실행 때 처리
+            if not raw.endswith(b'\n'):
+                break
+            offset += len(raw)
+            lines += 1
+            record = parse_log_line(raw.decode('utf-8').rstrip('\r\n'))
+            if record is not None and is_problematic(record, rules):
+                findings_file.write(record.line + '\n')
+                found += 1
+    return offset, lines, found
+
+
+# 증분 분석 실행
+# 새로 추가된 부분만 읽어서 findings를 누적하고, 누적된 findings로 보고서를 다시 만든다.
+def run_incremental_analysis(log_path, report_path, state_path=None, findings_path=None,
+                             memory_budget=DEFAULT_MEMORY_BUDGET, rules=None, rows_per_page=None,
+                             templates=False, stats=False):
+    state_path = state_path or state_path_for(report_path)
+    findings_path = findings_path or findings_path_for(report_path)
+    state = load_state(state_path)
+    change, offset = detect_change(log_path, state)
+
+    # 확정된 findings 길이 (처음부터 다시 읽으면 0, 예전 상태 파일에 기록이 없으면 지금 길이)
+    findings_size = os.path.getsize(findings_path) if os.path.exists(findings_path) else 0
+    if change in ('new', 'truncated', 'replaced'):
+        findings_size = 0
+    elif 'findings' in state:
+        findings_size = min(findings_size, int(state['findings']))
+
+    total_lines = 0
+    total_found = 0
+    with open(findings_path, 'a', encoding='utf-8') as findings_file:
+        findings_file.truncate(findings_size)
+        if change == 'rotated':
+            rotated_path = find_rotated_file(log_path, state)
+            if rotated_path is not None:
+                _, lines, found = scan_appended(rotated_path, int(state['offset']), findings_file, rules)
+                total_lines += lines
+                total_found += found
+        offset, lines, found = scan_appended(log_path, offset, findings_file, rules)
+        total_lines += lines
+        total_found += found
+
+    stat = os.stat(log_path)
+    save_state(state_path, {
+        'offset': offset,
+        'inode': stat.st_ino,
+        'size': stat.st_size,
+        'head': head_fingerprint(log_path, offset),
+        'findings': os.path.getsize(findings_path),
+    })
+
+    findings = parse_log_lines(iter_log_lines(findings_path))
+    sorted_findings = external_sort(findings, memory_budget=memory_budget, reverse=True)
+    write_markdown_report_stream(sorted_findings, report_path, rules=rules, rows_per_page=rows_per_page,
+                                 templates=templates, stats=stats)
+    return change, total_lines, total_found
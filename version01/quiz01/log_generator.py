@@ -0,0 +1,118 @@
+# 결정적(deterministic) 합성 미션 로그 생성기
+# 'timestamp,event,message' 형식의 로그를 원하는 줄 수나 크기로 만든다.
+# 시드가 같으면 항상 같은 파일이 나오므로 벤치마크 결과를 서로 비교할 수 있다.
+# 타임스탬프는 시작 시각부터 1초씩 증가한다 (시간 순서대로 쌓인 로그).
+#
+# 사용 예:
+#   python log_generator.py synthetic.log --lines 1000000
+#   python log_generator.py synthetic.log --size-mb 500 --mix INFO=90,WARNING=6,ERROR=3,CRITICAL=1
+
+import argparse
+import calendar
+import random
+import time
+from datetime import datetime
+
+SYNTHETIC_MESSAGES = [
+    ('INFO', 'Telemetry packet received.'),
+    ('INFO', 'Navigation systems show nominal performance.'),
+    ('INFO', 'Life support systems nominal.'),
+    ('WARNING', 'Oxygen tank pressure fluctuating.'),
+    ('ERROR', 'Thruster 3 not responding.'),
+    ('CRITICAL', 'Oxygen tank explosion.'),
+]
+SYNTHETIC_WEIGHTS = [60, 20, 15, 3, 1.5, 0.5]
+
+DEFAULT_START = datetime(2023, 8, 27, 10, 0, 0)
+
+# 메시지 선택 순서를 미리 뽑아 두는 개수 (이후에는 반복해서 쓴다)
+PICK_POOL_SIZE = 100000
+
+# 한 번에 파일에 쓰는 줄 수
+WRITE_BATCH_LINES = 10000
+
+
+# 'INFO=90,WARNING=6' 형식의 심각도 비율 해석
+def parse_mix(text):
+    mix = {}
+    for item in text.split(','):
+        event, _, weight = item.partition('=')
+        if not event.strip() or not weight.strip():
+            raise ValueError(f"Invalid severity mix entry: '{item}'")
+        mix[event.strip()] = float(weight)
+    return mix
+
+
+# 메시지별 선택 가중치 (심각도 비율을 주면 같은 심각도의 메시지끼리 기본 가중치 비율로 나눈다)
+def message_weights(mix=None):
+    if mix is None:
+        return list(SYNTHETIC_WEIGHTS)
+    event_totals = {}
+    for (event, _), weight in zip(SYNTHETIC_MESSAGES, SYNTHETIC_WEIGHTS):
+        event_totals[event] = event_totals.get(event, 0) + weight
+    unknown = set(mix) - set(event_totals)
+    if unknown:
+        raise ValueError(f"Unknown events in severity mix: {', '.join(sorted(unknown))}")
+    return [mix.get(event, 0) * weight / event_totals[event]
+            for (event, _), weight in zip(SYNTHETIC_MESSAGES, SYNTHETIC_WEIGHTS)]
+
+
+# 합성 로그 파일 만들기
+# line_count와 size_bytes 중 먼저 도달하는 쪽에서 멈춘다 (둘 중 하나는 있어야 한다).
+# 반환값: 헤더를 뺀 줄 수
+def write_synthetic_log(path, line_count=None, seed=42, mix=None, size_bytes=None, start=DEFAULT_START):
+    if line_count is None and size_bytes is None:
+        raise ValueError("line_count or size_bytes is required.")
+    rng = random.Random(seed)
+    pool_size = PICK_POOL_SIZE if line_count is None else min(line_count, PICK_POOL_SIZE)
+    picks = rng.choices(range(len(SYNTHETIC_MESSAGES)), weights=message_weights(mix), k=max(pool_size, 1))
+    suffixes = [f",{event},{message}\n" for event, message in SYNTHETIC_MESSAGES]
+
+    base = calendar.timegm(start.timetuple())
+    dates = {}
+    written = 0
+    lines = 0
+    with open(path, 'w', encoding='utf-8') as file:
+        header = 'timestamp,event,message\n'
+        file.write(header)
+        written += len(header)
+        batch = []
+        while line_count is None or lines < line_count:
+            if size_bytes is not None and written >= size_bytes:
+                break
+            # 날짜 문자열은 하루에 한 번만 만든다
+            day, second = divmod(base + lines, 86400)
+            date = dates.get(day)
+            if date is None:
+                date = dates[day] = time.strftime('%Y-%m-%d', time.gmtime(day * 86400))
+            line = (f"{date} {second // 3600:02d}:{second // 60 % 60:02d}:{second % 60:02d}"
+                    f"{suffixes[picks[lines % len(picks)]]}")
+            batch.append(line)
+            written += len(line)
+            lines += 1
+            if len(batch) >= WRITE_BATCH_LINES:
+                file.write(''.join(batch))
+                batch = []
+        file.write(''.join(batch))
+    return lines
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Deterministic synthetic mission log generator')
+    parser.add_argument('path', help='만들 로그 파일 경로')
+    parser.add_argument('--lines', type=int, help='줄 수')
+    parser.add_argument('--size-mb', type=float, help='파일 크기 (MB), --lines와 함께 주면 먼저 도달하는 쪽에서 멈춤')
+    parser.add_argument('--mix', help='심각도 비율 (예: INFO=90,WARNING=6,ERROR=3,CRITICAL=1)')
+    parser.add_argument('--seed', type=int, default=42, help='난수 시드')
+    args = parser.parse_args()
+
+    if args.lines is None and args.size_mb is None:
+        parser.error('--lines or --size-mb is required')
+    try:
+        mix = parse_mix(args.mix) if args.mix else None
+        size_bytes = int(args.size_mb * 1024 * 1024) if args.size_mb is not None else None
+        count = write_synthetic_log(args.path, args.lines, seed=args.seed, mix=mix, size_bytes=size_bytes)
+    except ValueError as e:
+        print(f"Error: {e}")
+        exit(1)
+    print(f"Wrote {count:,} log lines to '{args.path}'.")
@@ -0,0 +1,293 @@
+# 한 번만 읽고 끝내는 컬럼형 로그 파서
+# 각 줄을 딱 한 번 파싱해서 줄 단위 튜플 대신 컬럼 배열에 값을 쌓는다.
+#   - epoch      : 초 단위 타임스탬프 (int64)
+#   - events     : 이벤트 코드 (int32, event_names로 이름 조회, 이벤트 이름 종류가 많아도 넘치지 않는다)
+#   - problems   : 규칙의 심각도 키워드(기본 ERROR / CRITICAL / WARNING) 포함 여부 (0/1)
+#   - line_offsets, line_lengths, message_offsets : 원본 파일에서의 바이트 위치
+#   - message_ids, strings : 컬럼 캐시(column_cache.py)에서 불러온 경우에만 채워지는 메시지 문자열 표
+# NumPy가 설치되어 있으면 파싱 자체를 mmap 위의 배열 연산으로 처리하고 정렬/필터도 벡터화한다.
+# 없으면 줄 단위 단일 패스 + 표준 라이브러리 array 모듈로 동작한다.
+
+import calendar
+import mmap
+import os
+import re
+import time
+from array import array
+from collections import namedtuple
+
+from log_pipeline import LOG_HEADER, LogRecord, parse_timestamp
+from rules import default_rules
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 없이도 동작
+    np = None
+
+# 기본 이벤트 코드 (처음 보는 이벤트는 뒤에 추가된다)
+DEFAULT_EVENT_NAMES = ('INFO', 'WARNING', 'ERROR', 'CRITICAL')
+
+HEADER_BYTES = LOG_HEADER.encode('ascii')
+
+LogColumns = namedtuple('LogColumns', [
+    'path', 'epoch', 'events', 'problems',
+    'line_offsets', 'line_lengths', 'message_offsets', 'event_names',
+    'message_ids', 'strings',
+], defaults=(None, None))
+
+
+# 규칙의 심각도 키워드를 바이트 정규식 하나로 컴파일
+def severity_pattern(rules):
+    keywords = [re.escape(keyword.encode('utf-8')) for keyword in rules.severity_keywords()]
+    flags = re.IGNORECASE if rules.ignore_case else 0
+    return re.compile(b'|'.join(keywords) if keywords else b'(?!)', flags)
+
+
+# 'YYYY-MM-DD' 날짜의 0시 epoch 값 (날짜별로 캐시)
+class DayEpochCache(dict):
+    def __missing__(self, date_bytes):
+        year, month, day = int(date_bytes[0:4]), int(date_bytes[5:7]), int(date_bytes[8:10])
+        value = calendar.timegm((year, month, day, 0, 0, 0))
+        self[date_bytes] = value
+        return value
+
+
+# 'HH:MM:SS' 시각의 하루 중 초 (시각별로 캐시, 최대 86400개)
+class SecondOfDayCache(dict):
+    def __missing__(self, time_bytes):
+        value = int(time_bytes[0:2]) * 3600 + int(time_bytes[3:5]) * 60 + int(time_bytes[6:8])
+        self[time_bytes] = value
+        return value
+
+
+# 타임스탬프 필드를 epoch 초로 변환
+# 'YYYY-MM-DD HH:MM:SS' 고정 폭이면 캐시 조회 두 번으로 끝내고, 아니면 기존 파서로 처리
+def timestamp_to_epoch(field, day_cache, time_cache):
+    if len(field) == 19 and field[10] == 0x20:
+        return day_cache[field[:10]] + time_cache[field[11:]]
+    return calendar.timegm(parse_timestamp(field.decode('utf-8')))
+
+
+# 'YYYY-MM-DD HH:MM:SS,' 고정 폭 타임스탬프의 숫자 위치
+TIMESTAMP_DIGITS = (0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18)
+TIMESTAMP_SEPARATORS = ((4, ord('-')), (7, ord('-')), (10, ord(' ')), (13, ord(':')), (16, ord(':')), (19, ord(',')))
+TIMESTAMP_WIDTH = 19
+
+# 벡터화 경로에서 이벤트 이름을 정확히 구분할 수 있는 최대 길이 (uint64 한 개에 담기는 길이)
+MAX_PACKED_EVENT_LENGTH = 8
+
+
+# 그레고리력 날짜 → 1970-01-01부터의 일 수 (배열 단위 계산)
+def days_from_civil(year, month, day):
+    year = year - (month <= 2)
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + np.where(month > 2, -3, 9)) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+# 문제 키워드가 나오는 모든 바이트 위치 (mmap.find는 C 수준 검색이라 정규식보다 빠르다)
+def find_keyword_positions(mm, keywords):
+    positions = []
+    for keyword in keywords:
+        position = mm.find(keyword)
+        while position >= 0:
+            positions.append(position)
+            position = mm.find(keyword, position + 1)
+    return np.sort(np.array(positions, dtype=np.int64))
+
+
+# NumPy 벡터화 파서: 파일을 mmap으로 열어 줄 경계, 타임스탬프, 이벤트, 문제 키워드를
+# 파이썬 반복문 없이 배열 연산으로 한 번에 구한다.
+# 고정 폭 타임스탬프가 아닌 줄이 섞여 있으면 None을 돌려주고 줄 단위 파서로 넘긴다.
+def parse_log_columns_vectorized(file_path, rules):
+    # mmap.find는 대소문자를 구분하므로 ignore_case 규칙은 줄 단위 파서로 처리
+    if rules.ignore_case:
+        return None
+    with open(file_path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            buf = np.frombuffer(mm, dtype=np.uint8)
+            try:
+                return parse_columns_from_buffer(file_path, mm, buf, rules)
+            finally:
+                # mmap을 닫기 전에 버퍼 참조를 먼저 놓아야 한다
+                del buf
+
+
+def parse_columns_from_buffer(file_path, mm, buf, rules):
+    newlines = np.flatnonzero(buf == 0x0A)
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.concatenate((newlines, [len(buf)]))
+    keep = ends > starts
+    starts, ends = starts[keep], ends[keep]
+    if len(starts) == 0:
+        return None
+    ends = ends - (buf[ends - 1] == 0x0D)
+
+    # 고정 폭 형식 검사 (헤더는 건너뛰고, 그 외 형식이 다른 줄이 있으면 포기)
+    fixed = ends - starts > TIMESTAMP_WIDTH
+    for position, value in TIMESTAMP_SEPARATORS:
+        fixed &= buf[np.minimum(starts + position, len(buf) - 1)] == value
+    for index in np.flatnonzero(~fixed):
+        if not bytes(buf[starts[index]:ends[index]]).startswith(HEADER_BYTES):
+            return None
+    starts, ends = starts[fixed], ends[fixed]
+
+    digits = buf[starts[:, None] + np.array(TIMESTAMP_DIGITS)].astype(np.int64) - 0x30
+    if ((digits < 0) | (digits > 9)).any():
+        return None
+    year = digits[:, 0] * 1000 + digits[:, 1] * 100 + digits[:, 2] * 10 + digits[:, 3]
+    month = digits[:, 4] * 10 + digits[:, 5]
+    day = digits[:, 6] * 10 + digits[:, 7]
+    seconds = (digits[:, 8] * 10 + digits[:, 9]) * 3600 \
+        + (digits[:, 10] * 10 + digits[:, 11]) * 60 + digits[:, 12] * 10 + digits[:, 13]
+    epoch = days_from_civil(year, month, day) * 86400 + seconds
+
+    # 두 번째 쉼표 위치 (이벤트와 메시지 경계), 필드가 3개 미만인 줄은 제외
+    commas = np.flatnonzero(buf == 0x2C)
+    second_index = np.searchsorted(commas, starts + TIMESTAMP_WIDTH + 1)
+    has_second = second_index < len(commas)
+    second = np.where(has_second, commas[np.minimum(second_index, len(commas) - 1)], ends)
+    valid = has_second & (second < ends)
+    starts, ends, epoch, second = starts[valid], ends[valid], epoch[valid], second[valid]
+
+    # 이벤트 이름을 uint64 하나로 묶어서 고유 값별로 코드 부여
+    event_start = starts + TIMESTAMP_WIDTH + 1
+    event_length = second - event_start
+    if (event_length > MAX_PACKED_EVENT_LENGTH).any():
+        return None
+    packed = np.zeros(len(starts), dtype=np.uint64)
+    for k in range(MAX_PACKED_EVENT_LENGTH):
+        byte = buf[np.minimum(event_start + k, len(buf) - 1)].astype(np.uint64)
+        packed |= np.where(k < event_length, byte, 0).astype(np.uint64) << np.uint64(8 * k)
+    unique_packed, first_seen, inverse = np.unique(packed, return_index=True, return_inverse=True)
+
+    event_names = list(DEFAULT_EVENT_NAMES)
+    code_of_unique = []
+    for index in first_seen:
+        name = bytes(buf[event_start[index]:second[index]]).decode('utf-8').strip()
+        if name not in event_names:
+            event_names.append(name)
+        code_of_unique.append(event_names.index(name))
+    events = np.array(code_of_unique, dtype=np.int32)[inverse.reshape(-1)]
+
+    # 문제 키워드는 파일 전체에서 정규식으로 찾고, 위치를 줄 번호로 바꾼다
+    problems = np.zeros(len(starts), dtype=bool)
+    positions = find_keyword_positions(mm, [keyword.encode('utf-8') for keyword in rules.severity_keywords()])
+    if len(positions):
+        line_index = np.searchsorted(starts, positions, side='right') - 1
+        inside = (line_index >= 0) & (positions < ends[np.maximum(line_index, 0)])
+        problems[line_index[inside]] = True
+
+    return LogColumns(file_path, epoch, events, problems,
+                      starts.astype(np.int64), (ends - starts).astype(np.int32),
+                      (second + 1).astype(np.int64), tuple(event_names))
+
+
+# 로그 파일 전체를 한 번 읽어서 컬럼 배열 만들기
+def parse_log_columns(file_path, rules=None):
+    rules = rules or default_rules()
+    if np is not None:
+        columns = parse_log_columns_vectorized(file_path, rules)
+        if columns is not None:
+            return columns
+
+    epoch = array('q')
+    events = array('i')
+    problems = array('b')
+    line_offsets = array('q')
+    line_lengths = array('i')
+    message_offsets = array('q')
+
+    event_names = list(DEFAULT_EVENT_NAMES)
+    event_codes = {name.encode('ascii'): code for code, name in enumerate(event_names)}
+    day_cache = DayEpochCache()
+    time_cache = SecondOfDayCache()
+    find_problem = severity_pattern(rules).search
+
+    offset = 0
+    with open(file_path, 'rb') as file:
+        for raw in file:
+            start = offset
+            offset += len(raw)
+            line = raw.rstrip(b'\r\n')
+            first = line.find(b',')
+            second = line.find(b',', first + 1)
+            if first < 0 or second < 0 or line.startswith(HEADER_BYTES):
+                continue
+            try:
+                timestamp = timestamp_to_epoch(line[:first].strip(), day_cache, time_cache)
+            except ValueError:
+                print(f"Error extracting timestamp from log line: {line.decode('utf-8', 'replace')}")
+                continue
+
+            event = line[first + 1:second].strip()
+            code = event_codes.get(event)
+            if code is None:
+                code = len(event_names)
+                event_names.append(event.decode('utf-8'))
+                event_codes[event] = code
+
+            epoch.append(timestamp)
+            events.append(code)
+            problems.append(find_problem(line) is not None)
+            line_offsets.append(start)
+            line_lengths.append(len(line))
+            message_offsets.append(start + second + 1)
+
+    if np is not None:
+        epoch = np.frombuffer(epoch, dtype=np.int64)
+        events = np.frombuffer(events, dtype=np.int32)
+        problems = np.frombuffer(problems, dtype=np.int8).astype(bool)
+        line_offsets = np.frombuffer(line_offsets, dtype=np.int64)
+        line_lengths = np.frombuffer(line_lengths, dtype=np.int32)
+        message_offsets = np.frombuffer(message_offsets, dtype=np.int64)
+
+    return LogColumns(file_path, epoch, events, problems,
+                      line_offsets, line_lengths, message_offsets, tuple(event_names))
+
+
+# epoch 컬럼을 NumPy datetime64로 보기 (NumPy 필요)
+def epoch_as_datetime64(columns):
+    if np is None:
+        raise RuntimeError("NumPy is required for datetime64 columns.")
+    return columns.epoch.astype('datetime64[s]')
+
+
+# 시간 역순 정렬 인덱스 (같은 시각은 원래 순서 유지)
+def reverse_chronological_order(columns):
+    if np is not None:
+        return np.argsort(-columns.epoch, kind='stable')
+    return sorted(range(len(columns.epoch)), key=columns.epoch.__getitem__, reverse=True)
+
+
+# 정렬 인덱스 중 문제 로그만 남기기
+def select_problematic(columns, order):
+    if np is not None:
+        return order[columns.problems[order]]
+    problems = columns.problems
+    return [index for index in order if problems[index]]
+
+
+# 인덱스 순서대로 원본 파일에서 줄을 꺼내 LogRecord로 만들기
+# 보고서에 실제로 쓰이는 줄만 디코딩한다.
+# 타임스탬프는 다른 경로의 LogRecord와 같은 (년, 월, 일, 시, 분, 초) 튜플로 되돌린다.
+def iter_records(columns, indices):
+    if len(columns.line_offsets) == 0:
+        return
+    with open(columns.path, 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for index in indices:
+            start = int(columns.line_offsets[index])
+            end = start + int(columns.line_lengths[index])
+            message_id = -1 if columns.message_ids is None else int(columns.message_ids[index])
+            if message_id >= 0:
+                message = columns.strings[message_id]
+            else:
+                message = mm[int(columns.message_offsets[index]):end].decode('utf-8').strip()
+            timestamp = time.gmtime(int(columns.epoch[index]))[:6]
+            yield LogRecord(timestamp, columns.event_names[columns.events[index]], message,
+                            mm[start:end].decode('utf-8'))
@@ -0,0 +1,222 @@
+# 미션 컴퓨터 로그 스트리밍 파이프라인
+# read → parse → filter → report sink 단계를 제너레이터로 연결해서
+# 로그 파일 크기와 상관없이 한 번에 한 줄만 메모리에 올린다.
+
+import bz2
+import gzip
+import lzma
+import os
+import tempfile
+from collections import namedtuple
+
+from report_writer import DEFAULT_BUFFER_SIZE, MarkdownReportWriter
+from rules import default_rules
+from sketches import LogStatistics, format_statistics
+from template_miner import TemplateMiner
+
+LOG_HEADER = 'timestamp,event,message'
+
+# 역방향 읽기 블록 크기 (바이트)
+READ_BLOCK_SIZE = 64 * 1024
+
+# 파싱된 로그 한 줄
+LogRecord = namedtuple('LogRecord', ['timestamp', 'event', 'message', 'line'])
+
+
+# 역방향 읽기 경로에서 로그가 시간 순서대로 쌓여 있지 않은 것을 발견했을 때
+class LogOrderError(ValueError):
+    pass
+
+# 압축 확장자별 표준 라이브러리 코덱 (디스크에 풀지 않고 스트리밍으로 읽는다)
+COMPRESSED_OPENERS = {
+    '.gz': gzip.open,
+    '.bz2': bz2.open,
+    '.xz': lzma.open,
+}
+
+
+# 압축된 로그인지 (확장자로 판단)
+def is_compressed(file_path):
+    return os.path.splitext(file_path)[1].lower() in COMPRESSED_OPENERS
+
+
+# 로그 파일 열기 (텍스트 모드, .gz / .bz2 / .xz는 압축을 풀면서 읽기)
+def open_log(file_path):
+    opener = COMPRESSED_OPENERS.get(os.path.splitext(file_path)[1].lower())
+    if opener is not None:
+        return opener(file_path, 'rt', encoding='utf-8')
+    return open(file_path, 'r', encoding='utf-8')
+
+
+# 1단계: 로그 파일을 한 줄씩 읽기 (개행 제거)
+def iter_log_lines(file_path):
+    with open_log(file_path) as file:
+        for line in file:
+            yield line.rstrip('\r\n')
+
+
+# 1단계 (역순): 파일 끝에서부터 블록 단위로 읽어서 마지막 줄부터 내보내기
+# 미션 로그는 시간 순서대로 추가(append-only)되므로 역순으로 읽으면 시간 역순이 된다.
+# 압축 파일은 뒤에서부터 읽을 수 없으므로 외부 정렬 경로를 써야 한다.
+def iter_log_lines_reversed(file_path, block_size=READ_BLOCK_SIZE):
+    with open(file_path, 'rb') as file:
+        file.seek(0, os.SEEK_END)
+        position = file.tell()
+        remainder = b''
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            file.seek(position)
+            block = file.read(read_size) + remainder
+            lines = block.split(b'\n')
+            # 첫 조각은 앞 블록과 이어질 수 있으므로 다음 반복으로 넘긴다
+            remainder = lines[0]
+            for raw in reversed(lines[1:]):
+                if raw:
+                    yield raw.decode('utf-8').rstrip('\r')
+        if remainder:
+            yield remainder.decode('utf-8').rstrip('\r')
+
+
+# 타임스탬프 문자열을 (년, 월, 일, 시, 분, 초) 튜플로 변환
+def parse_timestamp(timestamp_str):
+    date_str, time_str = timestamp_str.strip().split(' ')
+    year, month, day = map(int, date_str.split('-'))
+    hour, minute, second = map(int, time_str.split(':'))
+    return (year, month, day, hour, minute, second)
+
+
+# 로그 한 줄을 LogRecord로 변환 (헤더나 잘못된 줄은 None)
+def parse_log_line(line):
+    parts = line.split(',', 2)
+    if len(parts) < 3 or line.startswith(LOG_HEADER):
+        return None
+    try:
+        timestamp = parse_timestamp(parts[0])
+    except ValueError:
+        print(f"Error extracting timestamp from log line: {line}")
+        return None
+    return LogRecord(timestamp, parts[1].strip(), parts[2].strip(), line)
+
+
+# 2단계: 줄 스트림을 LogRecord 스트림으로 변환
+def parse_log_lines(lines):
+    for line in lines:
+        record = parse_log_line(line)
+        if record is not None:
+            yield record
+
+
+# 2단계 (역순): 파일 끝에서부터 읽은 레코드를 정렬 경로와 같은 시간 역순으로 맞추기
+# 같은 시각의 줄은 역방향 읽기에서 파일 반대 순서로 나오므로 모아 두었다가 다시 뒤집어
+# 안정 정렬(sorted(..., reverse=True))과 같은 파일 순서로 내보낸다.
+# 시각이 거꾸로 가는 줄을 만나면 (시간 순서대로 쌓인 로그가 아니면) LogOrderError를 던진다.
+def reverse_scan_order(records):
+    group = []
+    for record in records:
+        if group and record.timestamp != group[0].timestamp:
+            if record.timestamp > group[0].timestamp:
+                raise LogOrderError(f"Log is not in chronological order near: {record.line}")
+            yield from reversed(group)
+            group = []
+        group.append(record)
+    yield from reversed(group)
+
+
+# 문제 로그 여부 (규칙의 심각도 키워드, 기본값은 ERROR / CRITICAL / WARNING)
+def is_problematic(record, rules=None):
+    rules = rules or default_rules()
+    return rules.classify(record).severity is not None
+
+
+# 표 한 행 만들기
+def format_table_row(record):
+    timestamp = record.line.split(',', 1)[0]
+    return f"| {timestamp} | {record.event} | {record.message} |\n"
+
+
+# 사고 원인 분석 항목 만들기 (제목은 규칙의 사고 유형)
+def format_analysis_entry(record, category):
+    return (
+        f"- **{category}**: \n"
+        f"  - **Timestamp**: {record.line.split(',', 1)[0].strip()}\n"
+        f"  - **Event**: {record.event}\n"
+        f"  - **Message**: {record.message}\n\n"
+    )
+
+
+# 템플릿 요약 항목 만들기 (거의 같은 문제 로그 여러 줄을 한 항목으로)
+def format_template_entry(cluster):
+    return (
+        f"- **{cluster.category}**: \n"
+        f"  - **Template**: `{cluster.template}`\n"
+        f"  - **Event**: {cluster.event}\n"
+        f"  - **Count**: {cluster.count}\n"
+        f"  - **First Seen**: {cluster.first_seen}\n"
+        f"  - **Last Seen**: {cluster.last_seen}\n\n"
+    )
+
+
+# 4단계: 보고서 싱크
+# 정렬된 레코드 스트림을 한 번만 순회하면서 표 행은 버퍼를 거쳐 바로 파일에 쓰고,
+# 문제 로그는 임시 파일에 모아 두었다가 표가 끝난 뒤 분석 섹션으로 이어 쓴다.
+# 3단계(문제 로그 필터)도 여기서 한다: 각 줄을 규칙 엔진으로 한 번만 분류해서
+# 심각도가 있으면 분석 섹션으로 보내고, 그때 나온 사고 유형을 그대로 제목으로 쓴다.
+# problem_records를 따로 넘기면 (다시 순회할 수 있는 입력일 때) 임시 파일 없이 그 스트림을 쓴다.
+# rows_per_page를 주면 보고서를 여러 페이지 파일로 나눈다.
+# templates가 참이면 문제 로그를 템플릿 마이너에 흘려 보내고, 분석 섹션에는 줄 대신 템플릿을 쓴다.
+# stats가 참이면 표를 쓰는 동안 모든 줄을 스케치에 반영하고 분석 섹션 뒤에 요약 통계를 쓴다.
+def write_markdown_report_stream(records, filename, rules=None, problem_records=None,
+                                 rows_per_page=None, buffer_size=DEFAULT_BUFFER_SIZE, templates=False,
+                                 stats=False):
+    rules = rules or default_rules()
+    miner = TemplateMiner() if templates else None
+    statistics = LogStatistics() if stats else None
+    table_rows = 0
+    problem_rows = 0
+    with MarkdownReportWriter(filename, rows_per_page, buffer_size) as report, \
+            tempfile.TemporaryFile('w+', encoding='utf-8') as spool:
+        for record in records:
+            report.write_row(format_table_row(record))
+            table_rows += 1
+            if statistics is not None:
+                statistics.observe(record)
+            if problem_records is None:
+                classification = rules.classify(record)
+                if classification.severity is None:
+                    continue
+                if miner is not None:
+                    miner.add(record, classification.category)
+                    problem_rows += 1
+                else:
+                    spool.write(f"{classification.category}\t{record.line}\n")
+
+        report.begin_analysis()
+        if miner is not None:
+            for record in problem_records or ():
+                miner.add(record, rules.classify(record).category)
+                problem_rows += 1
+            for cluster in miner.sorted_clusters():
+                report.write_row(format_template_entry(cluster))
+        elif problem_records is None:
+            spool.seek(0)
+            for entry in spool:
+                category, line = entry.rstrip('\n').split('\t', 1)
+                report.write_row(format_analysis_entry(parse_log_line(line), category))
+                problem_rows += 1
+        else:
+            for record in problem_records:
+                report.write_row(format_analysis_entry(record, rules.classify(record).category))
+                problem_rows += 1
+        if statistics is not None:
+            report.write(format_statistics(statistics))
+    return table_rows, problem_rows
+
+
+# 스트리밍 분석 실행: 파일을 역순으로 읽어 시간 역순 보고서를 만든다
+# 로그가 시간 순서대로 쌓여 있지 않으면 LogOrderError (호출하는 쪽에서 외부 정렬 경로로 다시 처리)
+def run_streaming_analysis(file_path, report_path, rules=None, rows_per_page=None, templates=False,
+                           stats=False):
+    records = reverse_scan_order(parse_log_lines(iter_log_lines_reversed(file_path)))
+    return write_markdown_report_stream(records, report_path, rules=rules, rows_per_page=rows_per_page,
+                                        templates=templates, stats=stats)
@@ -1,8 +1,29 @@
-# 1. 'Hello Mars' 출력
-print("Hello Mars")
+import argparse
+import calendar
+from datetime import datetime
+
+from incremental import run_incremental_analysis
+from parallel import is_multi_file_spec, resolve_log_paths, run_parallel_analysis
+from report_writer import REPORT_ANALYSIS_HEADER, REPORT_CONCLUSION, REPORT_INTRO, report_paths
+from rules import default_rules, load_rules
+from external_sort import DEFAULT_MEMORY_BUDGET, external_sort
+from mmap_scanner import run_mmap_analysis
+from column_cache import load_or_parse_columns
+from log_parser import iter_records, parse_log_columns, reverse_chronological_order, select_problematic
+from time_index import DEFAULT_BUCKET_SECONDS, parse_query_time, query_range, update_index
+from gzip_index import query_compressed_range
+from log_pipeline import (
+    LogOrderError,
+    is_compressed,
+    iter_log_lines,
+    parse_log_lines,
+    run_streaming_analysis,
+    write_markdown_report_stream,
+)
 
 # 2. 로그 파일 열기 (예외 처리 포함)
 log_file_path = '/Users/kogun/Desktop/Codyssey/quiz01/mission_computer_main.log'
+report_file_path = '/Users/kogun/Desktop/Codyssey/quiz01/log_analysis.md'
 
 # 로그 파일을 열고 예외를 처리
 def read_log_file(file_path):
@@ -16,13 +37,6 @@ def read_log_file(file_path):
         print(f"Error: An error occurred while reading the file '{file_path}'.")
         exit(1)
 
-log_data = read_log_file(log_file_path)
-
-# 3. 로그 파일 출력
-print("=== Log Data ===")
-for line in log_data:
-    print(line.strip())
-
 # 4. 로그 데이터에서 시간 역순으로 정렬하기 위한 타임스탬프 추출 함수
 def extract_timestamp(log_line):
     try:
@@ -39,74 +53,286 @@ def extract_timestamp(log_line):
         print(f"Error extracting timestamp from log line: {log_line}")
         return None
 
-# 5. 헤더 제외 및 로그 데이터 시간 역순으로 정렬
-log_data = [line for line in log_data if "timestamp,event,message" not in line]  # 헤더 제외
-sorted_log_data = sorted(
-    [(extract_timestamp(line), line) for line in log_data if extract_timestamp(line) is not None],
-    key=lambda x: x[0], reverse=True
-)
-
-# 6. 문제되는 로그만 필터링 (ERROR, CRITICAL, WARNING)
-def filter_problematic_logs(sorted_log_data):
-    return [line for _, line in sorted_log_data if "ERROR" in line or "CRITICAL" in line or "WARNING" in line]
-
-problematic_lines = filter_problematic_logs(sorted_log_data)
+# 6. 문제되는 로그만 필터링 (규칙의 심각도 키워드, 기본: ERROR, CRITICAL, WARNING)
+def filter_problematic_logs(sorted_log_data, rules=None):
+    rules = rules or default_rules()
+    return [line for _, line in sorted_log_data if rules.classify_line(line).severity is not None]
 
 # 7. Markdown 형태로 보고서 작성
-def generate_markdown_report(problematic_lines):
-    md_content = "# Log Analysis Report\n\n"
-    md_content += "## 1. Log Overview\n"
-    md_content += "This is a log analysis report for the `mission_computer_main.log` file. The following logs have been reviewed and analyzed to identify potential issues and causes of the accident.\n\n"
-    md_content += "The logs are sorted in reverse chronological order:\n\n"
+# 문자열을 += 로 이어 붙이면 매번 전체를 복사하므로 조각을 리스트에 모았다가 한 번에 합친다
+def generate_markdown_report(sorted_log_data, problematic_lines, rules=None):
+    rules = rules or default_rules()
+    md_parts = [REPORT_INTRO]
 
     # 로그 데이터를 표 형식으로 작성
-    md_content += "| Timestamp           | Event  | Message                                                             |\n"
-    md_content += "|---------------------|--------|---------------------------------------------------------------------|\n"
-    
     for line in sorted_log_data:
         timestamp, log_line = line
         parts = log_line.split(',')
-        md_content += f"| {parts[0]} | {parts[1]} | {parts[2]} |\n"
+        md_parts.append(f"| {parts[0]} | {parts[1]} | {parts[2]} |\n")
+
+    md_parts.append(REPORT_ANALYSIS_HEADER)
 
-    md_content += "\n## 2. Accident Cause Analysis\n"
-    md_content += "The following log entries contain errors, warnings, or critical messages that could indicate the cause of the accident:\n\n"
-    
     # 문제 로그 분석 및 사고 원인 작성
     for log in problematic_lines:
         parts = log.split(',')
         timestamp = parts[0].strip()
         event = parts[1].strip()
         message = parts[2].strip()
-        
-        if "Oxygen tank" in message:
-            md_content += f"- **Oxygen Tank Issues**: \n"
-            md_content += f"  - **Timestamp**: {timestamp}\n"
-            md_content += f"  - **Event**: {event}\n"
-            md_content += f"  - **Message**: {message}\n\n"
-        else:
-            md_content += f"- **Mission Success**: \n"
-            md_content += f"  - **Timestamp**: {timestamp}\n"
-            md_content += f"  - **Event**: {event}\n"
-            md_content += f"  - **Message**: {message}\n\n"
 
-    md_content += "\n## 3. Conclusion\n"
-    md_content += "Based on the log entries above, it appears that the accident was caused by the following issues:\n\n"
-    md_content += "- **Oxygen Tank Instability**: The oxygen tank was unstable and eventually exploded, leading to the failure of mission-critical systems.\n"
-    md_content += "- **Further Investigation**: A detailed investigation into the oxygen tank and related systems should be conducted to prevent similar accidents in the future.\n\n"
-    md_content += "We recommend reviewing the safety mechanisms for the oxygen tank and ensuring that proper safeguards are in place for future missions."
+        # 사고 유형 (규칙의 사고 유형 키워드, 기본: 'Oxygen tank' → Oxygen Tank Issues)
+        category = rules.classify_line(log, len(parts[0]) + len(parts[1]) + 2).category
+        md_parts.append(f"- **{category}**: \n")
+        md_parts.append(f"  - **Timestamp**: {timestamp}\n")
+        md_parts.append(f"  - **Event**: {event}\n")
+        md_parts.append(f"  - **Message**: {message}\n\n")
 
-    return md_content
+    md_parts.append(REPORT_CONCLUSION)
+
+    return ''.join(md_parts)
 
 # 8. Markdown 보고서 파일로 저장
-def save_markdown_report(md_content, filename='/Users/kogun/Desktop/Codyssey/quiz01/log_analysis.md'):
+def save_markdown_report(md_content, filename=report_file_path):
     with open(filename, 'w', encoding='utf-8') as file:
         file.write(md_content)
 
-# 생성된 마크다운 보고서 저장
-report = generate_markdown_report(problematic_lines)
-save_markdown_report(report)
+# 기존 방식: 파일 전체를 메모리에 올려서 분석
+def run_in_memory_analysis(file_path, report_path, rules=None):
+    log_data = read_log_file(file_path)
+
+    # 3. 로그 파일 출력
+    print("=== Log Data ===")
+    for line in log_data:
+        print(line.strip())
+
+    # 5. 헤더 제외 및 로그 데이터 시간 역순으로 정렬
+    log_data = [line for line in log_data if "timestamp,event,message" not in line]  # 헤더 제외
+    sorted_log_data = sorted(
+        [(extract_timestamp(line), line) for line in log_data if extract_timestamp(line) is not None],
+        key=lambda x: x[0], reverse=True
+    )
+
+    problematic_lines = filter_problematic_logs(sorted_log_data, rules)
+
+    # 생성된 마크다운 보고서 저장
+    report = generate_markdown_report(sorted_log_data, problematic_lines, rules)
+    save_markdown_report(report, report_path)
+
+    # 9. 결과 출력
+    print("Logs sorted in reverse order:")
+    for _, line in sorted_log_data:
+        print(line.strip())
+
+# 외부 정렬 방식: 로그가 시간 순서대로 쌓여 있지 않아도 메모리 예산 안에서 시간 역순 보고서 작성
+def run_external_sort_analysis(file_path, report_path, memory_budget, rules=None, rows_per_page=None,
+                               templates=False, stats=False):
+    records = parse_log_lines(iter_log_lines(file_path))
+    sorted_records = external_sort(records, memory_budget=memory_budget, reverse=True)
+    return write_markdown_report_stream(sorted_records, report_path, rules=rules, rows_per_page=rows_per_page,
+                                        templates=templates, stats=stats)
+
+# 컬럼형 방식: 각 줄을 한 번만 파싱해서 배열로 정렬/필터한 뒤 필요한 줄만 디코딩
+# use_cache가 참이면 로그 옆 컬럼 캐시를 쓰고, 원본이 바뀌지 않았으면 텍스트 파싱을 건너뛴다
+def run_columnar_analysis(file_path, report_path, rules=None, rows_per_page=None, templates=False,
+                          stats=False, use_cache=True):
+    if use_cache:
+        columns, cached = load_or_parse_columns(file_path, rules=rules)
+        if cached:
+            print("Loaded parsed columns from cache.")
+    else:
+        columns = parse_log_columns(file_path, rules=rules)
+    order = reverse_chronological_order(columns)
+    problem_order = select_problematic(columns, order)
+    return write_markdown_report_stream(iter_records(columns, order), report_path, rules=rules,
+                                        problem_records=iter_records(columns, problem_order),
+                                        rows_per_page=rows_per_page, templates=templates, stats=stats)
+
+# 스트리밍 방식: 한 줄씩 읽고 바로 보고서에 기록 (메모리 사용량이 파일 크기와 무관)
+def run_streaming(file_path, report_path, external=False, columnar=False,
+                  memory_budget=DEFAULT_MEMORY_BUDGET, rules=None, rows_per_page=None, use_mmap=False,
+                  templates=False, stats=False, use_cache=True):
+    if is_compressed(file_path) and not external:
+        # 압축 파일은 mmap이나 역방향 읽기를 할 수 없으므로 외부 정렬 경로로 처리
+        print("Compressed log: using the external-sort path.")
+        external, columnar, use_mmap = True, False, False
+    try:
+        if columnar:
+            table_rows, problem_rows = run_columnar_analysis(file_path, report_path, rules, rows_per_page,
+                                                             templates, stats, use_cache)
+        elif external:
+            table_rows, problem_rows = run_external_sort_analysis(file_path, report_path, memory_budget,
+                                                                  rules, rows_per_page, templates, stats)
+        else:
+            try:
+                if use_mmap:
+                    table_rows, problem_rows = run_mmap_analysis(file_path, report_path, rules, rows_per_page,
+                                                                 templates, stats)
+                else:
+                    table_rows, problem_rows = run_streaming_analysis(file_path, report_path, rules,
+                                                                      rows_per_page, templates, stats)
+            except LogOrderError:
+                # 역순 읽기는 시간 순서대로 쌓인 로그를 가정하므로, 어긋나 있으면 외부 정렬로 다시 만든다
+                print("Log is not in chronological order: using the external-sort path.")
+                table_rows, problem_rows = run_external_sort_analysis(file_path, report_path, memory_budget,
+                                                                      rules, rows_per_page, templates, stats)
+    except FileNotFoundError:
+        print(f"Error: The file '{file_path}' was not found.")
+        exit(1)
+    except IOError:
+        print(f"Error: An error occurred while reading the file '{file_path}'.")
+        exit(1)
+    print(f"Streamed {table_rows} log lines ({problem_rows} problematic) into "
+          f"{report_location(report_path, rows_per_page)}.")
+
+# 시간 범위 조회: 사이드카 인덱스로 해당 구간만 읽어서 출력하고 보고서 작성
+def run_range_query(file_path, report_path, from_text, to_text, bucket_seconds, rules=None,
+                    rows_per_page=None, templates=False, stats=False):
+    try:
+        start = parse_query_time(from_text)
+        end = parse_query_time(to_text, base_date=start.date()) if to_text else datetime.max.replace(microsecond=0)
+    except ValueError as e:
+        print(f"Error: {e}")
+        exit(1)
+    try:
+        if is_compressed(file_path):
+            records = list(query_compressed_range(file_path, calendar.timegm(start.timetuple()),
+                                                  calendar.timegm(end.timetuple())))
+        else:
+            index = update_index(file_path, bucket_seconds=bucket_seconds)
+            records = list(query_range(file_path, start, end, index=index))
+    except FileNotFoundError:
+        print(f"Error: The file '{file_path}' was not found.")
+        exit(1)
+
+    print(f"=== Logs from {start} to {end} ===")
+    for record in records:
+        print(record.line)
+
+    records.sort(key=lambda record: record.timestamp, reverse=True)
+    table_rows, problem_rows = write_markdown_report_stream(records, report_path, rules=rules,
+                                                            rows_per_page=rows_per_page, templates=templates,
+                                                            stats=stats)
+    print(f"{table_rows} log lines ({problem_rows} problematic) written to "
+          f"{report_location(report_path, rows_per_page)}.")
+
+# 증분 분석: 지난 실행 이후 추가된 부분만 읽어서 findings를 누적하고 보고서 갱신
+def run_incremental(file_path, report_path, state_path, memory_budget, rules=None, rows_per_page=None,
+                    templates=False, stats=False):
+    if is_compressed(file_path):
+        print("Error: Incremental mode needs an uncompressed, append-only log.")
+        exit(1)
+    try:
+        change, lines, found = run_incremental_analysis(file_path, report_path, state_path=state_path,
+                                                        memory_budget=memory_budget, rules=rules,
+                                                        rows_per_page=rows_per_page, templates=templates,
+                                                        stats=stats)
+    except FileNotFoundError:
+        print(f"Error: The file '{file_path}' was not found.")
+        exit(1)
+    if change in ('rotated', 'truncated', 'replaced'):
+        print(f"Log file was {change}; reading it again from the beginning.")
+    print(f"Read {lines} new log lines, {found} new problematic entries merged into "
+          f"{report_location(report_path, rows_per_page)}.")
+
+# 병렬 분석: 디렉터리/글롭으로 받은 여러 로그 파일을 프로세스 풀에서 나눠 처리한 뒤 병합
+def run_parallel(log_spec, report_path, workers, memory_budget, rules=None, rows_per_page=None,
+                 templates=False, stats=False):
+    log_paths = resolve_log_paths(log_spec)
+    if not log_paths:
+        print(f"Error: No log files matched '{log_spec}'.")
+        exit(1)
+    print(f"Analyzing {len(log_paths)} log files with {workers or 'all'} workers...")
+    try:
+        table_rows, problem_rows = run_parallel_analysis(log_paths, report_path, workers=workers,
+                                                         memory_budget=memory_budget, rules=rules,
+                                                         rows_per_page=rows_per_page, templates=templates,
+                                                         stats=stats)
+    except (RuntimeError, OSError) as e:
+        print(f"Error: {e}")
+        exit(1)
+    print(f"Merged {table_rows} log lines ({problem_rows} problematic) into "
+          f"{report_location(report_path, rows_per_page)}.")
+
+# 요약 출력용 보고서 위치 (페이지로 나눴으면 실제로 쓴 페이지 파일들)
+def report_location(report_path, rows_per_page=None):
+    paths = report_paths(report_path, rows_per_page)
+    if len(paths) == 1:
+        return f"'{paths[0]}'"
+    return f"{len(paths)} pages ({', '.join(repr(path) for path in paths)})"
+
+# argparse 타입: 1 이상의 정수
+def positive_int(text):
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{text}'")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value}")
+    return value
+
+# 명령행 인자 정의
+def parse_args():
+    parser = argparse.ArgumentParser(description='Mission computer log analyzer')
+    parser.add_argument('--log', default=log_file_path,
+                        help='분석할 로그 파일 경로 (디렉터리나 글롭 패턴이면 여러 파일을 병렬 분석)')
+    parser.add_argument('--jobs', type=int, help='병렬 분석 작업자 수 (기본: CPU 코어 수)')
+    parser.add_argument('--report', default=report_file_path, help='Markdown 보고서 저장 경로')
+    parser.add_argument('--rows-per-page', type=positive_int,
+                        help='보고서 한 페이지당 최대 행 수 (지정하면 log_analysis_0001.md 형식으로 나눠 저장)')
+    parser.add_argument('--rules', help='심각도 키워드/사고 유형 규칙 파일 (기본: log_rules.json)')
+    parser.add_argument('--stream', action='store_true',
+                        help='파일 전체를 메모리에 올리지 않고 스트리밍 파이프라인으로 분석')
+    parser.add_argument('--external-sort', action='store_true',
+                        help='임시 파일 run + k-way 병합으로 시간 역순 정렬 (메모리보다 큰 로그용)')
+    parser.add_argument('--sort-memory-mb', type=int, default=DEFAULT_MEMORY_BUDGET // (1024 * 1024),
+                        help='외부 정렬에 사용할 메모리 예산 (MB)')
+    parser.add_argument('--from', dest='from_time',
+                        help='시간 범위 조회 시작 (예: 2023-08-27T10:00), 사이드카 인덱스 사용')
+    parser.add_argument('--to', dest='to_time', help='시간 범위 조회 끝 (예: 10:30, 날짜 생략 시 --from 날짜)')
+    parser.add_argument('--index-bucket', type=int, default=DEFAULT_BUCKET_SECONDS,
+                        help='시간 인덱스 버킷 크기 (초)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='지난 실행 이후 추가된 부분만 분석해서 문제 로그를 보고서에 누적')
+    parser.add_argument('--state', help='증분 분석 상태 파일 경로 (기본: <보고서>.state)')
+    parser.add_argument('--columnar', action='store_true',
+                        help='한 번만 파싱하는 컬럼형 파서로 정렬/필터 (NumPy가 있으면 사용)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='--columnar에서 로그 옆 컬럼 캐시(<로그>.colcache)를 읽거나 쓰지 않음')
+    parser.add_argument('--mmap', action='store_true',
+                        help='mmap으로 파일을 매핑해 bytes 수준에서 스캔 (시간 순서대로 쌓인 로그 가정)')
+    parser.add_argument('--templates', action='store_true',
+                        help='사고 원인 분석 섹션에 줄 대신 Drain 방식 로그 템플릿(개수, 처음/마지막 시각)을 작성')
+    parser.add_argument('--stats', action='store_true',
+                        help='분당 이벤트 수, 가장 잦은 메시지, 컴포넌트 수를 고정 메모리 스케치로 집계해 보고서에 추가')
+    return parser.parse_args()
+
+if __name__ == '__main__':
+    args = parse_args()
+
+    # 1. 'Hello Mars' 출력
+    print("Hello Mars")
+
+    try:
+        rules = load_rules(args.rules) if args.rules else default_rules()
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error: Could not load rules file '{args.rules}': {e}")
+        exit(1)
+    memory_budget = args.sort_memory_mb * 1024 * 1024
 
-# 9. 결과 출력
-print("Logs sorted in reverse order:")
-for _, line in sorted_log_data:
-    print(line.strip())
+    if is_multi_file_spec(args.log):
+        run_parallel(args.log, args.report, args.jobs, memory_budget, rules, args.rows_per_page, args.templates,
+                     args.stats)
+    elif args.incremental:
+        run_incremental(args.log, args.report, args.state, memory_budget, rules, args.rows_per_page,
+                        args.templates, args.stats)
+    elif args.from_time:
+        run_range_query(args.log, args.report, args.from_time, args.to_time, args.index_bucket, rules,
+                        args.rows_per_page, args.templates, args.stats)
+    elif (args.stream or args.external_sort or args.columnar or args.mmap or args.templates or args.stats
+          or args.rows_per_page):
+        # --templates / --stats / --rows-per-page만 주면 스트리밍 경로로 처리 (기존 보고서 형식은 그대로 둔다)
+        run_streaming(args.log, args.report, external=args.external_sort, columnar=args.columnar,
+                      memory_budget=memory_budget, rules=rules, rows_per_page=args.rows_per_page,
+                      use_mmap=args.mmap, templates=args.templates, stats=args.stats,
+                      use_cache=not args.no_cache)
+    else:
+        run_in_memory_analysis(args.log, args.report, rules)
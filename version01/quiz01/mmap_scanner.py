@@ -0,0 +1,130 @@
+# mmap 기반 무복사(zero-copy) 로그 스캐너
+# 압축되지 않은 큰 로그를 readlines() + strip()으로 줄마다 str로 만드는 대신,
+# 파일을 mmap으로 매핑해서 bytes 수준에서 줄 경계(rfind / find)와 심각도 키워드(mmap.find)를 찾고,
+# 보고서에 실제로 들어가는 줄만 memoryview 슬라이스에서 str로 디코딩한다.
+# 문제 로그가 드문 보통의 로그에서는 키워드 검색이 C 수준에서 끝나므로
+# 사고 원인 분석 섹션을 만드는 비용이 전체 줄 수가 아니라 결과 줄 수에 비례한다.
+#
+# 로그가 시간 순서대로 쌓인다고 가정하고 파일 끝에서부터 훑어 시간 역순으로 내보낸다 (--stream과 같은 가정).
+# 같은 시각의 줄은 파일 순서로 맞추고, 순서가 어긋난 줄을 만나면 LogOrderError를 던진다.
+
+import heapq
+import mmap
+import os
+
+from log_pipeline import parse_log_line, reverse_scan_order, write_markdown_report_stream
+from rules import default_rules
+
+
+# 파일을 읽기 전용 mmap으로 열기 (빈 파일은 None)
+def open_mmap(file_path):
+    with open(file_path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+# 위치가 들어 있는 줄의 (시작, 끝) 바이트 범위 (끝은 개행 위치)
+def line_bounds(mm, position):
+    start = mm.rfind(b'\n', 0, position) + 1
+    end = mm.find(b'\n', position)
+    if end < 0:
+        end = len(mm)
+    return start, end
+
+
+# 모든 줄의 (시작, 끝) 범위를 파일 끝에서부터 내보내기 (빈 줄 제외)
+def iter_line_bounds_reversed(mm):
+    end = len(mm)
+    while end > 0:
+        start = mm.rfind(b'\n', 0, end) + 1
+        if start < end:
+            yield start, end
+        end = start - 1
+
+
+# 한 키워드가 나오는 위치를 파일 끝에서부터 내보내기
+def iter_keyword_positions_reversed(mm, keyword):
+    position = mm.rfind(keyword)
+    while position >= 0:
+        yield position
+        position = mm.rfind(keyword, 0, position)
+
+
+# 심각도 키워드가 들어 있는 줄의 (시작, 끝) 범위를 파일 끝에서부터 내보내기
+# 여러 키워드가 같은 줄에 있어도 그 줄은 한 번만 나온다.
+def iter_matching_line_bounds_reversed(mm, keywords):
+    positions = heapq.merge(*(iter_keyword_positions_reversed(mm, keyword) for keyword in keywords),
+                            reverse=True)
+    last_start = len(mm) + 1
+    for position in positions:
+        if position >= last_start:
+            continue
+        start, end = line_bounds(mm, position)
+        last_start = start
+        yield start, end
+
+
+# 범위의 줄을 디코딩해서 LogRecord로 변환 (로그 줄이 아니면 None)
+def decode_record(view, start, end):
+    return parse_log_line(str(view[start:end], 'utf-8').rstrip('\r'))
+
+
+# 모든 로그 줄을 시간 역순 LogRecord로 내보내기
+def iter_records_reversed(mm, view):
+    for start, end in iter_line_bounds_reversed(mm):
+        record = decode_record(view, start, end)
+        if record is not None:
+            yield record
+
+
+# 문제 로그만 시간 역순 LogRecord로 내보내기
+# mmap.find는 대소문자를 구분하므로 ignore_case 규칙은 모든 줄을 디코딩해서 규칙으로 확인한다.
+def iter_problematic_records_reversed(mm, view, rules):
+    if rules.ignore_case:
+        for record in iter_records_reversed(mm, view):
+            if rules.classify(record).severity is not None:
+                yield record
+        return
+    keywords = [keyword.encode('utf-8') for keyword in rules.severity_keywords()]
+    for start, end in iter_matching_line_bounds_reversed(mm, keywords):
+        record = decode_record(view, start, end)
+        if record is not None:
+            yield record
+
+
+# 문제 로그 스캔 (파일 경로를 받아 mmap을 열고 닫는다)
+def scan_problematic_records(file_path, rules=None):
+    rules = rules or default_rules()
+    mm = open_mmap(file_path)
+    if mm is None:
+        return
+    view = memoryview(mm)
+    try:
+        yield from reverse_scan_order(iter_problematic_records_reversed(mm, view, rules))
+    finally:
+        view.release()
+        mm.close()
+
+
+# mmap 분석 실행: 표는 파일 끝에서부터 줄 경계만 따라가며 쓰고,
+# 사고 원인 분석 섹션은 키워드 검색으로 찾은 줄만 디코딩해서 쓴다 (줄마다 규칙 정규식을 돌리지 않는다).
+def run_mmap_analysis(file_path, report_path, rules=None, rows_per_page=None, templates=False,
+                      stats=False):
+    rules = rules or default_rules()
+    mm = open_mmap(file_path)
+    if mm is None:
+        return write_markdown_report_stream(iter(()), report_path, rules=rules, problem_records=iter(()),
+                                            rows_per_page=rows_per_page, templates=templates,
+                                            stats=stats)
+    view = memoryview(mm)
+    try:
+        return write_markdown_report_stream(reverse_scan_order(iter_records_reversed(mm, view)), report_path,
+                                            rules=rules,
+                                            problem_records=reverse_scan_order(
+                                                iter_problematic_records_reversed(mm, view, rules)),
+                                            rows_per_page=rows_per_page, templates=templates,
+                                            stats=stats)
+    finally:
+        view.release()
+        mm.close()
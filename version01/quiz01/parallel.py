@@ -0,0 +1,116 @@
+# 로테이션된 여러 로그 파일 병렬 분석
+# mission_computer_main.log, mission_computer_main.log.1, .2 ... 처럼 나뉜 로그를
+# 파일마다 ProcessPoolExecutor 작업자에서 파싱 → 시간 역순 정렬 → 분류(문제 로그 필터)까지 끝내고
+# 정렬된 run 파일 두 개(전체 줄 / 문제 줄)로 내보낸다.
+# run 파일의 각 줄 앞에는 정렬 키가 붙어 있으므로 부모 프로세스는 타임스탬프를 다시 파싱하거나
+# 모든 줄을 다시 분류하지 않고 heapq.merge로 병합해서 보고서에 쓰기만 한다.
+#
+# run 파일 한 줄: 정렬 키(YYYYMMDDhhmmss) \t 원본 줄
+# (정렬 키에는 탭이 없으므로 첫 탭에서만 나누면 메시지에 탭이 있어도 원본 줄이 그대로 남는다)
+
+import glob
+import heapq
+import os
+import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+
+from external_sort import DEFAULT_MEMORY_BUDGET, external_sort
+from log_pipeline import LogRecord, iter_log_lines, parse_log_lines, write_markdown_report_stream
+from rules import default_rules
+
+# 디렉터리 / 글롭으로 받았을 때 분석할 파일 이름 (*.log, *.log.N, 압축된 경우 .gz / .bz2 / .xz)
+LOG_FILE_PATTERN = re.compile(r'.*\.log(\.\d+)?(\.gz|\.bz2|\.xz)?$')
+
+
+# 디렉터리 / 글롭 패턴 / 단일 파일을 로그 파일 목록으로 변환
+# 글롭 결과도 같은 이름 패턴으로 거르므로 'mission_computer_main.log*'가
+# 로그 옆의 사이드카 파일(.idx, .colcache, .gzidx, .state, .findings ...)을 집어 오지 않는다.
+def resolve_log_paths(spec):
+    if os.path.isdir(spec):
+        paths = [os.path.join(spec, name) for name in os.listdir(spec)]
+    elif glob.has_magic(spec):
+        paths = glob.glob(spec)
+    else:
+        return [spec]
+    return sorted(path for path in paths
+                  if LOG_FILE_PATTERN.match(os.path.basename(path)) and os.path.isfile(path))
+
+
+# 여러 파일을 분석해야 하는 입력인지 (디렉터리나 글롭 패턴)
+def is_multi_file_spec(spec):
+    return os.path.isdir(spec) or glob.has_magic(spec)
+
+
+# 타임스탬프 튜플 ↔ run 파일 정렬 키 (고정 폭이라 문자열 비교가 시간 비교와 같다)
+def run_key(timestamp):
+    return '%04d%02d%02d%02d%02d%02d' % timestamp
+
+
+def key_timestamp(key):
+    return (int(key[0:4]), int(key[4:6]), int(key[6:8]), int(key[8:10]), int(key[10:12]), int(key[12:14]))
+
+
+def format_run_line(record):
+    return f"{run_key(record.timestamp)}\t{record.line}\n"
+
+
+# 작업자: 파일 하나를 파싱하고 시간 역순으로 정렬한 뒤 전체 run과 문제 run을 tmp_dir에 저장
+# 반환값: (전체 run 경로, 문제 run 경로)
+def sort_log_file(file_path, tmp_dir, memory_budget, rules=None):
+    rules = rules or default_rules()
+    fd, sorted_path = tempfile.mkstemp(prefix='sorted_', suffix='.run', dir=tmp_dir)
+    problem_fd, problem_path = tempfile.mkstemp(prefix='problems_', suffix='.run', dir=tmp_dir)
+    records = parse_log_lines(iter_log_lines(file_path))
+    with os.fdopen(fd, 'w', encoding='utf-8') as out, os.fdopen(problem_fd, 'w', encoding='utf-8') as problems:
+        for record in external_sort(records, memory_budget=memory_budget, reverse=True, tmp_dir=tmp_dir):
+            entry = format_run_line(record)
+            out.write(entry)
+            if rules.classify(record).severity is not None:
+                problems.write(entry)
+    return sorted_path, problem_path
+
+
+# run 파일 → (정렬 키, LogRecord) 스트림
+# 타임스탬프는 다른 경로와 같은 튜플로 되돌리고, 이벤트 / 메시지는 parse_log_line처럼 원본 줄에서 나눈다.
+def iter_run_file(path):
+    with open(path, 'r', encoding='utf-8') as file:
+        for entry in file:
+            key, line = entry.rstrip('\n').split('\t', 1)
+            _, event, message = line.split(',', 2)
+            yield key, LogRecord(key_timestamp(key), event.strip(), message.strip(), line)
+
+
+# 정렬된 run 파일들을 정렬 키 문자열 비교만으로 하나의 시간 역순 스트림으로 병합
+def merge_sorted_files(sorted_paths):
+    merged = heapq.merge(*(iter_run_file(path) for path in sorted_paths), key=itemgetter(0), reverse=True)
+    return (record for _, record in merged)
+
+
+# 병렬 분석 실행
+# 작업자마다 메모리 예산을 나눠 쓰므로 전체 메모리 사용량은 memory_budget 근처에서 유지된다.
+# 작업자에서 난 예외는 어느 파일에서 났는지 붙여서 RuntimeError로 다시 던진다.
+def run_parallel_analysis(log_paths, report_path, workers=None, memory_budget=DEFAULT_MEMORY_BUDGET,
+                          rules=None, rows_per_page=None, templates=False, stats=False):
+    rules = rules or default_rules()
+    workers = workers or os.cpu_count() or 1
+    workers = max(1, min(workers, len(log_paths)))
+    worker_budget = max(1, memory_budget // workers)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        runs = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [(path, executor.submit(sort_log_file, path, tmp_dir, worker_budget, rules))
+                       for path in log_paths]
+            for path, future in futures:
+                try:
+                    runs.append(future.result())
+                except Exception as e:
+                    for _, pending in futures:
+                        pending.cancel()
+                    raise RuntimeError(f"Could not analyze '{path}': {type(e).__name__}: {e}") from e
+        return write_markdown_report_stream(merge_sorted_files([run for run, _ in runs]), report_path, rules=rules,
+                                            problem_records=merge_sorted_files([problems for _, problems in runs]),
+                                            rows_per_page=rows_per_page, templates=templates,
+                                            stats=stats)
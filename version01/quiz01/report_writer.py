@@ -0,0 +1,142 @@
+# 청크 단위로 스트리밍하는 Markdown 보고서 작성기
+# 문자열을 += 로 이어 붙이지 않고, 행을 작은 리스트 버퍼에 모았다가 일정 크기마다 한 번에 파일에 쓴다.
+# rows_per_page를 주면 보고서를 log_analysis_0001.md, log_analysis_0002.md ... 처럼 여러 페이지로 나눈다.
+# 쓰기 전에 같은 보고서의 예전 페이지 파일을 지우므로, 더 작은 보고서로 다시 실행해도 이전 페이지가 남지 않는다.
+
+import os
+import re
+
+# 파일에 한 번에 쓰는 버퍼 크기 (문자 수)
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+REPORT_INTRO = (
+    "# Log Analysis Report\n\n"
+    "## 1. Log Overview\n"
+    "This is a log analysis report for the `mission_computer_main.log` file. The following logs have been reviewed and analyzed to identify potential issues and causes of the accident.\n\n"
+    "The logs are sorted in reverse chronological order:\n\n"
+    "| Timestamp           | Event  | Message                                                             |\n"
+    "|---------------------|--------|---------------------------------------------------------------------|\n"
+)
+
+REPORT_ANALYSIS_HEADER = (
+    "\n## 2. Accident Cause Analysis\n"
+    "The following log entries contain errors, warnings, or critical messages that could indicate the cause of the accident:\n\n"
+)
+
+REPORT_CONCLUSION = (
+    "\n## 3. Conclusion\n"
+    "Based on the log entries above, it appears that the accident was caused by the following issues:\n\n"
+    "- **Oxygen Tank Instability**: The oxygen tank was unstable and eventually exploded, leading to the failure of mission-critical systems.\n"
+    "- **Further Investigation**: A detailed investigation into the oxygen tank and related systems should be conducted to prevent similar accidents in the future.\n\n"
+    "We recommend reviewing the safety mechanisms for the oxygen tank and ensuring that proper safeguards are in place for future missions."
+)
+
+TABLE_HEADER = REPORT_INTRO[REPORT_INTRO.index('| Timestamp'):]
+
+TABLE = 'table'
+ANALYSIS = 'analysis'
+
+
+# 페이지 파일 이름: log_analysis.md → log_analysis_0001.md
+def page_path(filename, page_number):
+    root, ext = os.path.splitext(filename)
+    return f"{root}_{page_number:04d}{ext}"
+
+
+# 보고서에 딸린 페이지 파일 목록 (log_analysis.md → log_analysis_0001.md, ... 번호 순)
+def existing_page_paths(filename):
+    root, ext = os.path.splitext(filename)
+    directory, base = os.path.split(root)
+    pattern = re.compile(re.escape(base) + r'_(\d{4,})' + re.escape(ext) + '$')
+    pages = []
+    for name in os.listdir(directory or '.'):
+        match = pattern.match(name)
+        if match:
+            pages.append((int(match.group(1)), os.path.join(directory, name)))
+    return [path for _, path in sorted(pages)]
+
+
+# 보고서가 실제로 쓰인 파일 목록 (페이지로 나눴으면 페이지 파일들, 아니면 보고서 파일 하나)
+def report_paths(filename, rows_per_page=None):
+    return existing_page_paths(filename) if rows_per_page else [filename]
+
+
+class MarkdownReportWriter:
+    def __init__(self, filename, rows_per_page=None, buffer_size=DEFAULT_BUFFER_SIZE):
+        self.filename = filename
+        self.rows_per_page = rows_per_page
+        self.buffer_size = buffer_size
+        self.page_paths = []
+        self.file = None
+        self.buffer = []
+        self.buffered = 0
+        self.page_rows = 0
+        self.section = None
+
+    def __enter__(self):
+        for path in existing_page_paths(self.filename):
+            os.remove(path)
+        self.open_page()
+        self.write(REPORT_INTRO)
+        self.section = TABLE
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.write(REPORT_CONCLUSION)
+        self.close_page()
+        return False
+
+    # 새 페이지 파일 열기
+    def open_page(self):
+        if self.rows_per_page:
+            path = page_path(self.filename, len(self.page_paths) + 1)
+        else:
+            path = self.filename
+        self.page_paths.append(path)
+        self.file = open(path, 'w', encoding='utf-8')
+        self.page_rows = 0
+
+    # 현재 페이지를 비우고 닫기
+    def close_page(self):
+        self.flush()
+        self.file.close()
+        self.file = None
+
+    # 다음 페이지로 넘기기 (이어지는 섹션의 머리말을 다시 쓴다)
+    def next_page(self):
+        self.write(f"\n_Continued in `{os.path.basename(page_path(self.filename, len(self.page_paths) + 1))}`._\n")
+        self.close_page()
+        self.open_page()
+        self.write(f"# Log Analysis Report (page {len(self.page_paths)})\n\n")
+        if self.section == TABLE:
+            self.write(TABLE_HEADER)
+        else:
+            self.write(REPORT_ANALYSIS_HEADER.lstrip('\n'))
+
+    def write(self, text):
+        self.buffer.append(text)
+        self.buffered += len(text)
+        if self.buffered >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            self.file.write(''.join(self.buffer))
+            self.buffer = []
+            self.buffered = 0
+
+    # 한 행(표 행 또는 분석 항목) 쓰기, 페이지당 행 수를 넘으면 새 페이지로
+    def write_row(self, text):
+        if self.rows_per_page and self.page_rows >= self.rows_per_page:
+            self.next_page()
+        self.write(text)
+        self.page_rows += 1
+
+    # 표가 끝나고 사고 원인 분석 섹션 시작 (페이지가 꽉 찼으면 새 페이지에서 시작)
+    def begin_analysis(self):
+        self.section = ANALYSIS
+        if self.rows_per_page and self.page_rows >= self.rows_per_page:
+            self.next_page()
+        else:
+            self.write(REPORT_ANALYSIS_HEADER)
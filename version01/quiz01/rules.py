@@ -0,0 +1,238 @@
+# 심각도 / 사고 유형 분류 규칙 엔진
+# 설정 파일(log_rules.json)에서 심각도 키워드와 사고 유형 키워드를 읽어서
+# 모든 키워드를 트라이(trie) 기반 정규식 하나로 컴파일한다.
+# 각 줄은 정규식 한 번의 스캔으로 분류되므로 키워드나 규칙 그룹이 수백 개로 늘어나도
+# 키워드(그룹)마다 문자열을 다시 훑는 비용이 생기지 않는다.
+#
+# 설정 파일 형식:
+# {
+#   "severities": [{"level": "CRITICAL", "keywords": ["CRITICAL"]}, ...],   # 위에 있을수록 높은 심각도
+#   "categories": [{"name": "Oxygen Tank Issues", "keywords": ["Oxygen tank"]}, ...],
+#   "default_category": "Mission Success",
+#   "ignore_case": false
+# }
+# 심각도 키워드는 줄 전체에서, 사고 유형 키워드는 메시지 부분에서만 찾는다.
+#
+# 분류 규칙 (모든 백엔드가 같은 결과를 내도록 단순 부분 문자열 검색과 같게 정의한다):
+#   - 줄 어딘가에 심각도 키워드가 하나라도 부분 문자열로 들어 있으면 문제 로그다
+#     (컬럼형 파서 / mmap 스캐너의 mm.find 검색과 같다). 키워드끼리 겹쳐 있어도 모두 센다.
+#   - 심각도는 들어 있는 키워드 중 가장 위에 있는 수준, 사고 유형도 가장 위에 있는 유형이다.
+#   - 키워드끼리 겹치거나 한 키워드가 다른 키워드의 접두사여도 (심각도 / 사고 유형 어느 쪽이든) 서로 가리지 않는다.
+#   - 같은 키워드를 여러 수준(유형)이나 양쪽 목록에 함께 쓰면 뜻이 모호하므로 불러올 때 ValueError.
+
+import argparse
+import json
+import os
+import random
+import re
+import time
+from collections import namedtuple
+from functools import lru_cache
+
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'log_rules.json')
+
+# 설정 파일이 없을 때 쓰는 기본 규칙 (기존 분석과 같은 동작)
+DEFAULT_RULES_CONFIG = {
+    'severities': [
+        {'level': 'CRITICAL', 'keywords': ['CRITICAL']},
+        {'level': 'ERROR', 'keywords': ['ERROR']},
+        {'level': 'WARNING', 'keywords': ['WARNING']},
+    ],
+    'categories': [
+        {'name': 'Oxygen Tank Issues', 'keywords': ['Oxygen tank']},
+    ],
+    'default_category': 'Mission Success',
+    'ignore_case': False,
+}
+
+# 분류 결과: severity는 문제 로그가 아니면 None
+Classification = namedtuple('Classification', ['severity', 'category'])
+
+
+# 키워드 목록을 트라이로 만든 뒤 정규식 문자열로 변환 (키워드가 없으면 아무것도 매칭하지 않는 패턴)
+# 공통 접두사를 한 번만 비교하고, 더 긴 키워드를 먼저 시도하므로 가장 긴 키워드가 매칭된다.
+def trie_to_pattern(keywords):
+    if not keywords:
+        return r'(?!)'
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node):
+        is_end = '' in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if is_end:
+            return '(?:' + body + ')?'
+        return body
+
+    return build(trie)
+
+
+class RuleSet:
+    def __init__(self, config):
+        self.ignore_case = bool(config.get('ignore_case', False))
+        self.default_category = config.get('default_category', DEFAULT_RULES_CONFIG['default_category'])
+        self.severity_levels = [entry['level'] for entry in config.get('severities', [])]
+        self.category_names = [entry['name'] for entry in config.get('categories', [])]
+
+        # 수준(유형)별 키워드 목록, 설정 파일 순서 그대로
+        seen = {}
+        self.severity_groups = self.keyword_groups(config.get('severities', []), 'severity', 'level', seen)
+        self.category_groups = self.keyword_groups(config.get('categories', []), 'category', 'name', seen)
+
+        # 키워드 → (심각도 순위, 사고 유형 순위): 그 키워드와 그 키워드의 접두사인 키워드들 중 가장 높은 순위
+        # 한 위치에서 매칭되는 키워드는 모두 그 위치의 가장 긴 매칭의 접두사이므로,
+        # 위치마다 가장 긴 키워드 하나만 찾아도 그 위치에서 나온 모든 키워드의 순위를 알 수 있다.
+        own = {}
+        for kind_index, groups in enumerate((self.severity_groups, self.category_groups)):
+            for rank, group in enumerate(groups):
+                for keyword in group:
+                    ranks = own.setdefault(self.normalize(keyword), [None, None])
+                    ranks[kind_index] = rank
+        self.keyword_ranks = {}
+        for keyword in own:
+            best = [None, None]
+            for end in range(1, len(keyword) + 1):
+                for kind_index, rank in enumerate(own.get(keyword[:end], (None, None))):
+                    if rank is not None and (best[kind_index] is None or rank < best[kind_index]):
+                        best[kind_index] = rank
+            self.keyword_ranks[keyword] = tuple(best)
+
+        # 전방 탐색(lookahead) 안에서 캡처하므로 finditer 한 번으로 겹치는 위치의 키워드까지 모두 찾는다
+        flags = re.IGNORECASE if self.ignore_case else 0
+        self.pattern = re.compile('(?=(' + trie_to_pattern(list(self.keyword_ranks)) + '))', flags)
+
+    def normalize(self, keyword):
+        return keyword.lower() if self.ignore_case else keyword
+
+    # 설정 항목들의 키워드 목록
+    # seen: 정규화한 키워드 → 처음 쓰인 (종류, 이름). 다른 수준/유형에 이미 쓰인 키워드면 ValueError
+    def keyword_groups(self, entries, kind, name_key, seen):
+        groups = []
+        for entry in entries:
+            owner = (kind, entry[name_key])
+            group = []
+            for keyword in entry['keywords']:
+                first = seen.setdefault(self.normalize(keyword), owner)
+                if first != owner:
+                    raise ValueError(f"Keyword '{keyword}' is listed under both {first[0]} '{first[1]}' "
+                                     f"and {kind} '{entry[name_key]}'.")
+                if keyword not in group:
+                    group.append(keyword)
+            groups.append(group)
+        return groups
+
+    # 심각도 키워드 목록 (컬럼형 파서의 바이트 검색용)
+    def severity_keywords(self):
+        return [keyword for group in self.severity_groups for keyword in group]
+
+    # 로그 한 줄 분류 (정규식 한 번 스캔, 규칙 수와 상관없이 비용이 같다)
+    # message_start: 줄 안에서 메시지가 시작되는 위치 (사고 유형은 그 뒤에서만 찾는다)
+    def classify_line(self, line, message_start=0):
+        severity_rank = None
+        category_rank = None
+        for match in self.pattern.finditer(line):
+            severity, category = self.keyword_ranks[self.normalize(match.group(1))]
+            if severity is not None and (severity_rank is None or severity < severity_rank):
+                severity_rank = severity
+            if category is not None and match.start() >= message_start and (
+                    category_rank is None or category < category_rank):
+                category_rank = category
+        severity = None if severity_rank is None else self.severity_levels[severity_rank]
+        category = self.default_category if category_rank is None else self.category_names[category_rank]
+        return Classification(severity, category)
+
+    # LogRecord 분류
+    def classify(self, record):
+        timestamp, event, _ = record.line.split(',', 2)
+        return self.classify_line(record.line, len(timestamp) + len(event) + 2)
+
+
+# 설정 파일에서 규칙 불러오기
+def load_rules(path=DEFAULT_RULES_PATH):
+    with open(path, 'r', encoding='utf-8') as f:
+        return RuleSet(json.load(f))
+
+
+# 기본 규칙 (log_rules.json이 있으면 그 파일, 없으면 내장 기본값), 한 번만 읽는다
+@lru_cache(maxsize=None)
+def default_rules():
+    if os.path.exists(DEFAULT_RULES_PATH):
+        return load_rules(DEFAULT_RULES_PATH)
+    return RuleSet(DEFAULT_RULES_CONFIG)
+
+
+# 회귀 검사: 겹치는 규칙 그룹에서도 분류가 단순 부분 문자열 검색(그룹 순서대로 확인)과 같은지,
+# 그리고 규칙 그룹 수가 늘어도 문제 줄 하나를 분류하는 비용이 거의 같은지 확인한다.
+def reference_classify(config, line, message_start=0):
+    ignore_case = config.get('ignore_case', False)
+    fold = (lambda text: text.lower()) if ignore_case else (lambda text: text)
+    severity = next((entry['level'] for entry in config.get('severities', [])
+                     if any(fold(keyword) in fold(line) for keyword in entry['keywords'])), None)
+    category = next((entry['name'] for entry in config.get('categories', [])
+                     if any(fold(keyword) in fold(line[message_start:]) for keyword in entry['keywords'])),
+                    config.get('default_category', DEFAULT_RULES_CONFIG['default_category']))
+    return Classification(severity, category)
+
+
+def check_overlapping_rules():
+    overlapping = {
+        'severities': [{'level': 'CRITICAL', 'keywords': ['CRITICAL', 'FATAL ERR']},
+                       {'level': 'ERROR', 'keywords': ['ERROR', 'ERR']},
+                       {'level': 'WARNING', 'keywords': ['WARN']}],
+        'categories': [{'name': 'Error Codes', 'keywords': ['ERROR code', 'ERR#']},
+                       {'name': 'Oxygen Tank Issues', 'keywords': ['Oxygen tank', 'tank']},
+                       {'name': 'Tanks', 'keywords': ['tanker']}],
+        'default_category': 'Mission Success',
+    }
+    lines = [
+        ('2023-08-27 10:00:00,INFO,ERROR code 5 in Oxygen tank', 25),     # 카테고리 키워드 안의 심각도 키워드
+        ('2023-08-27 10:00:00,INFO,FATAL ERROR', 25),                    # 'FATAL ERR'와 'ERROR'가 겹침
+        ('2023-08-27 10:00:00,INFO,tanker WARNING', 25),                 # 'tank'가 'tanker'의 접두사
+        ('2023-08-27 10:00:00,ERROR,ERR# only in event?', 26),
+        ('2023-08-27 10:00:00,INFO,WARNERRORtank', 25),
+        ('2023-08-27 10:00:00,INFO,nominal', 25),
+    ]
+    rng = random.Random(7)
+    pieces = ['ERR', 'OR', 'ERROR', ' code', 'CRIT', 'ICAL', 'FATAL ', 'WARN', 'tank', 'er', 'Oxygen ', '#', 'x']
+    lines += [('2023-08-27 10:00:00,INFO,' + ''.join(rng.choice(pieces) for _ in range(8)), 25)
+              for _ in range(2000)]
+
+    failures = 0
+    for config in (overlapping, dict(overlapping, ignore_case=True)):
+        rules = RuleSet(config)
+        for line, message_start in lines + [(line.lower(), start) for line, start in lines]:
+            if rules.classify_line(line, message_start) != reference_classify(config, line, message_start):
+                failures += 1
+
+    timings = []
+    for groups in (3, 300, 1000):
+        config = {'severities': [{'level': f'L{index}', 'keywords': [f'SEV{index:04d}']} for index in range(groups)],
+                  'categories': [{'name': f'C{index}', 'keywords': [f'CAT{index:04d}']} for index in range(groups)]}
+        rules = RuleSet(config)
+        line = f'2023-08-27 10:00:00,INFO,SEV{groups - 1:04d} CAT{groups - 1:04d} tail'
+        started = time.perf_counter()
+        for _ in range(2000):
+            rules.classify_line(line, 25)
+        timings.append(f"{groups} groups {(time.perf_counter() - started) / 2000 * 1e6:.1f}us")
+
+    ok = failures == 0
+    print(f"{'OK' if ok else 'FAIL'}: {failures} mismatches on {len(lines) * 4} overlapping-rule lines; "
+          + ', '.join(timings))
+    return ok
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Severity / category classification rules')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('check', help='겹치는 규칙 그룹 분류 회귀 검사')
+    args = parser.parse_args()
+
+    if args.command == 'check':
+        exit(0 if check_overlapping_rules() else 1)
@@ -0,0 +1,195 @@
+# 메모리 사용량이 입력 크기와 무관한 요약 통계 (스케치)
+# 너무 커서 메모리에 올릴 수 없는 로그에서도 다음 통계를 한 번의 스트리밍으로 구한다.
+#   - 분당 이벤트 수      : Count-Min Sketch (분 + 이벤트 키의 근사 빈도, 과대 추정만 한다)
+#                           어떤 분을 보고할지는 Space-Saving으로 후보를 고르고 Count-Min 추정값으로 순위를 매긴다
+#   - 가장 시끄러운 메시지 : Space-Saving top-k
+#   - 서로 다른 컴포넌트 수: HyperLogLog
+# 모든 구조가 처음에 정한 크기만 쓰므로 줄이 몇 개든 메모리는 일정하다.
+#
+# 컴포넌트: 로그에 컴포넌트 필드가 따로 없으므로 메시지의 주어 부분으로 본다.
+#   'Avionics check: All systems functional.' → 'avionics check'  (콜론 앞)
+#   'Oxygen tank unstable.'                   → 'oxygen'          (첫 단어)
+
+import hashlib
+import math
+from array import array
+from functools import lru_cache
+
+DEFAULT_CMS_WIDTH = 1 << 15
+DEFAULT_CMS_DEPTH = 4
+DEFAULT_TOP_K = 32
+DEFAULT_HLL_PRECISION = 12
+
+# HyperLogLog에 이미 넣은 컴포넌트를 기억해 두는 개수 (같은 키를 다시 해시하지 않는다)
+SEEN_CACHE_SIZE = 1024
+
+# 보고서에 쓰는 항목 수
+REPORT_TOP_MINUTES = 10
+REPORT_TOP_MESSAGES = 10
+
+
+# 64비트 해시 (실행마다 같은 값이 나와야 하므로 내장 hash() 대신 blake2b)
+def hash64(key):
+    return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+class CountMinSketch:
+    def __init__(self, width=DEFAULT_CMS_WIDTH, depth=DEFAULT_CMS_DEPTH):
+        self.width = width
+        self.depth = depth
+        self.rows = [array('q', bytes(8 * width)) for _ in range(depth)]
+
+    # 해시 하나를 두 조각으로 나눠 행마다 다른 위치를 만든다 (Kirsch-Mitzenmacher)
+    def positions(self, key):
+        value = hash64(key)
+        h1 = value & 0xFFFFFFFF
+        h2 = (value >> 32) | 1
+        return [(h1 + i * h2) % self.width for i in range(self.depth)]
+
+    # 보수적 갱신: 최솟값보다 작은 칸만 끌어올려 과대 추정을 줄인다
+    def add(self, key, count=1):
+        positions = self.positions(key)
+        target = min(row[position] for row, position in zip(self.rows, positions)) + count
+        for row, position in zip(self.rows, positions):
+            if row[position] < target:
+                row[position] = target
+
+    # 행마다의 값 중 최솟값 (실제 값 이상)
+    def estimate(self, key):
+        return min(row[position] for row, position in zip(self.rows, self.positions(key)))
+
+
+class SpaceSaving:
+    def __init__(self, capacity=DEFAULT_TOP_K):
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+
+    # 자리가 없으면 가장 작은 항목을 내보내고 그 개수를 이어받는다 (오차는 그 개수 이하)
+    def add(self, key, count=1):
+        if key in self.counts:
+            self.counts[key] += count
+            return
+        if len(self.counts) < self.capacity:
+            self.counts[key] = count
+            self.errors[key] = 0
+            return
+        victim = min(self.counts, key=self.counts.get)
+        floor = self.counts.pop(victim)
+        del self.errors[victim]
+        self.counts[key] = floor + count
+        self.errors[key] = floor
+
+    # (키, 추정 개수, 최대 오차)를 많은 순서대로
+    def top(self, n):
+        ranked = sorted(self.counts.items(), key=lambda item: (-item[1], item[0]))
+        return [(key, count, self.errors[key]) for key, count in ranked[:n]]
+
+
+class HyperLogLog:
+    def __init__(self, precision=DEFAULT_HLL_PRECISION):
+        self.precision = precision
+        self.size = 1 << precision
+        self.registers = bytearray(self.size)
+
+    def add(self, key):
+        value = hash64(key)
+        index = value & (self.size - 1)
+        rest = value >> self.precision
+        rank = (64 - self.precision) - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def estimate(self):
+        alpha = 0.7213 / (1 + 1.079 / self.size)
+        raw = alpha * self.size * self.size / sum(2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        # 작은 범위는 선형 카운팅으로 보정
+        if raw <= 2.5 * self.size and zeros:
+            return round(self.size * math.log(self.size / zeros))
+        return round(raw)
+
+
+# 메시지에서 컴포넌트 이름 뽑기 (같은 메시지가 반복되므로 크기를 제한해 캐시)
+@lru_cache(maxsize=4096)
+def component_of(message):
+    head = message.split(':', 1)[0] if ':' in message else message.split(' ', 1)[0]
+    return head.strip().strip('.,!').lower()
+
+
+class LogStatistics:
+    def __init__(self, width=DEFAULT_CMS_WIDTH, depth=DEFAULT_CMS_DEPTH, top_k=DEFAULT_TOP_K,
+                 precision=DEFAULT_HLL_PRECISION):
+        self.total = 0
+        self.events = {}
+        self.minute_events = CountMinSketch(width, depth)
+        self.busy_minutes = SpaceSaving(top_k)
+        self.noisy_messages = SpaceSaving(top_k)
+        self.components = HyperLogLog(precision)
+        self.seen_components = set()
+        # 로그는 대부분 분 단위로 몰려 있으므로 같은 분의 개수는 모았다가 분이 바뀔 때 스케치에 넣는다
+        self.minute = None
+        self.minute_counts = {}
+
+    # 레코드 하나 반영
+    def observe(self, record):
+        minute = record.line[:16]
+        if minute != self.minute:
+            self.flush()
+            self.minute = minute
+        self.total += 1
+        # 이벤트 종류는 몇 가지뿐이지만 설정에 따라 늘 수 있으므로 개수를 제한한다
+        if record.event in self.events or len(self.events) < DEFAULT_TOP_K:
+            self.events[record.event] = self.events.get(record.event, 0) + 1
+        self.minute_counts[record.event] = self.minute_counts.get(record.event, 0) + 1
+        self.noisy_messages.add(record.message)
+        component = component_of(record.message)
+        if component not in self.seen_components:
+            if len(self.seen_components) >= SEEN_CACHE_SIZE:
+                self.seen_components.clear()
+            self.seen_components.add(component)
+            self.components.add(component)
+
+    # 모아 둔 현재 분의 개수를 스케치에 반영
+    def flush(self):
+        if self.minute is None:
+            return
+        for event, count in self.minute_counts.items():
+            self.minute_events.add(f"{self.minute}|{event}", count)
+        total = sum(self.minute_counts.values())
+        self.minute_events.add(self.minute, total)
+        self.busy_minutes.add(self.minute, total)
+        self.minute = None
+        self.minute_counts = {}
+
+
+# Space-Saving 추정값 표시 (오차가 있으면 범위를 함께 쓴다)
+def format_estimate(count, error):
+    return f"{count}" if error == 0 else f"~{count} (±{error})"
+
+
+# 통계 섹션 Markdown 만들기
+def format_statistics(stats):
+    stats.flush()
+    events = sorted(stats.events)
+    parts = [
+        "\n### Log Statistics\n",
+        "Approximate aggregates computed in fixed memory "
+        "(Count-Min Sketch, Space-Saving top-k, HyperLogLog).\n\n",
+        f"- **Total Lines**: {stats.total}\n",
+        f"- **Distinct Components (estimate)**: {stats.components.estimate()}\n\n",
+        "#### Busiest Minutes\n\n",
+        "| Minute | Lines | " + " | ".join(events) + " |\n",
+        "|--------|-------|" + "|".join("-" * (len(event) + 2) for event in events) + "|\n",
+    ]
+    candidates = [minute for minute, _, _ in stats.busy_minutes.top(stats.busy_minutes.capacity)]
+    candidates.sort(key=lambda minute: (stats.minute_events.estimate(minute), minute), reverse=True)
+    for minute in candidates[:REPORT_TOP_MINUTES]:
+        counts = [str(stats.minute_events.estimate(f"{minute}|{event}")) for event in events]
+        parts.append(f"| {minute} | {stats.minute_events.estimate(minute)} | " + " | ".join(counts) + " |\n")
+    parts.append("\n#### Noisiest Messages\n\n")
+    parts.append("| Count | Message |\n")
+    parts.append("|-------|---------|\n")
+    for message, count, error in stats.noisy_messages.top(REPORT_TOP_MESSAGES):
+        parts.append(f"| {format_estimate(count, error)} | {message} |\n")
+    return ''.join(parts)
@@ -0,0 +1,106 @@
+# Drain 방식의 온라인 로그 템플릿 마이너
+# 사고가 나면 거의 같은 메시지가 수천 줄씩 쌓여서 원인이 묻히므로,
+# 문제 로그를 한 번만 훑으면서 비슷한 메시지를 템플릿 하나로 묶고 개수와 처음/마지막 시각을 센다.
+#
+# 고정 깊이 파싱 트리:
+#   루트 → 토큰 개수 → 앞쪽 토큰 (depth - 2 개) → 잎(클러스터 목록)
+# 잎 안에서는 템플릿과 같은 위치의 토큰이 얼마나 같은지(유사도)로 가장 비슷한 클러스터를 고르고,
+# 유사도가 기준 이상이면 그 클러스터에 합치면서 다른 위치를 '<*>'로 바꾼다.
+# 이벤트(ERROR 등)를 첫 토큰으로 넣어서 심각도가 다른 메시지는 서로 섞이지 않는다.
+# 트리 깊이가 고정이므로 줄 하나를 처리하는 비용은 지금까지 본 줄 수와 상관없다.
+
+WILDCARD = '<*>'
+
+DEFAULT_DEPTH = 4
+DEFAULT_SIMILARITY = 0.5
+DEFAULT_MAX_CHILDREN = 100
+
+
+class LogCluster:
+    def __init__(self, tokens, timestamp, category):
+        self.tokens = tokens
+        self.count = 1
+        self.first_seen = timestamp
+        self.last_seen = timestamp
+        self.category = category
+
+    @property
+    def event(self):
+        return self.tokens[0]
+
+    # 이벤트를 뺀 메시지 템플릿
+    @property
+    def template(self):
+        return ' '.join(self.tokens[1:])
+
+    def add(self, tokens, timestamp):
+        self.count += 1
+        # 입력 순서와 상관없이 시각은 최소 / 최대로 유지 (타임스탬프 문자열은 사전순 = 시간순)
+        if timestamp < self.first_seen:
+            self.first_seen = timestamp
+        if timestamp > self.last_seen:
+            self.last_seen = timestamp
+        self.tokens = [token if token == other else WILDCARD for token, other in zip(self.tokens, tokens)]
+
+
+# 메시지를 토큰으로 나누고 숫자가 들어간 토큰은 처음부터 '<*>'로 본다
+def tokenize(event, message):
+    return [event] + [WILDCARD if any(char.isdigit() for char in token) else token for token in message.split()]
+
+
+# 템플릿과 토큰열의 유사도: (같은 토큰 수 / 길이, '<*>' 개수)
+def similarity(template_tokens, tokens):
+    same = 0
+    wildcards = 0
+    for template_token, token in zip(template_tokens, tokens):
+        if template_token == WILDCARD:
+            wildcards += 1
+        elif template_token == token:
+            same += 1
+    return same / len(tokens), wildcards
+
+
+class TemplateMiner:
+    def __init__(self, depth=DEFAULT_DEPTH, similarity_threshold=DEFAULT_SIMILARITY,
+                 max_children=DEFAULT_MAX_CHILDREN):
+        self.prefix_depth = max(depth - 2, 1)
+        self.similarity_threshold = similarity_threshold
+        self.max_children = max_children
+        self.root = {}
+        self.clusters = []
+
+    # 트리를 따라 내려가 잎(클러스터 목록) 찾기, 없으면 만든다
+    def leaf_for(self, tokens):
+        node = self.root.setdefault(len(tokens), {})
+        for token in tokens[:self.prefix_depth]:
+            if token not in node:
+                # 자식이 너무 많으면 새 토큰은 '<*>' 가지로 보낸다
+                if token != WILDCARD and len(node) >= self.max_children:
+                    token = WILDCARD
+                node.setdefault(token, {})
+            node = node[token]
+        return node.setdefault(None, [])
+
+    # 레코드 하나를 템플릿에 반영하고 해당 클러스터 반환
+    def add(self, record, category):
+        tokens = tokenize(record.event, record.message)
+        timestamp = record.line.split(',', 1)[0].strip()
+        leaf = self.leaf_for(tokens)
+
+        best = None
+        best_score = None
+        for cluster in leaf:
+            score = similarity(cluster.tokens, tokens)
+            if score[0] >= self.similarity_threshold and (best_score is None or score > best_score):
+                best, best_score = cluster, score
+        if best is None:
+            best = LogCluster(tokens, timestamp, category)
+            leaf.append(best)
+            self.clusters.append(best)
+        else:
+            best.add(tokens, timestamp)
+        return best
+
+    # 보고서 순서: 마지막으로 나타난 시각의 역순, 같으면 많이 나온 순
+    def sorted_clusters(self):
+        return sorted(self.clusters, key=lambda cluster: (cluster.last_seen, cluster.count), reverse=True)
@@ -0,0 +1,190 @@
+# 미션 로그 시간 범위 조회를 위한 희소(sparse) 시간 인덱스
+# 로그 옆에 '<로그 파일>.idx' 사이드카 파일을 두고, 타임스탬프 버킷(기본 1분)마다
+# 그 버킷이 처음 시작되는 줄의 바이트 오프셋을 기록한다.
+# 조회할 때는 bisect로 시작 버킷을 찾아 그 위치로 seek하므로,
+# 걸리는 시간이 파일 크기가 아니라 결과 크기에 비례한다.
+#
+# 인덱스 파일 형식 (리틀 엔디언):
+#   헤더  : magic(4s) version(H) bucket_seconds(I) ordered(B) indexed_size(Q) last_epoch(q)
+#           inode(Q) head_hash(20s) entry_count(Q)
+#   (inode와 인덱싱한 앞부분(최대 incremental.FINGERPRINT_BYTES 바이트)의 SHA-1로 로그가 다른 파일로 바뀌었는지 확인한다)
+#   엔트리: bucket_epoch(q) byte_offset(Q) 가 entry_count개
+
+import calendar
+import os
+import struct
+from bisect import bisect_right
+from datetime import datetime
+
+from incremental import detect_change, head_fingerprint
+from log_pipeline import parse_log_line
+
+INDEX_MAGIC = b'MLIX'
+INDEX_VERSION = 2
+INDEX_HEADER = struct.Struct('<4sHIBQqQ20sQ')
+INDEX_ENTRY = struct.Struct('<qQ')
+DEFAULT_BUCKET_SECONDS = 60
+
+# 아직 아무 줄도 인덱싱하지 않았을 때의 last_epoch
+NO_EPOCH = -(2 ** 63)
+
+
+class TimeIndex:
+    def __init__(self, bucket_seconds=DEFAULT_BUCKET_SECONDS):
+        self.bucket_seconds = bucket_seconds
+        self.ordered = True       # 로그가 시간 순서대로 쌓였는지 (아니면 범위 조회 시 전체 스캔)
+        self.indexed_size = 0     # 인덱싱을 마친 바이트 위치 (여기부터 이어서 갱신)
+        self.last_epoch = NO_EPOCH
+        self.inode = 0            # 인덱싱한 로그 파일의 inode
+        self.head = bytes(20)     # 인덱싱한 부분 앞쪽의 SHA-1
+        self.buckets = []         # 버킷 시작 epoch (오름차순)
+        self.offsets = []         # 버킷 첫 줄의 바이트 오프셋
+
+    # 로그 한 줄을 인덱스에 반영
+    def add(self, epoch, offset):
+        if epoch < self.last_epoch:
+            self.ordered = False
+        self.last_epoch = max(self.last_epoch, epoch)
+        bucket = epoch - epoch % self.bucket_seconds
+        if not self.buckets or bucket > self.buckets[-1]:
+            self.buckets.append(bucket)
+            self.offsets.append(offset)
+
+    # 범위 시작 시각을 포함하는 버킷의 시작 오프셋
+    def seek_offset(self, start_epoch):
+        position = bisect_right(self.buckets, start_epoch) - 1
+        if position < 0:
+            return 0
+        return self.offsets[position]
+
+
+# 사이드카 인덱스 파일 경로
+def index_path_for(log_path):
+    return log_path + '.idx'
+
+
+# datetime 튜플 → epoch 초
+def timestamp_to_epoch(timestamp):
+    return calendar.timegm(timestamp)
+
+
+# 인덱스 저장 (임시 파일에 쓰고 교체해서 중간에 깨진 인덱스가 남지 않게 한다)
+def save_index(index, index_path):
+    tmp_path = index_path + '.tmp'
+    with open(tmp_path, 'wb') as file:
+        file.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, index.bucket_seconds, int(index.ordered),
+                                     index.indexed_size, index.last_epoch, index.inode, index.head,
+                                     len(index.buckets)))
+        for bucket, offset in zip(index.buckets, index.offsets):
+            file.write(INDEX_ENTRY.pack(bucket, offset))
+    os.replace(tmp_path, index_path)
+
+
+# 인덱스 불러오기 (없거나 형식이 다르면 None)
+def load_index(index_path):
+    try:
+        with open(index_path, 'rb') as file:
+            header = file.read(INDEX_HEADER.size)
+            if len(header) < INDEX_HEADER.size:
+                return None
+            (magic, version, bucket_seconds, ordered, indexed_size, last_epoch, inode, head,
+             count) = INDEX_HEADER.unpack(header)
+            if magic != INDEX_MAGIC or version != INDEX_VERSION:
+                return None
+            index = TimeIndex(bucket_seconds)
+            index.ordered = bool(ordered)
+            index.indexed_size = indexed_size
+            index.last_epoch = last_epoch
+            index.inode = inode
+            index.head = head
+            body = file.read(INDEX_ENTRY.size * count)
+    except FileNotFoundError:
+        return None
+    for bucket, offset in INDEX_ENTRY.iter_unpack(body):
+        index.buckets.append(bucket)
+        index.offsets.append(offset)
+    return index
+
+
+# 로그 파일의 start 위치부터 (줄 시작 오프셋, 다음 줄 오프셋, 줄) 읽기
+# complete_only이면 개행 없이 아직 쓰이는 중인 마지막 줄은 다음 갱신 때 처리하도록 멈춘다.
+def iter_lines_with_offsets(file, start, complete_only=True):
+    file.seek(start)
+    offset = start
+    for raw in file:
+        if complete_only and not raw.endswith(b'\n'):
+            break
+        yield offset, offset + len(raw), raw.decode('utf-8').rstrip('\r\n')
+        offset += len(raw)
+
+
+# 인덱스 생성 또는 증분 갱신
+# 기존 인덱스가 있으면 indexed_size 이후에 추가된 부분만 읽는다.
+# 로그가 로테이션/잘림/교체되었거나(incremental.detect_change와 같은 판단) 버킷 크기가 다르면 처음부터 다시 만든다.
+def update_index(log_path, index_path=None, bucket_seconds=DEFAULT_BUCKET_SECONDS):
+    index_path = index_path or index_path_for(log_path)
+    index = load_index(index_path)
+    stat = os.stat(log_path)
+    log_size = stat.st_size
+    if index is not None:
+        state = {'offset': index.indexed_size, 'inode': index.inode, 'head': index.head.hex()}
+        if index.bucket_seconds != bucket_seconds or detect_change(log_path, state)[0] != 'append':
+            index = None
+    if index is None:
+        index = TimeIndex(bucket_seconds)
+
+    if index.indexed_size < log_size:
+        with open(log_path, 'rb') as file:
+            for offset, next_offset, line in iter_lines_with_offsets(file, index.indexed_size):
+                index.indexed_size = next_offset
+                record = parse_log_line(line)
+                if record is not None:
+                    index.add(timestamp_to_epoch(record.timestamp), offset)
+        index.inode = stat.st_ino
+        index.head = bytes.fromhex(head_fingerprint(log_path, index.indexed_size))
+        save_index(index, index_path)
+    return index
+
+
+# '--from' / '--to' 값을 datetime으로 변환
+# '2023-08-27T10:00', '2023-08-27 10:00:00' 형식과, 날짜 없이 '10:30' 같은 시각만 있는 형식을 받는다.
+# 시각만 있으면 base_date(보통 --from의 날짜)를 쓴다.
+def parse_query_time(text, base_date=None):
+    text = text.strip().replace('T', ' ')
+    for fmt in ('%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M', '%Y-%m-%d'):
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            pass
+    for fmt in ('%H:%M:%S', '%H:%M'):
+        try:
+            parsed = datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+        if base_date is None:
+            raise ValueError(f"Time '{text}' needs a date (use YYYY-MM-DDTHH:MM).")
+        return datetime.combine(base_date, parsed.time())
+    raise ValueError(f"Unrecognized time '{text}'.")
+
+
+# 시간 범위 [start, end]에 해당하는 LogRecord 조회
+# 인덱스가 있는 로그는 시작 버킷으로 바로 seek하고 범위를 벗어나면 바로 멈춘다.
+# 시간 순서가 뒤섞인 로그라면 전체를 스캔한다.
+def query_range(log_path, start, end, index=None):
+    index = index or update_index(log_path)
+    start_epoch = calendar.timegm(start.timetuple())
+    end_epoch = calendar.timegm(end.timetuple())
+    start_offset = index.seek_offset(start_epoch) if index.ordered else 0
+
+    with open(log_path, 'rb') as file:
+        for _, _, line in iter_lines_with_offsets(file, start_offset, complete_only=False):
+            record = parse_log_line(line)
+            if record is None:
+                continue
+            epoch = timestamp_to_epoch(record.timestamp)
+            if epoch > end_epoch:
+                if index.ordered:
+                    break
+                continue
+            if epoch >= start_epoch:
+                yield record
@@ -1,92 +1,299 @@
+import argparse
+import os
+
+from inventory_analytics import format_analytics, np, run_inventory_analytics
+from inventory_archive import CODECS, InventoryArchiveReader, write_inventory_archive
+from inventory_binary import InventoryBinaryReader, write_inventory_binary
+from inventory_delta import affected_range, merge_inventory_binary, read_inventory_delta, refresh_danger_csv
+from inventory_parallel import load_inventory_parallel
+from inventory_query import by_flammability, run_flammability_query
+from inventory_reader import InventoryReader, format_row, write_inventory_csv
+
 # 파일 경로
 csv_path = "/Users/kogun/Downloads/Mars Base Inventory List.csv"
 danger_csv_path = "/Users/kogun/Downloads/Mars_Base_Inventory_danger.csv"  # 저장할 경로
+binary_file_path = "/Users/kogun/Downloads/Mars_Base_Inventory_List.bin"
+
+# 위험 화물 기준 인화성 지수
+DANGER_THRESHOLD = 0.7
+
+
+# 기존 방식: 전체 목록을 읽어서 정렬한 뒤 위험 목록 CSV와 이진 파일 저장
+def run_full_inventory(csv_path, danger_csv_path, binary_file_path):
+    # 리스트 객체 초기화
+    # csv 모듈로 한 줄씩 읽으면서 바로 타입이 정해진 레코드로 변환 (인화성이 숫자가 아닌 행은 건너뜀)
+    reader = InventoryReader(csv_path)
+    inventory_list = []
 
-# 리스트 객체 초기화
-inventory_list = []
-
-try:
-    with open(csv_path, "r", encoding="utf-8") as file:
-        lines = file.readlines()
-        header = lines[0].strip().split(",")  # 첫 줄은 헤더 (열 이름)
-
-        for line in lines[1:]:  # 헤더 제외
-            parts = line.strip().split(",")
-            if len(parts) == len(header):
-                item = {
-                    "Substance": parts[0],
-                    "Weight": parts[1],
-                    "Specific Gravity": parts[2],
-                    "Strength": parts[3],
-                    "Flammability": parts[4]
-                }
-                inventory_list.append(item)
-except FileNotFoundError:
-    print("❌ 파일을 찾을 수 없습니다.")
-except Exception as e:
-    print(f"❌ 오류 발생: {e}")
-
-# 원본 출력
-print("\n📄 원본 리스트 (상위 5개):")
-for item in inventory_list[:5]:
-    print(item)
-
-# 인화성 변환 및 정렬
-sorted_inventory = []
-for item in inventory_list:
     try:
-        item["Flammability"] = float(item["Flammability"])
-        sorted_inventory.append(item)
-    except ValueError:
-        continue
+        for item in reader:
+            inventory_list.append(item)
+    except FileNotFoundError:
+        print("❌ 파일을 찾을 수 없습니다.")
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
 
-sorted_inventory = sorted(sorted_inventory, key=lambda x: x["Flammability"], reverse=True)
+    if reader.rejected:
+        print(f"\n⚠️ 형식이 맞지 않아 건너뛴 행: {reader.rejected}개")
 
-print("\n🔥 인화성이 높은 순으로 정렬된 리스트 (상위 5개):")
-for item in sorted_inventory[:5]:
-    print(item)
+    # 원본 출력
+    print("\n📄 원본 리스트 (상위 5개):")
+    for item in inventory_list[:5]:
+        print(item)
 
-# 인화성 ≥ 0.7 항목 필터링
-dangerous_items = [item for item in sorted_inventory if item["Flammability"] >= 0.7]
+    # 인화성 순 정렬 (인화성은 읽을 때 이미 float로 변환됨)
+    sorted_inventory = sorted(inventory_list, key=lambda x: x.flammability, reverse=True)
 
-print("\n🚨 인화성 지수 0.7 이상 화물 목록:")
-for item in dangerous_items:
-    print(item)
+    print("\n🔥 인화성이 높은 순으로 정렬된 리스트 (상위 5개):")
+    for item in sorted_inventory[:5]:
+        print(item)
 
-# ✅ 위험 목록을 CSV로 저장
-try:
-    with open(danger_csv_path, "w", encoding="utf-8") as f:
-        f.write("Substance,Weight,Specific Gravity,Strength,Flammability\n")
-        for item in dangerous_items:
-            f.write(f"{item['Substance']},{item['Weight']},{item['Specific Gravity']},{item['Strength']},{item['Flammability']}\n")
-    print(f"\n📁 CSV 파일 저장 완료: {danger_csv_path}")
-except Exception as e:
-    print(f"❌ CSV 저장 중 오류 발생: {e}")
+    # 인화성 ≥ 0.7 항목 필터링
+    dangerous_items = [item for item in sorted_inventory if item.flammability >= DANGER_THRESHOLD]
 
+    print("\n🚨 인화성 지수 0.7 이상 화물 목록:")
+    for item in dangerous_items:
+        print(item)
 
-# ✅ 이진 파일로 저장 (인화성 순 정렬된 전체 목록)
-binary_file_path = "/Users/kogun/Downloads/Mars_Base_Inventory_List.bin"
+    # ✅ 위험 목록을 CSV로 저장
+    try:
+        write_inventory_csv(dangerous_items, danger_csv_path)
+        print(f"\n📁 CSV 파일 저장 완료: {danger_csv_path}")
+    except Exception as e:
+        print(f"❌ CSV 저장 중 오류 발생: {e}")
+
+    # ✅ 이진 파일로 저장 (인화성 순 정렬된 전체 목록, 고정 폭 레코드 + 문자열 표)
+    try:
+        write_inventory_binary(sorted_inventory, binary_file_path)
+        print(f"\n💾 이진 파일 저장 완료: {binary_file_path}")
+    except Exception as e:
+        print(f"❌ 이진 파일 저장 중 오류 발생: {e}")
+
+    # ✅ 저장된 이진 파일을 mmap으로 열어서 레코드 단위로 출력
+    try:
+        with InventoryBinaryReader(binary_file_path) as bin_reader:
+            print("\n📤 이진 파일 내용 출력:")
+            for item in bin_reader:
+                print(",".join(format_row(item)))
+    except FileNotFoundError:
+        print("❌ 이진 파일을 찾을 수 없습니다.")
+    except Exception as e:
+        print(f"❌ 이진 파일 읽기 중 오류 발생: {e}")
+
+
+# 조회 방식: 전체 정렬 없이 상위 K개와 기준 이상 항목을 파일 한 번 읽기로 구한다
+# 기준 이상 항목은 찾는 즉시 (원본 순서로) 출력하고, 걸러진 항목만 모아 두었다가
+# 인화성 내림차순(같은 인화성은 원본 순서)으로 정렬해서 위험 목록 CSV에 저장한다 (기존 방식과 같은 파일).
+def run_query(csv_path, top=None, min_flammability=None, danger_csv_path=None):
+    reader = InventoryReader(csv_path)
+    dangerous_items = []
+    if min_flammability is not None:
+        print(f"\n🚨 인화성 지수 {min_flammability} 이상 화물 목록:")
+
+    def on_match(record):
+        print(record)
+        dangerous_items.append(record)
+
+    try:
+        top_items = run_flammability_query(reader, top, min_flammability, on_match)
+    except FileNotFoundError:
+        print("❌ 파일을 찾을 수 없습니다.")
+        exit(1)
+
+    if min_flammability is not None:
+        print(f"→ {len(dangerous_items)}개")
+        if danger_csv_path:
+            try:
+                write_inventory_csv(sorted(dangerous_items, key=by_flammability, reverse=True), danger_csv_path)
+                print(f"\n📁 CSV 파일 저장 완료: {danger_csv_path}")
+            except Exception as e:
+                print(f"❌ CSV 저장 중 오류 발생: {e}")
+    if top is not None:
+        print(f"\n🔥 인화성이 높은 순 상위 {top}개:")
+        for item in top_items:
+            print(item)
+    if reader.rejected:
+        print(f"\n⚠️ 형식이 맞지 않아 건너뛴 행: {reader.rejected}개")
+
+
+# 병렬 모드: CSV를 구간으로 나눠 작업자들이 파싱 + 인화성 필터까지 하고, 걸러진 항목만 모아서 저장
+def run_parallel_danger(csv_path, danger_csv_path, minimum=DANGER_THRESHOLD, workers=None):
+    try:
+        result = load_inventory_parallel(csv_path, minimum, workers=workers)
+    except FileNotFoundError:
+        print("❌ 파일을 찾을 수 없습니다.")
+        exit(1)
+
+    # 걸러진 항목만 정렬 (같은 인화성은 원본 순서 유지 → 기존 방식과 같은 위험 목록)
+    dangerous_items = sorted(result.records, key=by_flammability, reverse=True)
+    print(f"\n🧵 병렬 로드 완료: {result.chunks}개 구간, {result.rows:,}행 중 "
+          f"인화성 지수 {minimum} 이상 {len(dangerous_items):,}개")
+    if result.rejected:
+        print(f"⚠️ 형식이 맞지 않아 건너뛴 행: {result.rejected:,}개")
+
+    try:
+        write_inventory_csv(dangerous_items, danger_csv_path)
+        print(f"\n📁 CSV 파일 저장 완료: {danger_csv_path}")
+    except Exception as e:
+        print(f"❌ CSV 저장 중 오류 발생: {e}")
+
+
+# 열 단위 압축 보관 파일 저장 (인화성 순 정렬된 전체 목록)
+def run_archive(csv_path, archive_path, compression):
+    reader = InventoryReader(csv_path)
+    try:
+        sorted_inventory = sorted(reader, key=by_flammability, reverse=True)
+    except FileNotFoundError:
+        print("❌ 파일을 찾을 수 없습니다.")
+        exit(1)
+    try:
+        count = write_inventory_archive(sorted_inventory, archive_path, compression)
+    except (OSError, ValueError) as e:
+        print(f"❌ 보관 파일 저장 중 오류 발생: {e}")
+        exit(1)
+    print(f"\n🗜️ 보관 파일 저장 완료: {archive_path} ({count}개, {os.path.getsize(archive_path):,} bytes, "
+          f"{compression})")
+    if reader.rejected:
+        print(f"⚠️ 형식이 맞지 않아 건너뛴 행: {reader.rejected}개")
+
+
+# 보관 파일에서 열 하나만 디코딩해서 출력
+def show_archive_column(archive_path, column):
+    try:
+        values = InventoryArchiveReader(archive_path).read_column(column)
+    except FileNotFoundError:
+        print("❌ 보관 파일을 찾을 수 없습니다.")
+        exit(1)
+    except (KeyError, ValueError) as e:
+        print(f"❌ 보관 파일 읽기 중 오류 발생: {e}")
+        exit(1)
+    print(f"\n📦 {column} ({len(values)}개):")
+    for value in values:
+        print(value)
+
+
+# 분석 모드: 인화성 구간 집계와 위험도(인화성 × 비중) 순위 (NumPy가 있으면 벡터 연산)
+def run_analytics(csv_path, use_numpy=True):
+    reader = InventoryReader(csv_path)
+    try:
+        analytics = run_inventory_analytics(reader, DANGER_THRESHOLD, use_numpy=use_numpy)
+    except FileNotFoundError:
+        print("❌ 파일을 찾을 수 없습니다.")
+        exit(1)
+
+    engine = 'NumPy' if use_numpy and np is not None else 'pure Python'
+    print(f"\n📊 화물 목록 분석 ({engine}):")
+    for line in format_analytics(analytics, DANGER_THRESHOLD):
+        print(line)
+    if reader.rejected:
+        print(f"\n⚠️ 형식이 맞지 않아 건너뛴 행: {reader.rejected}개")
+
+
+# 이진 파일에서 i번째 레코드만 꺼내서 출력 (앞 레코드를 읽지 않는다)
+def show_binary_record(binary_file_path, index):
+    try:
+        with InventoryBinaryReader(binary_file_path) as bin_reader:
+            print(f"#{index} / {len(bin_reader)}: {bin_reader[index]}")
+    except FileNotFoundError:
+        print("❌ 이진 파일을 찾을 수 없습니다.")
+        exit(1)
+    except (ValueError, IndexError) as e:
+        print(f"❌ 이진 파일 읽기 중 오류 발생: {e}")
+        exit(1)
+
+
+# 이진 파일의 인화성 색인으로 low <= 인화성 < high 범위 조회 (bisect, 전체를 훑지 않는다)
+def show_binary_range(binary_file_path, low, high):
+    try:
+        with InventoryBinaryReader(binary_file_path) as bin_reader:
+            print(f"\n🔎 인화성 {low} 이상 {high} 미만 화물 목록:")
+            matches = 0
+            for item in bin_reader.iter_flammability_range(low, high):
+                matches += 1
+                print(item)
+            print(f"→ {matches}개")
+    except FileNotFoundError:
+        print("❌ 이진 파일을 찾을 수 없습니다.")
+        exit(1)
+    except ValueError as e:
+        print(f"❌ 이진 파일 읽기 중 오류 발생: {e}")
+        exit(1)
+
+
+# 변경분 CSV를 이진 파일에 병합하고 위험 목록은 바뀐 인화성 범위만 다시 만든다
+def run_update(delta_csv_path, danger_csv_path, binary_file_path):
+    try:
+        delta = read_inventory_delta(delta_csv_path)
+        count, dropped = merge_inventory_binary(binary_file_path, delta)
+    except FileNotFoundError as e:
+        print(f"❌ 파일을 찾을 수 없습니다: {e.filename}")
+        exit(1)
+    except ValueError as e:
+        print(f"❌ 이진 파일 읽기 중 오류 발생: {e}")
+        exit(1)
+
+    print(f"\n🔁 변경분 병합 완료: 추가 {len(delta.added)}개, 교체 {len(delta.replaced)}종, "
+          f"삭제 {len(delta.removed)}종 (빠진 기존 행 {len(dropped)}개) → 전체 {count}개")
+    if delta.rejected:
+        print(f"⚠️ 형식이 맞지 않아 건너뛴 행: {delta.rejected}개")
+
+    key_range = affected_range(dropped, delta)
+    if key_range is None or key_range[1] < DANGER_THRESHOLD:
+        print("📁 위험 목록은 바뀌지 않았습니다.")
+        return
+    try:
+        refreshed = refresh_danger_csv(danger_csv_path, binary_file_path, *key_range, DANGER_THRESHOLD)
+    except FileNotFoundError:
+        print("❌ 위험 목록 CSV를 찾을 수 없습니다. 전체 실행으로 다시 만들어 주세요.")
+        exit(1)
+    print(f"📁 위험 목록 갱신 완료: 인화성 {max(key_range[0], DANGER_THRESHOLD)} ~ {key_range[1]} 범위 "
+          f"{refreshed}개 다시 기록 ({danger_csv_path})")
+
+
+# 명령행 인자 정의
+def parse_args():
+    parser = argparse.ArgumentParser(description='Mars base inventory tool')
+    parser.add_argument('--csv', default=csv_path, help='화물 목록 CSV 경로')
+    parser.add_argument('--danger-csv', default=danger_csv_path, help='위험 화물 목록 CSV 저장 경로')
+    parser.add_argument('--bin', default=binary_file_path, help='인화성 순 전체 목록 이진 파일 저장 경로')
+    parser.add_argument('--top', type=int, help='인화성 상위 K개만 조회 (전체 정렬 없이 heapq.nlargest)')
+    parser.add_argument('--min-flammability', type=float,
+                        help='인화성이 이 값 이상인 항목만 조회 (스트리밍 필터, --danger-csv에 바로 저장)')
+    parser.add_argument('--record', type=int, help='--bin 이진 파일에서 i번째 레코드만 읽어서 출력')
+    parser.add_argument('--parallel', action='store_true',
+                        help='CSV를 구간별로 병렬 파싱해서 위험 목록만 저장 (기준: --min-flammability, 기본 0.7)')
+    parser.add_argument('--workers', type=int, help='--parallel 작업자 프로세스 수 (기본: CPU 수)')
+    parser.add_argument('--archive', help='열 단위 압축 보관 파일 경로 (--column이 없으면 CSV에서 새로 저장)')
+    parser.add_argument('--compression', choices=list(CODECS), default='zlib', help='--archive 열 블록 압축 방식')
+    parser.add_argument('--column', help='--archive 보관 파일에서 이 열만 디코딩해서 출력')
+    parser.add_argument('--analytics', action='store_true', help='인화성 구간 집계와 위험도 순위 출력')
+    parser.add_argument('--no-numpy', action='store_true', help='--analytics를 NumPy 없이 순수 파이썬으로 계산')
+    parser.add_argument('--update', metavar='DELTA_CSV',
+                        help='변경분 CSV(Action,Substance,...)를 --bin에 병합하고 --danger-csv의 바뀐 범위만 갱신')
+    parser.add_argument('--range', type=float, nargs=2, metavar=('LOW', 'HIGH'),
+                        help='--bin 이진 파일의 인화성 색인으로 LOW <= 인화성 < HIGH 항목 조회')
+    return parser.parse_args()
 
-try:
-    with open(binary_file_path, "wb") as bin_file:
-        for item in sorted_inventory:
-            line = f"{item['Substance']},{item['Weight']},{item['Specific Gravity']},{item['Strength']},{item['Flammability']}\n"
-            bin_file.write(line.encode("utf-8"))  # 문자열을 바이트로 인코딩해서 저장
-    print(f"\n💾 이진 파일 저장 완료: {binary_file_path}")
-except Exception as e:
-    print(f"❌ 이진 파일 저장 중 오류 발생: {e}")
-
-
-# ✅ 저장된 이진 파일을 다시 읽어서 출력
-try:
-    with open(binary_file_path, "rb") as bin_file:
-        print("\n📤 이진 파일 내용 출력:")
-        lines = bin_file.readlines()
-        for line in lines:
-            decoded_line = line.decode("utf-8").strip()  # 바이트 → 문자열
-            print(decoded_line)
-except FileNotFoundError:
-    print("❌ 이진 파일을 찾을 수 없습니다.")
-except Exception as e:
-    print(f"❌ 이진 파일 읽기 중 오류 발생: {e}")
 
+if __name__ == '__main__':
+    args = parse_args()
+    if args.archive is not None:
+        if args.column is not None:
+            show_archive_column(args.archive, args.column)
+        else:
+            run_archive(args.csv, args.archive, args.compression)
+    elif args.parallel:
+        minimum = DANGER_THRESHOLD if args.min_flammability is None else args.min_flammability
+        run_parallel_danger(args.csv, args.danger_csv, minimum, args.workers)
+    elif args.analytics:
+        run_analytics(args.csv, use_numpy=not args.no_numpy)
+    elif args.update is not None:
+        run_update(args.update, args.danger_csv, args.bin)
+    elif args.record is not None:
+        show_binary_record(args.bin, args.record)
+    elif args.range is not None:
+        show_binary_range(args.bin, *args.range)
+    elif args.top is not None or args.min_flammability is not None:
+        run_query(args.csv, args.top, args.min_flammability, args.danger_csv)
+    else:
+        run_full_inventory(args.csv, args.danger_csv, args.bin)
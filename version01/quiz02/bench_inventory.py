@@ -0,0 +1,104 @@
+# 화물 목록 분석 벤치마크
+# 합성 화물 목록 CSV(기본 10만 / 1000만 행)를 만들고
+# 순수 파이썬 경로(레코드 리스트 → sorted, 행 단위 집계)와
+# NumPy 경로(열 배열 → argsort, 벡터 집계)의 읽기 / 분석 시간을 비교한다.
+# 두 경로의 결과(위험 개수, 위험도 순위, 구간 집계)가 같은지도 확인한다.
+# NumPy가 빨라지는 것은 분석 단계뿐이다. 두 경로 모두 InventoryReader로 CSV를 읽으므로
+# 행이 많을수록 전체 시간은 읽기(load)가 대부분을 차지한다.
+# (측정 예: 1000만 행에서 NumPy 경로는 load 약 53초 + analyze 약 4초, 분석 단계는 파이썬 경로보다 약 13배 빠름)
+#
+# 사용 예: python bench_inventory.py --rows 100000 10000000
+
+import argparse
+import csv
+import math
+import os
+import random
+import tempfile
+import time
+
+from inventory_analytics import load_inventory_columns, np, numpy_analytics, python_analytics
+from inventory_reader import OUTPUT_HEADER, InventoryReader, format_row
+
+DEFAULT_ROWS = [100_000, 10_000_000]
+DEFAULT_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Mars Base Inventory List.csv')
+DANGER_THRESHOLD = 0.7
+
+
+# 원본 목록을 바탕으로 rows행짜리 합성 CSV 만들기 (이름에 번호를 붙이고 인화성을 조금씩 흔든다)
+# 물질 이름에 쉼표가 들어 있을 수 있으므로 csv.writer로 따옴표를 붙여 쓴다.
+def write_synthetic_inventory(path, rows, source=DEFAULT_SOURCE, seed=42):
+    base = list(InventoryReader(source))
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8', newline='') as file:
+        writer = csv.writer(file, lineterminator='\n')
+        writer.writerow(OUTPUT_HEADER)
+        for index in range(rows):
+            record = base[index % len(base)]
+            flammability = round(min(max(record.flammability + rng.uniform(-0.05, 0.05), 0.0), 1.0), 3)
+            record = record._replace(substance=f"{record.substance} {index}", flammability=flammability)
+            writer.writerow(format_row(record))
+
+
+def bench_python(path):
+    started = time.perf_counter()
+    records = list(InventoryReader(path))
+    loaded = time.perf_counter()
+    analytics = python_analytics(records, DANGER_THRESHOLD)
+    return loaded - started, time.perf_counter() - loaded, analytics
+
+
+def bench_numpy(path):
+    started = time.perf_counter()
+    columns = load_inventory_columns(InventoryReader(path))
+    loaded = time.perf_counter()
+    analytics = numpy_analytics(columns, DANGER_THRESHOLD)
+    return loaded - started, time.perf_counter() - loaded, analytics
+
+
+# 두 결과가 (부동소수점 합계 오차를 빼면) 같은지
+def same_analytics(left, right):
+    if left.rows != right.rows or left.dangerous != right.dangerous:
+        return False
+    if [(name, flammability) for name, flammability, _ in left.top_hazards] != \
+            [(name, flammability) for name, flammability, _ in right.top_hazards]:
+        return False
+    for a, b in zip(left.bands, right.bands):
+        if a.count != b.count:
+            return False
+        for x, y in zip(a[3:], b[3:]):
+            if (x is None) != (y is None) or (x is not None and not math.isclose(x, y, rel_tol=1e-9)):
+                return False
+    return True
+
+
+def measure(name, func, path, rows):
+    load_time, analyze_time, analytics = func(path)
+    print(f"{name:<7} {rows:>11,} {load_time:8.2f}s {analyze_time:9.3f}s "
+          f"{rows / (load_time + analyze_time):12,.0f} rows/sec")
+    return analyze_time, analytics
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Inventory analytics benchmark')
+    parser.add_argument('--rows', type=int, nargs='+', default=DEFAULT_ROWS, help='합성 목록 행 수')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--skip-python', action='store_true', help='순수 파이썬 경로 측정 생략 (메모리가 부족할 때)')
+    args = parser.parse_args()
+
+    if np is None:
+        print("NumPy is not installed; only the pure-Python path can run.")
+
+    print(f"{'path':<7} {'rows':>11} {'load':>9} {'analyze':>10} {'throughput':>21}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = os.path.join(tmp_dir, 'inventory.csv')
+        for rows in args.rows:
+            write_synthetic_inventory(csv_path, rows, seed=args.seed)
+            python_result = numpy_result = None
+            if np is not None:
+                numpy_time, numpy_result = measure('numpy', bench_numpy, csv_path, rows)
+            if not args.skip_python:
+                python_time, python_result = measure('python', bench_python, csv_path, rows)
+            if numpy_result is not None and python_result is not None:
+                print(f"analyze speedup {python_time / numpy_time:8.1f}x  "
+                      f"results match: {'yes' if same_analytics(python_result, numpy_result) else 'NO'}")
@@ -0,0 +1,178 @@
+# 화물 목록 분석 (NumPy가 있으면 벡터 연산, 없으면 순수 파이썬)
+# 숫자 열(weight, specific_gravity, flammability)을 배열로 올려 두고
+# 필터, 정렬(argsort), 파생 지표를 행 단위 반복 없이 한 번에 계산한다.
+#
+# 파생 지표:
+#   위험도(hazard)   : 인화성 × 비중 (비중이 'Various'처럼 정해지지 않으면 물과 같은 1.0으로 본다)
+#   인화성 구간 집계 : 구간별 개수, 평균 인화성, 평균/최대 위험도, 무게가 알려진 항목의 무게 합
+#
+# 두 경로는 같은 InventoryAnalytics를 돌려주므로 결과를 서로 비교할 수 있다 (bench_inventory.py).
+
+import math
+from array import array
+from bisect import bisect_right
+from collections import namedtuple
+from operator import itemgetter
+
+from inventory_query import by_flammability
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 없이도 동작
+    np = None
+
+# 비중을 모를 때 쓰는 값 (물)
+DEFAULT_DENSITY = 1.0
+
+# 인화성 구간의 아래 경계 (마지막 구간은 1.0 이상까지 포함)
+FLAMMABILITY_BANDS = (0.0, 0.3, 0.5, 0.7, 0.9)
+
+# 위험도 순위에 보여 줄 개수
+DEFAULT_TOP_HAZARDS = 5
+
+InventoryColumns = namedtuple('InventoryColumns', [
+    'substances',          # list[str]
+    'weight',              # float64 배열 (모르면 NaN)
+    'specific_gravity',    # float64 배열 (모르면 NaN)
+    'flammability',        # float64 배열
+])
+
+BandSummary = namedtuple('BandSummary', [
+    'low', 'high', 'count', 'mean_flammability', 'mean_hazard', 'max_hazard', 'known_weight',
+])
+
+InventoryAnalytics = namedtuple('InventoryAnalytics', [
+    'rows', 'dangerous', 'top_hazards', 'bands',
+])
+
+
+# 구간 경계 목록 [(low, high), ...] (마지막 구간의 high는 None)
+def band_edges():
+    highs = FLAMMABILITY_BANDS[1:] + (None,)
+    return list(zip(FLAMMABILITY_BANDS, highs))
+
+
+# ---------------------------------------------------------------------------
+# 순수 파이썬 경로 (레코드를 하나씩 계산)
+
+def hazard_score(record):
+    density = DEFAULT_DENSITY if record.specific_gravity is None else record.specific_gravity
+    return record.flammability * density
+
+
+# 인화성이 들어갈 구간 번호 (0.0 미만은 첫 구간)
+def band_index(flammability):
+    return max(bisect_right(FLAMMABILITY_BANDS, flammability) - 1, 0)
+
+
+def python_analytics(records, threshold, top=DEFAULT_TOP_HAZARDS):
+    records = sorted(records, key=by_flammability, reverse=True)
+    dangerous = sum(1 for record in records if record.flammability >= threshold)
+
+    scored = [(record.substance, record.flammability, hazard_score(record)) for record in records]
+    top_hazards = sorted(scored, key=itemgetter(2), reverse=True)[:top]
+
+    totals = [[0, 0.0, 0.0, -math.inf, 0.0] for _ in FLAMMABILITY_BANDS]
+    for record, (_, flammability, score) in zip(records, scored):
+        total = totals[band_index(flammability)]
+        total[0] += 1
+        total[1] += flammability
+        total[2] += score
+        total[3] = max(total[3], score)
+        if record.weight is not None:
+            total[4] += record.weight
+
+    bands = []
+    for (low, high), (count, flammability_sum, hazard_sum, max_hazard, known_weight) in zip(band_edges(), totals):
+        bands.append(BandSummary(low, high, count,
+                                 flammability_sum / count if count else None,
+                                 hazard_sum / count if count else None,
+                                 max_hazard if count else None,
+                                 known_weight))
+    return InventoryAnalytics(len(records), dangerous, top_hazards, bands)
+
+
+# ---------------------------------------------------------------------------
+# NumPy 경로 (열 배열 단위로 계산)
+
+# 레코드 스트림을 열 배열로 올리기 (한 번만 훑는다, NumPy 필요)
+def load_inventory_columns(records):
+    if np is None:
+        raise RuntimeError("NumPy is required for inventory columns.")
+    substances = []
+    weight = array('d')
+    specific_gravity = array('d')
+    flammability = array('d')
+    for record in records:
+        substances.append(record.substance)
+        weight.append(math.nan if record.weight is None else record.weight)
+        specific_gravity.append(math.nan if record.specific_gravity is None else record.specific_gravity)
+        flammability.append(record.flammability)
+    return InventoryColumns(substances,
+                            np.frombuffer(weight, dtype=np.float64),
+                            np.frombuffer(specific_gravity, dtype=np.float64),
+                            np.frombuffer(flammability, dtype=np.float64))
+
+
+def hazard_scores(columns):
+    density = np.where(np.isnan(columns.specific_gravity), DEFAULT_DENSITY, columns.specific_gravity)
+    return columns.flammability * density
+
+
+def numpy_analytics(columns, threshold, top=DEFAULT_TOP_HAZARDS):
+    flammability = columns.flammability
+    # 인화성 내림차순 (같은 값은 원래 순서 유지) — python_analytics의 sorted와 같은 순서
+    order = np.argsort(-flammability, kind='stable')
+    flammability = flammability[order]
+    scores = hazard_scores(columns)[order]
+    weight = columns.weight[order]
+    dangerous = int(np.count_nonzero(flammability >= threshold))
+
+    top_order = np.argsort(-scores, kind='stable')[:top]
+    top_hazards = [(columns.substances[order[index]], float(flammability[index]), float(scores[index]))
+                   for index in top_order]
+
+    bins = np.digitize(flammability, FLAMMABILITY_BANDS[1:])
+    size = len(FLAMMABILITY_BANDS)
+    counts = np.bincount(bins, minlength=size)
+    flammability_sums = np.bincount(bins, weights=flammability, minlength=size)
+    hazard_sums = np.bincount(bins, weights=scores, minlength=size)
+    known = ~np.isnan(weight)
+    known_weights = np.bincount(bins[known], weights=weight[known], minlength=size)
+    max_hazards = np.full(size, -np.inf)
+    np.maximum.at(max_hazards, bins, scores)
+
+    bands = []
+    for band, (low, high) in enumerate(band_edges()):
+        count = int(counts[band])
+        bands.append(BandSummary(low, high, count,
+                                 float(flammability_sums[band] / count) if count else None,
+                                 float(hazard_sums[band] / count) if count else None,
+                                 float(max_hazards[band]) if count else None,
+                                 float(known_weights[band])))
+    return InventoryAnalytics(len(flammability), dangerous, top_hazards, bands)
+
+
+# NumPy가 있으면 벡터 경로, 없으면 (또는 use_numpy=False면) 순수 파이썬 경로
+def run_inventory_analytics(records, threshold, top=DEFAULT_TOP_HAZARDS, use_numpy=True):
+    if use_numpy and np is not None:
+        return numpy_analytics(load_inventory_columns(records), threshold, top)
+    return python_analytics(records, threshold, top)
+
+
+# 분석 결과 출력용 문자열 줄
+def format_analytics(analytics, threshold):
+    lines = [f"rows: {analytics.rows:,}  (flammability >= {threshold}: {analytics.dangerous:,})", '',
+             f"{'band':<11} {'count':>9} {'avg flam':>9} {'avg hazard':>11} {'max hazard':>11} {'known weight':>13}"]
+    for band in analytics.bands:
+        label = f"{band.low:.1f}-{band.high:.1f}" if band.high is not None else f"{band.low:.1f}+"
+        if band.count:
+            lines.append(f"{label:<11} {band.count:>9,} {band.mean_flammability:>9.3f} {band.mean_hazard:>11.3f} "
+                         f"{band.max_hazard:>11.3f} {band.known_weight:>13.3f}")
+        else:
+            lines.append(f"{label:<11} {0:>9} {'-':>9} {'-':>11} {'-':>11} {band.known_weight:>13.3f}")
+    lines.append('')
+    lines.append('top hazards (flammability × specific gravity):')
+    for substance, flammability, score in analytics.top_hazards:
+        lines.append(f"  {substance:<30} {flammability:>6.2f} {score:>9.3f}")
+    return lines
@@ -0,0 +1,230 @@
+# 화물 목록 열 단위 압축 보관 파일 (.minva)
+# 같은 물질 이름이 스냅샷마다 반복되므로 열(column)별로 따로 인코딩해서 저장한다.
+#   문자열 열 (substance, strength) : 사전 인코딩 (고유 문자열 목록 + 가장 작은 폭의 정수 id 배열)
+#   숫자 열 (weight, specific_gravity, flammability) :
+#       값이 모두 소수점 아래 k자리(k ≤ 6) 안에 들어가면 10^k를 곱한 정수로 양자화한 뒤
+#       앞 행과의 차이(delta)만 가장 작은 폭의 정수 배열로 저장 (정렬된 목록이라 차이가 작다)
+#       그렇지 않거나 차이가 64비트 정수에 들어가지 않으면 float64 그대로 저장 (항상 손실 없음)
+#       'Various'처럼 값이 없는 행은 null 표시 바이트 열로 따로 저장한다.
+# 열 블록마다 none / zlib / lzma 중 하나로 압축할 수 있다.
+#
+# 파일 형식 (리틀 엔디언):
+#   헤더    : magic(4s) version(H) column_count(H) row_count(Q)
+#   열 목록 : name(16s) kind(B) codec(B) typecode(c) scale(b) offset(Q) stored_size(Q) raw_size(Q) × column_count
+#   열 블록 : 열 목록의 offset부터 stored_size 바이트 (압축을 풀면 raw_size 바이트)
+# 열 목록만 읽으면 필요한 열 블록 하나로 바로 건너뛸 수 있으므로 한 열만 디코딩할 수 있다.
+
+import lzma
+import math
+import struct
+import sys
+import zlib
+from array import array
+from itertools import accumulate
+
+from inventory_reader import InventoryRecord
+
+ARCHIVE_MAGIC = b'MINA'
+ARCHIVE_VERSION = 1
+ARCHIVE_HEADER = struct.Struct('<4sHHQ')
+ARCHIVE_COLUMN = struct.Struct('<16sBBcbQQQ')
+DICTIONARY_HEADER = struct.Struct('<I')
+
+# 열 종류
+KIND_DICTIONARY = 0
+KIND_DELTA = 1
+KIND_FLOAT = 2
+
+# 압축 방식
+CODECS = {'none': 0, 'zlib': 1, 'lzma': 2}
+
+# 사전 인코딩하는 열 (나머지는 숫자 열)
+STRING_COLUMNS = ('substance', 'strength')
+
+# 양자화할 때 시도하는 최대 소수 자릿수
+MAX_SCALE = 6
+
+# 정수 배열 폭 후보 (작은 것부터)
+INTEGER_TYPECODES = ('b', 'h', 'i', 'q')
+
+
+# 배열을 리틀 엔디언 바이트로 (빅 엔디언 기계에서도 같은 파일이 나오도록)
+def array_to_bytes(values):
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def array_from_bytes(typecode, data):
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+# 값 범위를 담을 수 있는 가장 작은 정수 typecode
+def integer_typecode(values, signed=True):
+    low = min(values, default=0)
+    high = max(values, default=0)
+    for typecode in INTEGER_TYPECODES if signed else tuple(code.upper() for code in INTEGER_TYPECODES):
+        bits = array(typecode).itemsize * 8
+        if signed and -(1 << (bits - 1)) <= low and high < (1 << (bits - 1)):
+            return typecode
+        if not signed and high < (1 << bits):
+            return typecode
+    raise OverflowError('integer column does not fit in 64 bits')
+
+
+# 문자열 열 → (typecode, scale(항상 0), payload)
+def encode_dictionary(values):
+    ids = {}
+    codes = [ids.setdefault(value, len(ids)) for value in values]
+    dictionary = '\0'.join(ids).encode('utf-8')
+    typecode = integer_typecode(codes, signed=False)
+    return typecode, 0, DICTIONARY_HEADER.pack(len(dictionary)) + dictionary + array_to_bytes(array(typecode, codes))
+
+
+def decode_dictionary(typecode, payload):
+    (size,) = DICTIONARY_HEADER.unpack_from(payload, 0)
+    start = DICTIONARY_HEADER.size
+    strings = payload[start:start + size].decode('utf-8').split('\0') if size else ['']
+    return [strings[code] for code in array_from_bytes(typecode, payload[start + size:])]
+
+
+# 모든 값이 소수점 아래 몇 자리 안에 들어가는지 (None이면 양자화 불가)
+def quantize_scale(values):
+    if not all(math.isfinite(value) for value in values):
+        return None
+    for scale in range(MAX_SCALE + 1):
+        factor = 10 ** scale
+        if all(round(value * factor) / factor == value for value in values):
+            return scale
+    return None
+
+
+# 숫자 열 → (kind, typecode, scale, payload)
+# payload = null 여부(B) [+ null 표시 바이트 × 행 수] + 값 배열
+def encode_numeric(values):
+    nulls = bytes(value is None for value in values)
+    has_nulls = any(nulls)
+    prefix = bytes([has_nulls]) + (nulls if has_nulls else b'')
+
+    # null 자리는 앞 값으로 채워서 delta를 0으로 만든다
+    filled = list(accumulate(values, lambda previous, value: previous if value is None else value,
+                             initial=0.0))[1:]
+
+    scale = quantize_scale(filled)
+    if scale is not None:
+        factor = 10 ** scale
+        quantized = [round(value * factor) for value in filled]
+        deltas = [current - previous for previous, current in zip([0] + quantized, quantized)]
+        try:
+            typecode = integer_typecode(deltas)
+        except OverflowError:
+            # 아주 큰 값은 차이가 64비트에 들어가지 않는다 → float64로 저장
+            typecode = None
+        if typecode is not None:
+            return KIND_DELTA, typecode, scale, prefix + array_to_bytes(array(typecode, deltas))
+    return KIND_FLOAT, 'd', 0, prefix + array_to_bytes(array('d', filled))
+
+
+def decode_numeric(kind, typecode, scale, payload, row_count):
+    has_nulls = payload[0]
+    start = 1 + (row_count if has_nulls else 0)
+    raw = array_from_bytes(typecode, payload[start:])
+    if kind == KIND_DELTA:
+        factor = 10 ** scale
+        values = [value / factor for value in accumulate(raw)]
+    else:
+        values = raw.tolist()
+    if has_nulls:
+        nulls = payload[1:start]
+        values = [None if null else value for value, null in zip(values, nulls)]
+    return values
+
+
+def compress(codec, payload):
+    if codec == CODECS['zlib']:
+        return zlib.compress(payload, 9)
+    if codec == CODECS['lzma']:
+        return lzma.compress(payload)
+    return payload
+
+
+def decompress(codec, data):
+    if codec == CODECS['zlib']:
+        return zlib.decompress(data)
+    if codec == CODECS['lzma']:
+        return lzma.decompress(data)
+    return data
+
+
+# 레코드들을 보관 파일로 저장 (저장한 행 수 반환)
+# 열 단위로 인코딩하므로 레코드를 한 번 메모리에 모은다.
+def write_inventory_archive(records, archive_path, compression='zlib'):
+    if compression not in CODECS:
+        raise ValueError(f"Unknown compression '{compression}' (choose from {', '.join(CODECS)}).")
+    codec = CODECS[compression]
+    records = list(records)
+
+    blocks = []
+    for index, name in enumerate(InventoryRecord._fields):
+        values = [record[index] for record in records]
+        if name in STRING_COLUMNS:
+            kind = KIND_DICTIONARY
+            typecode, scale, payload = encode_dictionary(values)
+        else:
+            kind, typecode, scale, payload = encode_numeric(values)
+        blocks.append((name, kind, typecode, scale, payload, compress(codec, payload)))
+
+    offset = ARCHIVE_HEADER.size + ARCHIVE_COLUMN.size * len(blocks)
+    with open(archive_path, 'wb') as file:
+        file.write(ARCHIVE_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, len(blocks), len(records)))
+        for name, kind, typecode, scale, payload, stored in blocks:
+            file.write(ARCHIVE_COLUMN.pack(name.encode('ascii'), kind, codec, typecode.encode('ascii'), scale,
+                                           offset, len(stored), len(payload)))
+            offset += len(stored)
+        for block in blocks:
+            file.write(block[-1])
+    return len(records)
+
+
+class InventoryArchiveReader:
+    def __init__(self, archive_path):
+        self.archive_path = archive_path
+        with open(archive_path, 'rb') as file:
+            try:
+                magic, version, column_count, self.row_count = ARCHIVE_HEADER.unpack(
+                    file.read(ARCHIVE_HEADER.size))
+            except struct.error:
+                raise ValueError(f"'{archive_path}' is not an inventory archive.")
+            if magic != ARCHIVE_MAGIC or version != ARCHIVE_VERSION:
+                raise ValueError(f"'{archive_path}' is not an inventory archive (version {ARCHIVE_VERSION}).")
+            self.columns = {}
+            for _ in range(column_count):
+                name, *entry = ARCHIVE_COLUMN.unpack(file.read(ARCHIVE_COLUMN.size))
+                self.columns[name.rstrip(b'\0').decode('ascii')] = entry
+
+    def __len__(self):
+        return self.row_count
+
+    # 열 하나만 읽어서 디코딩 (다른 열 블록은 읽지 않는다)
+    def read_column(self, name):
+        if name not in self.columns:
+            raise KeyError(f"Unknown inventory column '{name}' (choose from {', '.join(self.columns)}).")
+        kind, codec, typecode, scale, offset, stored_size, _ = self.columns[name]
+        with open(self.archive_path, 'rb') as file:
+            file.seek(offset)
+            payload = decompress(codec, file.read(stored_size))
+        typecode = typecode.decode('ascii')
+        if kind == KIND_DICTIONARY:
+            return decode_dictionary(typecode, payload)
+        return decode_numeric(kind, typecode, scale, payload, self.row_count)
+
+    # 전체 레코드 (모든 열을 디코딩해서 다시 묶는다)
+    def __iter__(self):
+        columns = [self.read_column(name) for name in InventoryRecord._fields]
+        for values in zip(*columns):
+            yield InventoryRecord(*values)
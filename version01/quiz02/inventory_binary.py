@@ -0,0 +1,175 @@
+# 화물 목록 이진 파일 형식
+# 예전 .bin은 CSV 문자열을 바이트로 쓴 것이라 다시 읽으려면 처음부터 텍스트를 파싱해야 했다.
+# 이 형식은 숫자 필드를 고정 폭 struct로 저장하고 문자열은 문자열 표로 따로 빼므로,
+# mmap으로 연 뒤 i번째 레코드를 (앞 레코드를 읽지 않고) O(1)로 바로 꺼낼 수 있다.
+#
+# 파일 형식 (리틀 엔디언):
+#   헤더      : magic(4s) version(H) reserved(H) record_count(Q) records_offset(Q)
+#               string_count(Q) string_offsets_offset(Q) string_blob_offset(Q) string_blob_size(Q)
+#   레코드    : substance_id(I) strength_id(I) weight(d) specific_gravity(d) flammability(d) 가 record_count개
+#               (값이 'Various'처럼 정해지지 않은 weight / specific_gravity는 NaN)
+#   문자열 표 : string_offsets(Q) × (string_count + 1), 이어서 UTF-8 문자열 blob
+#   (버전 2) 헤더 뒤 확장 헤더: key_offset(Q) order_offset(Q)
+#   (버전 2) 인화성 색인 : 오름차순 정렬된 flammability(d) × record_count (8바이트 경계),
+#               이어서 같은 순서의 레코드 번호(I) × record_count
+# 레코드를 먼저 스트리밍으로 쓰고 문자열 표와 색인은 마지막에 붙인 뒤 헤더를 다시 쓴다.
+# 인화성 범위 조회(0.7 <= f < 0.9)는 mmap 위의 키 열을 bisect로 찾으므로 O(log n)이다.
+# 버전 1 파일(색인 없음)도 읽을 수 있고, 이때 범위 조회는 레코드 전체를 훑는다.
+
+import math
+import mmap
+import struct
+from array import array
+from bisect import bisect_left
+
+from inventory_reader import InventoryRecord
+
+BINARY_MAGIC = b'MINV'
+BINARY_VERSION = 2
+BINARY_HEADER = struct.Struct('<4sHHQQQQQQ')
+INDEX_HEADER = struct.Struct('<QQ')    # 버전 2부터
+BINARY_RECORD = struct.Struct('<IIddd')
+STRING_OFFSET = struct.Struct('<Q')
+
+NAN = float('nan')
+
+
+# None ↔ NaN 변환 (고정 폭 필드에는 None을 저장할 수 없다)
+def measure_to_float(value):
+    return NAN if value is None else value
+
+
+def float_to_measure(value):
+    return None if math.isnan(value) else value
+
+
+# 레코드들을 이진 파일로 저장 (레코드 수 반환)
+def write_inventory_binary(records, binary_path):
+    string_ids = {}
+    strings = []
+
+    def string_id(text):
+        index = string_ids.get(text)
+        if index is None:
+            index = string_ids[text] = len(strings)
+            strings.append(text.encode('utf-8'))
+        return index
+
+    keys = []    # (flammability, 레코드 번호): 레코드보다 훨씬 작아서 메모리에 모아서 정렬
+    count = 0
+    with open(binary_path, 'wb') as file:
+        file.write(b'\0' * (BINARY_HEADER.size + INDEX_HEADER.size))
+        records_offset = file.tell()
+        for record in records:
+            keys.append((record.flammability, count))
+            file.write(BINARY_RECORD.pack(string_id(record.substance), string_id(record.strength),
+                                          measure_to_float(record.weight),
+                                          measure_to_float(record.specific_gravity),
+                                          record.flammability))
+            count += 1
+
+        string_offsets_offset = file.tell()
+        position = 0
+        for string in strings:
+            file.write(STRING_OFFSET.pack(position))
+            position += len(string)
+        file.write(STRING_OFFSET.pack(position))
+        string_blob_offset = file.tell()
+        file.write(b''.join(strings))
+
+        # 키 열은 double 배열로 바로 볼 수 있게 8바이트 경계에 맞춘다
+        file.write(b'\0' * (-file.tell() % 8))
+        keys.sort()
+        key_offset = file.tell()
+        file.write(array('d', [key for key, _ in keys]).tobytes())
+        order_offset = file.tell()
+        file.write(array('I', [index for _, index in keys]).tobytes())
+
+        file.seek(0)
+        file.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, 0, count, records_offset,
+                                      len(strings), string_offsets_offset, string_blob_offset, position))
+        file.write(INDEX_HEADER.pack(key_offset, order_offset))
+    return count
+
+
+class InventoryBinaryReader:
+    def __init__(self, binary_path):
+        with open(binary_path, 'rb') as file:
+            self.mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (magic, version, _, self.record_count, self.records_offset, self.string_count,
+             self.string_offsets_offset, self.string_blob_offset, _) = BINARY_HEADER.unpack_from(self.mm, 0)
+        except struct.error:
+            self.mm.close()
+            raise ValueError(f"'{binary_path}' is not an inventory binary file.")
+        if magic != BINARY_MAGIC or not 1 <= version <= BINARY_VERSION:
+            self.mm.close()
+            raise ValueError(f"'{binary_path}' is not an inventory binary file (version {BINARY_VERSION}).")
+        self.version = version
+
+        # 인화성 색인: mmap을 복사하지 않고 double / uint32 배열로 본다
+        self.keys = self.order = None
+        if version >= 2 and self.record_count:
+            key_offset, order_offset = INDEX_HEADER.unpack_from(self.mm, BINARY_HEADER.size)
+            view = memoryview(self.mm)
+            self.keys = view[key_offset:key_offset + self.record_count * 8].cast('d')
+            self.order = view[order_offset:order_offset + self.record_count * 4].cast('I')
+            view.release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def close(self):
+        # mmap을 닫기 전에 색인 뷰를 먼저 놓아야 한다 (BufferError 방지)
+        if self.keys is not None:
+            self.keys.release()
+            self.order.release()
+            self.keys = self.order = None
+        self.mm.close()
+
+    def __len__(self):
+        return self.record_count
+
+    # 문자열 표에서 index번째 문자열
+    def string(self, index):
+        start, end = struct.unpack_from('<QQ', self.mm, self.string_offsets_offset + index * STRING_OFFSET.size)
+        return self.mm[self.string_blob_offset + start:self.string_blob_offset + end].decode('utf-8')
+
+    # i번째 레코드 (O(1): 오프셋을 계산해서 바로 읽는다)
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.record_count
+        if not 0 <= index < self.record_count:
+            raise IndexError('inventory record index out of range')
+        substance_id, strength_id, weight, specific_gravity, flammability = BINARY_RECORD.unpack_from(
+            self.mm, self.records_offset + index * BINARY_RECORD.size)
+        return InventoryRecord(self.string(substance_id), float_to_measure(weight),
+                               float_to_measure(specific_gravity), self.string(strength_id), flammability)
+
+    def __iter__(self):
+        for index in range(self.record_count):
+            yield self[index]
+
+    # minimum <= 인화성 < below 인 레코드 번호 (인화성 오름차순)
+    # 색인이 있으면 bisect 두 번으로 범위를 찾는다: O(log n + 결과 수)
+    def flammability_range(self, minimum=None, below=None):
+        if self.keys is None:
+            if self.version >= 2:
+                return []
+            # 버전 1 파일: 색인이 없으니 전체를 훑는다
+            matches = sorted((record.flammability, index) for index, record in enumerate(self)
+                             if (minimum is None or record.flammability >= minimum)
+                             and (below is None or record.flammability < below))
+            return [index for _, index in matches]
+        start = 0 if minimum is None else bisect_left(self.keys, minimum)
+        end = len(self.keys) if below is None else bisect_left(self.keys, below)
+        return self.order[start:max(start, end)].tolist()
+
+    # 인화성 범위에 드는 레코드 (인화성 오름차순)
+    def iter_flammability_range(self, minimum=None, below=None):
+        for index in self.flammability_range(minimum, below):
+            yield self[index]
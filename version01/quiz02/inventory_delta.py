@@ -0,0 +1,154 @@
+# 화물 목록 변경분(delta) 반영
+# 목록이 조금만 바뀌어도 원본 CSV 전체를 다시 읽고 위험 목록 CSV와 .bin을 모두 다시 만들던 것을,
+# 변경분 CSV만 읽어서 기존의 정렬된 이진 파일과 스트리밍으로 병합하도록 바꾼다.
+#
+# 변경분 CSV 형식 (맨 앞에 Action 열, 나머지는 원본 목록과 같은 열):
+#   Action,Substance,Weight,Specific Gravity,Strength,Flammability
+#   add,Hydrazine,1.02,1.02,High,0.92          ← 새 행 추가
+#   change,Propane,1.88,1.88,Very low,0.81     ← 같은 이름의 기존 행을 모두 이 행(들)로 교체
+#   remove,Asphalt,,,,                         ← 같은 이름의 기존 행을 모두 삭제
+#
+# 병합: 기존 레코드(인화성 내림차순)를 하나씩 읽으면서 바뀌거나 지워진 이름은 건너뛰고,
+# 새 레코드(인화성 내림차순 정렬)와 heapq.merge로 합쳐서 새 이진 파일에 바로 쓴다.
+# 위험 목록 CSV는 바뀐 인화성 값의 범위 [최소, 최대] 부분만 새 이진 파일의 색인으로 다시 채우고
+# 그 밖의 행은 기존 파일에서 그대로 복사한다.
+
+import csv
+import heapq
+import math
+import os
+
+from inventory_binary import InventoryBinaryReader, write_inventory_binary
+from inventory_query import by_flammability
+from inventory_reader import OUTPUT_HEADER, format_row, parse_row
+
+DELTA_ACTIONS = ('add', 'change', 'remove')
+
+
+class InventoryDelta:
+    def __init__(self):
+        self.added = []       # 추가할 레코드
+        self.replaced = {}    # 이름 → 교체할 레코드 리스트 (change)
+        self.removed = set()  # 삭제할 이름
+        self.rejected = 0     # 형식이 맞지 않아 건너뛴 행 수
+
+    def __len__(self):
+        return len(self.added) + sum(len(records) for records in self.replaced.values()) + len(self.removed)
+
+    # 기존 레코드 중 이 변경분 때문에 빠지는 것인지
+    def drops(self, record):
+        return record.substance in self.removed or record.substance in self.replaced
+
+    # 새로 들어가는 레코드 (인화성 내림차순)
+    def new_records(self):
+        records = list(self.added)
+        for replacement in self.replaced.values():
+            records.extend(replacement)
+        records.sort(key=by_flammability, reverse=True)
+        return records
+
+
+# 변경분 CSV 읽기
+def read_inventory_delta(delta_path):
+    delta = InventoryDelta()
+    with open(delta_path, 'r', encoding='utf-8', newline='') as file:
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            return delta
+        for row in reader:
+            if not row:
+                continue
+            action = row[0].strip().lower()
+            if action not in DELTA_ACTIONS or len(row) < 2:
+                delta.rejected += 1
+                continue
+            if action == 'remove':
+                delta.removed.add(row[1].strip())
+                continue
+            if len(row) != len(OUTPUT_HEADER) + 1:
+                delta.rejected += 1
+                continue
+            try:
+                record = parse_row(row[1:])
+            except ValueError:
+                delta.rejected += 1
+                continue
+            if action == 'add':
+                delta.added.append(record)
+            else:
+                delta.replaced.setdefault(record.substance, []).append(record)
+    return delta
+
+
+# 변경분을 정렬된 이진 파일에 병합 (임시 파일에 쓴 뒤 교체)
+# 반환값: (병합 후 레코드 수, 빠진 기존 레코드 리스트)
+def merge_inventory_binary(binary_path, delta):
+    dropped = []
+
+    def kept(bin_reader):
+        for record in bin_reader:
+            if delta.drops(record):
+                dropped.append(record)
+            else:
+                yield record
+
+    tmp_path = binary_path + '.tmp'
+    with InventoryBinaryReader(binary_path) as bin_reader:
+        # 인화성이 같으면 기존 레코드가 먼저 (전체를 다시 정렬했을 때와 같은 순서)
+        merged = heapq.merge(kept(bin_reader), delta.new_records(), key=by_flammability, reverse=True)
+        count = write_inventory_binary(merged, tmp_path)
+    os.replace(tmp_path, binary_path)
+    return count, dropped
+
+
+# 바뀐 인화성 값의 범위 (빠진 레코드 + 새 레코드), 바뀐 것이 없으면 None
+def affected_range(dropped, delta):
+    keys = [record.flammability for record in dropped] + [record.flammability for record in delta.new_records()]
+    if not keys:
+        return None
+    return min(keys), max(keys)
+
+
+# 위험 목록 CSV에서 [low, high] 범위만 이진 파일 내용으로 다시 만든다 (나머지 행은 그대로 복사)
+# 반환값: 다시 쓴 범위의 행 수
+def refresh_danger_csv(danger_csv_path, binary_path, low, high, threshold):
+    low = max(low, threshold)
+    if high < low:
+        return 0
+
+    tmp_path = danger_csv_path + '.tmp'
+    refreshed = 0
+    with InventoryBinaryReader(binary_path) as bin_reader, \
+            open(danger_csv_path, 'r', encoding='utf-8', newline='') as source, \
+            open(tmp_path, 'w', encoding='utf-8', newline='') as target:
+        reader = csv.reader(source)
+        writer = csv.writer(target, lineterminator='\n')
+        next(reader, None)
+        writer.writerow(OUTPUT_HEADER)
+
+        def write_range():
+            nonlocal refreshed
+            # 레코드 번호 순서 = 이진 파일의 인화성 내림차순 순서
+            for index in sorted(bin_reader.flammability_range(low, math.nextafter(high, math.inf))):
+                writer.writerow(format_row(bin_reader[index]))
+                refreshed += 1
+
+        written = False
+        for row in reader:
+            if not row:
+                continue
+            flammability = float(row[-1])
+            if flammability > high:
+                writer.writerow(row)
+            elif flammability >= low:
+                continue
+            else:
+                if not written:
+                    write_range()
+                    written = True
+                writer.writerow(row)
+        if not written:
+            write_range()
+    os.replace(tmp_path, danger_csv_path)
+    return refreshed
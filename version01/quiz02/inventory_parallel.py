@@ -0,0 +1,94 @@
+# 아주 큰 화물 목록 CSV 병렬 로더
+# 파일을 줄바꿈 경계에 맞춘 바이트 구간으로 나누고, 구간마다 ProcessPoolExecutor 작업자에서
+# csv 파싱 → 타입 변환 → 인화성 기준 필터까지 끝낸 뒤 걸러진 레코드만 부모 프로세스로 돌려보낸다.
+# (수천만 행 전체가 프로세스 사이를 오가지 않는다)
+# 형식이 맞지 않는 행(ValueError, 열 개수 불일치)은 구간마다 건너뛰고 개수만 모아서 알려 준다.
+#
+# 주의: 구간 경계를 줄바꿈으로 정하므로 따옴표 안에 줄바꿈이 들어간 필드는 지원하지 않는다
+# (화물 목록에는 그런 필드가 없다).
+
+import csv
+import io
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from inventory_reader import parse_row
+
+# 구간 하나의 기본 크기 (작업자 하나가 한 번에 메모리에 올리는 양)
+DEFAULT_CHUNK_BYTES = 16 * 1024 * 1024
+
+ChunkResult = namedtuple('ChunkResult', ['records', 'rows', 'rejected'])
+ParallelLoadResult = namedtuple('ParallelLoadResult', ['records', 'header', 'rows', 'rejected', 'chunks'])
+
+
+# 헤더 줄 읽기 → (헤더 필드 리스트, 데이터 시작 오프셋)
+def read_header(csv_path):
+    with open(csv_path, 'rb') as file:
+        line = file.readline()
+        return next(csv.reader([line.decode('utf-8')]), None), file.tell()
+
+
+# [start, end)를 chunk_bytes 크기 구간으로 나누되 각 경계를 다음 줄의 시작으로 옮긴다
+def chunk_ranges(csv_path, start, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    end = os.path.getsize(csv_path)
+    ranges = []
+    with open(csv_path, 'rb') as file:
+        while start < end:
+            boundary = start + chunk_bytes
+            if boundary < end:
+                file.seek(boundary)
+                file.readline()
+                boundary = file.tell()
+            boundary = min(boundary, end)
+            ranges.append((start, boundary))
+            start = boundary
+    return ranges
+
+
+# 작업자: 구간 하나를 파싱하고 인화성이 minimum 이상인 레코드만 돌려준다 (minimum이 None이면 전부)
+def parse_chunk(csv_path, start, end, columns, minimum=None):
+    with open(csv_path, 'rb') as file:
+        file.seek(start)
+        text = file.read(end - start).decode('utf-8')
+
+    records = []
+    rows = rejected = 0
+    for row in csv.reader(io.StringIO(text, newline='')):
+        if not row:
+            continue
+        rows += 1
+        if len(row) != columns:
+            rejected += 1
+            continue
+        try:
+            record = parse_row(row)
+        except ValueError:
+            rejected += 1
+            continue
+        if minimum is None or record.flammability >= minimum:
+            records.append(record)
+    return ChunkResult(records, rows, rejected)
+
+
+# 병렬 로드 실행 (레코드는 원본 파일 순서 그대로)
+def load_inventory_parallel(csv_path, minimum=None, workers=None, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    header, data_start = read_header(csv_path)
+    if not header:
+        return ParallelLoadResult([], None, 0, 0, 0)
+    ranges = chunk_ranges(csv_path, data_start, chunk_bytes)
+    if not ranges:
+        return ParallelLoadResult([], header, 0, 0, 0)
+
+    workers = workers or os.cpu_count() or 1
+    workers = max(1, min(workers, len(ranges)))
+    count = len(ranges)
+    records = []
+    rows = rejected = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for result in executor.map(parse_chunk, [csv_path] * count, [start for start, _ in ranges],
+                                   [end for _, end in ranges], [len(header)] * count, [minimum] * count):
+            records.extend(result.records)
+            rows += result.rows
+            rejected += result.rejected
+    return ParallelLoadResult(records, header, rows, rejected, count)
@@ -0,0 +1,35 @@
+# 전체 정렬 없이 답하는 화물 목록 조회
+#   - 인화성 상위 K개   : heapq.nlargest (O(n log k) 시간, O(k) 메모리)
+#   - 인화성 기준 이상  : 같은 스트리밍 안에서 기준 이상인 항목만 sink로 넘긴다 (전체 목록을 모아 두지 않는다)
+# 두 조회 모두 스트리밍 로더의 레코드를 직접 받으므로 파일 전체를 메모리에 올리지 않는다.
+
+import heapq
+from operator import attrgetter
+
+by_flammability = attrgetter('flammability')
+
+
+# 인화성 상위 K개 (인화성이 같으면 먼저 나온 항목이 앞)
+def top_by_flammability(records, k):
+    return heapq.nlargest(k, records, key=by_flammability)
+
+
+# 레코드를 그대로 흘려 보내면서 기준 이상인 항목은 sink로도 넘긴다
+# (상위 K개와 기준 조회를 파일 한 번 읽기로 같이 처리할 때 사용)
+def tap_flammability(records, minimum, sink):
+    for record in records:
+        if record.flammability >= minimum:
+            sink(record)
+        yield record
+
+
+# 상위 K개 + 기준 조회를 한 번의 스트리밍으로 실행
+# top이나 minimum이 None이면 그 조회는 하지 않는다. 반환값: 상위 K개 리스트 (top이 None이면 빈 리스트)
+def run_flammability_query(records, top=None, minimum=None, on_match=None):
+    if minimum is not None:
+        records = tap_flammability(records, minimum, on_match or (lambda record: None))
+    if top is not None:
+        return top_by_flammability(records, top)
+    for _ in records:
+        pass
+    return []
@@ -0,0 +1,107 @@
+# 화물 목록 CSV 스트리밍 로더
+# readlines()로 파일 전체를 올리고 ','로 나누는 대신 csv 모듈로 한 줄씩 읽어서
+# (따옴표 안의 쉼표도 올바르게 처리) 한 번의 변환으로 타입이 정해진 작은 레코드를 만든다.
+# 문자열 5개짜리 딕셔너리 대신 namedtuple 한 개라서 행마다 쓰는 메모리가 크게 줄어든다.
+#
+# 필드 타입:
+#   substance        : str
+#   weight           : float 또는 None ('Various'처럼 값이 하나로 정해지지 않았거나 숫자가 아닌 경우)
+#   specific_gravity : float 또는 None
+#   strength         : str ('Very weak', 'High' 같은 등급 문자열이라 숫자로 바꾸지 않는다, 같은 값은 공유)
+#   flammability     : float (숫자가 아니거나 nan / inf이면 그 행은 거부, 정렬 기준이라서)
+
+import csv
+import math
+import sys
+from collections import namedtuple
+
+InventoryRecord = namedtuple('InventoryRecord', [
+    'substance', 'weight', 'specific_gravity', 'strength', 'flammability',
+])
+
+# 저장할 때 쓰는 헤더 (기존 위험 목록 CSV와 같은 형식)
+OUTPUT_HEADER = ['Substance', 'Weight', 'Specific Gravity', 'Strength', 'Flammability']
+
+# 값이 하나로 정해지지 않은 항목
+VARIOUS = 'Various'
+
+
+# 'Various'나 빈 칸처럼 숫자로 바꿀 수 없는 값은 None, 그 외에는 float
+# (무게/비중은 필터나 정렬에 쓰지 않으므로 값 하나 때문에 행 전체를 버리지 않는다)
+def parse_measure(text):
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+# 인화성 (숫자가 아니거나 nan / inf이면 ValueError → 그 행은 거부)
+def parse_flammability(text):
+    value = float(text)
+    if not math.isfinite(value):
+        raise ValueError(f"flammability must be a finite number: {text.strip()}")
+    return value
+
+
+# 저장용 문자열 (None은 다시 'Various'로)
+def format_measure(value):
+    return VARIOUS if value is None else repr(value)
+
+
+# CSV 한 행을 레코드로 변환 (변환할 수 없으면 ValueError)
+def parse_row(row):
+    return InventoryRecord(
+        row[0].strip(),
+        parse_measure(row[1]),
+        parse_measure(row[2]),
+        sys.intern(row[3].strip()),
+        parse_flammability(row[4]),
+    )
+
+
+# 레코드를 CSV 한 행으로
+def format_row(record):
+    return [record.substance, format_measure(record.weight), format_measure(record.specific_gravity),
+            record.strength, repr(record.flammability)]
+
+
+class InventoryReader:
+    def __init__(self, csv_path):
+        self.csv_path = csv_path
+        self.header = None
+        self.rows = 0
+        self.rejected = 0    # 열 개수가 다르거나 숫자로 바꿀 수 없어서 건너뛴 행 수
+
+    # 한 행씩 읽어서 레코드로 내보내기 (파일 전체를 메모리에 올리지 않는다)
+    def __iter__(self):
+        with open(self.csv_path, 'r', encoding='utf-8', newline='') as file:
+            reader = csv.reader(file)
+            self.header = next(reader, None)
+            if self.header is None:
+                return
+            columns = len(self.header)
+            for row in reader:
+                if not row:
+                    continue
+                self.rows += 1
+                if len(row) != columns:
+                    self.rejected += 1
+                    continue
+                try:
+                    record = parse_row(row)
+                except ValueError:
+                    self.rejected += 1
+                    continue
+                yield record
+
+
+# 레코드들을 CSV로 저장 (csv 모듈이 쉼표가 들어간 값을 따옴표로 감싼다)
+def write_inventory_csv(records, csv_path):
+    count = 0
+    with open(csv_path, 'w', encoding='utf-8', newline='') as file:
+        writer = csv.writer(file, lineterminator='\n')
+        writer.writerow(OUTPUT_HEADER)
+        for record in records:
+            writer.writerow(format_row(record))
+            count += 1
+    return count
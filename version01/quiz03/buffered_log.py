@@ -0,0 +1,115 @@
+# 버퍼링 로그 기록기
+# 센서 값을 읽을 때마다 파일을 열고 → 덧붙이고 → 닫으면 샘플링 속도가 높을 때 시스템 호출이 대부분을 차지한다.
+# 이 기록기는 파일을 한 번만 열어 두고 레코드를 메모리에 모았다가 한꺼번에 쓴다.
+#
+# 비우는(flush) 시점:
+#   - 크기  : 모인 바이트가 max_bytes 이상
+#   - 시간  : 마지막으로 비운 뒤 flush_interval초가 지남 (쓰기가 멈춰도 백그라운드 스레드가 비운다)
+#   - 종료  : close() / with 블록 끝 / 프로그램 종료(atexit)
+#
+# 내구성(durability): 지연 시간과 안전성 사이에서 고른다.
+#   'none'   : fsync 없음 (OS 버퍼에만 넘김, 가장 빠름)
+#   'batch'  : 묶음을 쓸 때마다 fsync (전원이 꺼지면 마지막 묶음만 잃을 수 있다)
+#   'record' : 레코드마다 바로 쓰고 fsync (가장 안전, 가장 느림)
+
+import atexit
+import os
+import threading
+import time
+
+DURABILITY_MODES = ('none', 'batch', 'record')
+
+DEFAULT_MAX_BYTES = 64 * 1024
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+
+class BufferedLogWriter:
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES, flush_interval=DEFAULT_FLUSH_INTERVAL,
+                 durability='none', encoding='utf-8'):
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"Unknown durability '{durability}' (choose from {', '.join(DURABILITY_MODES)}).")
+        self.path = path
+        self.max_bytes = max_bytes
+        self.flush_interval = flush_interval
+        self.durability = durability
+        self.encoding = encoding
+
+        self.file = open(path, 'ab')
+        self.buffer = []
+        self.buffered_bytes = 0
+        self.last_flush = time.monotonic()
+        self.lock = threading.Lock()
+        self.closed = False
+
+        # 쓰기가 멈춰도 flush_interval마다 비우는 백그라운드 스레드
+        self.stop_event = threading.Event()
+        self.flusher = None
+        if flush_interval and durability != 'record':
+            self.flusher = threading.Thread(target=self._flush_periodically, name='BufferedLogWriter', daemon=True)
+            self.flusher.start()
+
+        atexit.register(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    # 레코드 하나 추가 (text는 줄바꿈까지 포함한 완성된 문자열)
+    def write(self, text):
+        data = text.encode(self.encoding)
+        with self.lock:
+            if self.closed:
+                raise ValueError('write to closed log writer')
+            if self.durability == 'record':
+                self._write_locked([data])
+                return
+            self.buffer.append(data)
+            self.buffered_bytes += len(data)
+            if self.buffered_bytes >= self.max_bytes or (
+                    self.flush_interval and time.monotonic() - self.last_flush >= self.flush_interval):
+                self._flush_locked()
+
+    # 모인 레코드를 파일에 쓰기
+    def flush(self):
+        with self.lock:
+            if not self.closed:
+                self._flush_locked()
+
+    # 마지막 쓰기가 실패해도(디스크 가득 참 등) 파일을 닫고 백그라운드 스레드를 멈춘 뒤 예외를 그대로 알린다
+    def close(self):
+        try:
+            with self.lock:
+                if self.closed:
+                    return
+                try:
+                    self._flush_locked()
+                finally:
+                    self.closed = True
+                    self.file.close()
+        finally:
+            self.stop_event.set()
+            if self.flusher is not None and self.flusher is not threading.current_thread():
+                self.flusher.join()
+            atexit.unregister(self.close)
+
+    def _flush_locked(self):
+        if self.buffer:
+            self._write_locked(self.buffer)
+            self.buffer = []
+            self.buffered_bytes = 0
+        self.last_flush = time.monotonic()
+
+    def _write_locked(self, chunks):
+        self.file.write(b''.join(chunks))
+        self.file.flush()
+        if self.durability != 'none':
+            os.fsync(self.file.fileno())
+
+    def _flush_periodically(self):
+        while not self.stop_event.wait(self.flush_interval):
+            with self.lock:
+                if not self.closed and time.monotonic() - self.last_flush >= self.flush_interval:
+                    self._flush_locked()
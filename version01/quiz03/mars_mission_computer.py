@@ -1,9 +1,19 @@
+import argparse
 import random
 import os
 from datetime import datetime
 
+from buffered_log import DURABILITY_MODES, BufferedLogWriter
+from sensor_log import TIMESTAMP_FORMAT, format_header, format_record
+
+# 로그 형식: legacy (라벨 붙은 여러 줄 블록) / csv (한 줄에 레코드 하나, sensor_log.py 참고)
+LOG_FORMATS = ("legacy", "csv")
+LOG_FILE_NAMES = {"legacy": "mars_env_log.txt", "csv": "mars_env_log.csv"}
+
 class DummySensor:
-    def __init__(self):
+    # log_writer를 주지 않으면 log_file_path에 덧붙이는 버퍼링 기록기를 만든다
+    # (읽을 때마다 파일을 열고 닫지 않고, 모았다가 크기/시간/종료 시점에 한꺼번에 쓴다)
+    def __init__(self, log_writer=None, durability="none", log_format="legacy"):
         self.env_values = {
             "mars_base_internal_temperature": None,
             "mars_base_external_temperature": None,
@@ -15,11 +25,29 @@ class DummySensor:
 
         # 로그 파일 저장 폴더 및 경로 설정
         self.log_dir = "문제3_미션컴퓨터리턴즈"
-        self.log_file_path = os.path.join(self.log_dir, "mars_env_log.txt")
+        self.log_format = log_format
+        self.log_file_path = os.path.join(self.log_dir, LOG_FILE_NAMES[log_format])
 
         # 폴더가 없으면 생성
         os.makedirs(self.log_dir, exist_ok=True)
 
+        # csv 형식 파일을 새로 만들 때는 schema 줄과 열 이름 줄을 먼저 쓴다
+        new_file = not os.path.exists(self.log_file_path) or os.path.getsize(self.log_file_path) == 0
+        self.log_writer = log_writer or BufferedLogWriter(self.log_file_path, durability=durability)
+        if log_format == "csv" and new_file:
+            self.log_writer.write(format_header())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    # 버퍼에 남은 로그를 파일에 쓰고 닫기
+    def close(self):
+        self.log_writer.close()
+
     def set_env(self):
         self.env_values["mars_base_internal_temperature"] = round(random.uniform(18, 30), 2)
         self.env_values["mars_base_external_temperature"] = round(random.uniform(0, 21), 2)
@@ -30,7 +58,11 @@ class DummySensor:
 
     def get_env(self):
         # 로그 작성
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        now = datetime.now().strftime(TIMESTAMP_FORMAT)
+        if self.log_format == "csv":
+            self.log_writer.write(format_record(now, self.env_values))
+            return self.env_values
+
         log_lines = [
             f"[{now}]",
             f"내부 온도: {self.env_values['mars_base_internal_temperature']}도",
@@ -42,19 +74,27 @@ class DummySensor:
             ""  # 공백 줄로 구분
         ]
 
-        with open(self.log_file_path, "a", encoding="utf-8") as log_file:
-            log_file.write("\n".join(log_lines))
+        self.log_writer.write("\n".join(log_lines))
 
         return self.env_values
 
 
 # 인스턴스 생성 및 사용
 if __name__ == "__main__":
-    ds = DummySensor()
-    ds.set_env()
-    env_data = ds.get_env()
+    parser = argparse.ArgumentParser(description="Mars base dummy sensor")
+    parser.add_argument("--samples", type=int, default=1, help="읽을 횟수")
+    parser.add_argument("--durability", choices=DURABILITY_MODES, default="none",
+                        help="로그 fsync 방식 (none: 없음, batch: 묶음마다, record: 레코드마다)")
+    parser.add_argument("--log-format", choices=LOG_FORMATS, default="legacy",
+                        help="로그 형식 (legacy: 여러 줄 블록, csv: 한 줄에 레코드 하나)")
+    args = parser.parse_args()
+
+    with DummySensor(durability=args.durability, log_format=args.log_format) as ds:
+        for _ in range(args.samples):
+            ds.set_env()
+            env_data = ds.get_env()
 
-    # 콘솔 출력
+    # 콘솔 출력 (마지막 값)
     print("🌌 화성 기지 환경 센서 데이터:")
     for key, value in env_data.items():
         print(f"{key}: {value}")
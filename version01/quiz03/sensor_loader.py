@@ -0,0 +1,160 @@
+# 시각화 스크립트가 같이 쓰는 센서 로그 로더 (캐시 포함)
+# visualize_log.py / visualize_dashboard.py가 실행할 때마다 로그 전체를 처음부터 다시 파싱하던 것을,
+# 파싱한 센서별 배열을 로그 옆의 캐시 파일('<로그>.sensorcache')에 저장해 두고 다시 쓴다.
+#
+#   - 로그의 크기와 mtime이 캐시와 같으면        : 캐시만 읽는다 (파싱 없음)
+#   - 로그가 커졌고 파싱했던 앞부분(최대 4KB)이 그대로이면 : 캐시가 끝난 위치부터 덧붙은 부분만 파싱
+#   - 그 밖 (줄었거나 다시 쓰였거나 캐시가 없음) : 전체를 다시 파싱
+# 캐시는 레코드 경계까지만 기록하므로 쓰는 중이던 마지막 줄(블록)은 다음 실행 때 이어서 읽는다.
+#
+# 캐시 파일 형식 (이 기계의 바이트 순서, 로그 옆에 두는 임시 파일이라 옮기지 않는다):
+#   헤더 : magic(4s) version(H) structured(B) reserved(B) source_size(Q) source_mtime_ns(q)
+#          parsed_offset(Q) head_hash(20s) record_count(Q) rejected(Q)
+#   본문 : timestamps(q × record_count), 이어서 SENSOR_FIELDS 순서로 값(d × record_count) 6개
+
+import hashlib
+import os
+import struct
+
+from sensor_log import (SENSOR_FIELDS, SensorColumns, is_structured_log, iter_legacy_records, parse_structured_lines,
+                        timestamp_to_seconds)
+
+CACHE_SUFFIX = ".sensorcache"
+CACHE_MAGIC = b"MENV"
+CACHE_VERSION = 1
+CACHE_HEADER = struct.Struct("<4sHBBQqQ20sQQ")
+
+# 로그가 다시 쓰였는지 확인할 때 비교하는 앞부분 크기
+HEAD_BYTES = 4096
+
+# 시각화 스크립트의 기본 로그 위치
+LOG_DIR = "문제3_미션컴퓨터리턴즈"
+LOG_FILE_NAMES = ("mars_env_log.csv", "mars_env_log.txt")
+
+
+# 로그 폴더에서 읽을 로그 파일 경로
+# 두 형식이 모두 있으면 가장 최근에 수정된 쪽 (지금 미션 컴퓨터가 쓰고 있는 로그),
+# 수정 시각이 같으면 새 형식을 쓴다.
+def find_sensor_log(log_dir=LOG_DIR):
+    candidates = []
+    for rank, name in enumerate(LOG_FILE_NAMES):
+        path = os.path.join(log_dir, name)
+        try:
+            candidates.append((os.stat(path).st_mtime_ns, -rank, path))
+        except OSError:
+            continue
+    if candidates:
+        return max(candidates)[2]
+    return os.path.join(log_dir, LOG_FILE_NAMES[-1])
+
+
+def cache_path_for(log_path):
+    return log_path + CACHE_SUFFIX
+
+
+# 파싱했던 부분의 앞쪽 (최대 HEAD_BYTES) 해시
+def head_hash(log_path, parsed_offset):
+    with open(log_path, "rb") as file:
+        return hashlib.sha1(file.read(min(HEAD_BYTES, parsed_offset))).digest()
+
+
+# start부터 줄바꿈으로 끝나는 줄만 디코딩해서 내보낸다 (progress[0]에 지금까지 읽은 바이트 위치)
+def iter_complete_lines(file, start, progress):
+    file.seek(start)
+    position = start
+    for raw in file:
+        if not raw.endswith(b"\n"):
+            break
+        position += len(raw)
+        progress[0] = position
+        yield raw.decode("utf-8", errors="replace")
+
+
+# log_path의 start 바이트부터 파싱해서 columns에 덧붙이기 → 레코드 경계까지 읽은 바이트 위치
+def parse_from(log_path, start, structured, columns):
+    progress = [start]
+    with open(log_path, "rb") as file:
+        lines = iter_complete_lines(file, start, progress)
+        if structured:
+            parse_structured_lines(lines, columns)
+            return progress[0]
+
+        # 기존 블록 형식: 마지막으로 완성된 레코드까지만 반영 (끝의 미완성 블록은 다음에 다시 읽는다)
+        boundary = start
+        rejected = []
+        rejected_at_boundary = 0
+        for timestamp, values in iter_legacy_records(lines, rejected):
+            try:
+                columns.append(timestamp_to_seconds(timestamp), [values[field] for field in SENSOR_FIELDS])
+            except ValueError:
+                rejected.append(1)
+            boundary = progress[0]
+            rejected_at_boundary = len(rejected)
+        columns.rejected += rejected_at_boundary
+        return boundary
+
+
+def read_cache(cache_path):
+    try:
+        with open(cache_path, "rb") as file:
+            header = file.read(CACHE_HEADER.size)
+            (magic, version, structured, _, size, mtime_ns, parsed_offset, digest,
+             count, rejected) = CACHE_HEADER.unpack(header)
+            if magic != CACHE_MAGIC or version != CACHE_VERSION:
+                return None
+            columns = SensorColumns()
+            columns.timestamps.fromfile(file, count)
+            for field in SENSOR_FIELDS:
+                columns.values[field].fromfile(file, count)
+    except (OSError, struct.error, EOFError):
+        return None
+    columns.rejected = rejected
+    return columns, bool(structured), size, mtime_ns, parsed_offset, digest
+
+
+def write_cache(cache_path, columns, structured, stat, parsed_offset, log_path):
+    digest = head_hash(log_path, parsed_offset)
+    tmp_path = cache_path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as file:
+            file.write(CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, structured, 0, stat.st_size,
+                                         stat.st_mtime_ns, parsed_offset, digest, len(columns), columns.rejected))
+            columns.timestamps.tofile(file)
+            for field in SENSOR_FIELDS:
+                columns.values[field].tofile(file)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # 캐시는 없어도 동작한다 (읽기 전용 폴더 등)
+        pass
+
+
+# 로그를 SensorColumns로 읽기 (캐시를 쓰고 갱신한다)
+def load_sensor_log(log_path, use_cache=True):
+    stat = os.stat(log_path)
+    cache_path = cache_path_for(log_path)
+
+    cached = read_cache(cache_path) if use_cache else None
+    if cached is not None:
+        columns, structured, size, mtime_ns, parsed_offset, cached_digest = cached
+        if size == stat.st_size and mtime_ns == stat.st_mtime_ns:
+            return columns
+        if stat.st_size >= parsed_offset and head_hash(log_path, parsed_offset) == cached_digest:
+            # 덧붙은 부분만 파싱
+            parsed_offset = parse_from(log_path, parsed_offset, structured, columns)
+            write_cache(cache_path, columns, structured, stat, parsed_offset, log_path)
+            return columns
+
+    structured = is_structured_log(log_path)
+    columns = SensorColumns()
+    parsed_offset = parse_from(log_path, 0, structured, columns)
+    if use_cache:
+        write_cache(cache_path, columns, structured, stat, parsed_offset, log_path)
+    return columns
+
+
+# 시각화 스크립트용: (시각, 내부 온도, 외부 온도, 내부 습도, 외부 광량, 내부 CO2, 내부 산소) 리스트 묶음
+def load_sensor_series(log_path=None, use_cache=True):
+    columns = load_sensor_log(log_path or find_sensor_log(), use_cache)
+    if columns.rejected:
+        print(f"로그 파싱 오류: 형식이 맞지 않는 레코드 {columns.rejected}개를 건너뛰었습니다.")
+    return (columns.datetimes(),) + tuple(columns.values[field].tolist() for field in SENSOR_FIELDS)
@@ -0,0 +1,203 @@
+# 센서 로그 형식과 파서
+# 기존 로그는 샘플 하나를 한국어 라벨이 붙은 여러 줄 블록으로 쓰고, 시각화 스크립트는 8줄 단위로 끊어 읽는다.
+# 줄 하나만 깨져도 그 뒤의 모든 레코드가 밀린다.
+#
+# 새 형식 (한 줄에 레코드 하나, CSV):
+#   # mars_env_log schema=1
+#   timestamp,mars_base_internal_temperature,...,mars_base_internal_oxygen
+#   2025-03-31 15:58:07,18.12,9.05,53.99,668.98,0.0852,5.49
+# 첫 줄의 schema 번호로 형식 버전을 구분한다. 깨진 줄은 그 줄만 건너뛴다.
+#
+# 파서는 줄을 하나씩 읽으면서 센서별 array('d')에 바로 쌓는다 (시각은 1970-01-01 기준 초, array('q')).
+# 기존 블록 형식은 라벨로 값을 찾는 상태 기계로 읽으므로 줄이 빠지거나 늘어도 다음 레코드부터 다시 맞춰진다.
+
+import argparse
+import os
+from array import array
+from datetime import datetime, timedelta
+
+SCHEMA_VERSION = 1
+SCHEMA_LINE = f"# mars_env_log schema={SCHEMA_VERSION}"
+SCHEMA_PREFIX = "# mars_env_log schema="
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+EPOCH = datetime(1970, 1, 1)
+
+# 센서 필드 (DummySensor.env_values와 같은 순서)
+SENSOR_FIELDS = (
+    "mars_base_internal_temperature",
+    "mars_base_external_temperature",
+    "mars_base_internal_humidity",
+    "mars_base_external_illuminance",
+    "mars_base_internal_co2",
+    "mars_base_internal_oxygen",
+)
+
+HEADER_LINE = ",".join(("timestamp",) + SENSOR_FIELDS)
+
+# 기존 블록 형식의 라벨 → (필드, 값 뒤의 단위)
+LEGACY_LABELS = {
+    "내부 온도": ("mars_base_internal_temperature", "도"),
+    "외부 온도": ("mars_base_external_temperature", "도"),
+    "내부 습도": ("mars_base_internal_humidity", "%"),
+    "외부 광량": ("mars_base_external_illuminance", "W/m2"),
+    "내부 CO2": ("mars_base_internal_co2", "%"),
+    "내부 산소": ("mars_base_internal_oxygen", "%"),
+}
+
+
+# 센서별 배열 묶음
+class SensorColumns:
+    def __init__(self):
+        self.timestamps = array("q")    # 1970-01-01 기준 초 (로그에 적힌 현지 시각 그대로)
+        self.values = {field: array("d") for field in SENSOR_FIELDS}
+        self.rejected = 0               # 형식이 맞지 않아 건너뛴 줄(레코드) 수
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def append(self, seconds, values):
+        self.timestamps.append(seconds)
+        for field, value in zip(SENSOR_FIELDS, values):
+            self.values[field].append(value)
+
+    # 그래프용 datetime 리스트
+    def datetimes(self):
+        return [EPOCH + timedelta(seconds=seconds) for seconds in self.timestamps]
+
+
+def timestamp_to_seconds(text):
+    return int((datetime.fromisoformat(text) - EPOCH).total_seconds())
+
+
+# 새 형식 한 줄 (timestamp는 TIMESTAMP_FORMAT 문자열)
+def format_record(timestamp, env_values):
+    return ",".join([timestamp] + [str(env_values[field]) for field in SENSOR_FIELDS]) + "\n"
+
+
+# 새 형식 파일의 맨 앞 (schema 줄 + 열 이름 줄)
+def format_header():
+    return SCHEMA_LINE + "\n" + HEADER_LINE + "\n"
+
+
+# 파일이 새 형식인지 (첫 줄의 schema 표시로 판단)
+def is_structured_log(path):
+    with open(path, "r", encoding="utf-8") as file:
+        return file.readline().startswith(SCHEMA_PREFIX)
+
+
+# 새 형식 줄들을 columns에 쌓기 (schema / 열 이름 / 빈 줄은 건너뜀)
+def parse_structured_lines(lines, columns=None):
+    columns = columns if columns is not None else SensorColumns()
+    width = len(SENSOR_FIELDS) + 1
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#") or line == HEADER_LINE:
+            if line.startswith(SCHEMA_PREFIX) and line != SCHEMA_LINE:
+                raise ValueError(f"Unsupported sensor log schema: {line[len(SCHEMA_PREFIX):]}")
+            continue
+        parts = line.split(",")
+        if len(parts) != width:
+            columns.rejected += 1
+            continue
+        try:
+            seconds = timestamp_to_seconds(parts[0])
+            values = [float(part) for part in parts[1:]]
+        except ValueError:
+            columns.rejected += 1
+            continue
+        columns.append(seconds, values)
+    return columns
+
+
+# 기존 블록 형식 줄들 → (timestamp 문자열, env_values 딕셔너리) 스트림
+# '[...]' 줄에서 새 레코드를 시작하고, 여섯 값이 모두 모이면 내보낸다.
+# 값이 빠지거나 알아볼 수 없는 줄이 있는 레코드는 그 레코드만 버리고 다음 '[...]' 줄에서 다시 맞춘다.
+# rejected 리스트를 주면 버린 레코드(또는 레코드 밖의 줄)마다 1을 추가한다.
+def iter_legacy_records(lines, rejected=None):
+    rejected = rejected if rejected is not None else []
+    timestamp = None
+    values = {}
+    broken = False
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("[") and line.endswith("]"):
+            if timestamp is not None and not broken:
+                rejected.append(1)    # 값이 다 모이기 전에 다음 레코드가 시작됨
+            timestamp, values, broken = line[1:-1], {}, False
+            continue
+        if broken:
+            continue
+        if timestamp is None:
+            rejected.append(1)        # 레코드 밖의 줄
+            continue
+        label, _, value = line.partition(":")
+        entry = LEGACY_LABELS.get(label.strip())
+        try:
+            if entry is None:
+                raise ValueError(line)
+            field, unit = entry
+            values[field] = float(value.strip().removesuffix(unit).strip())
+        except ValueError:
+            rejected.append(1)
+            broken = True
+            continue
+        if len(values) == len(SENSOR_FIELDS):
+            yield timestamp, values
+            timestamp, values = None, {}
+    if timestamp is not None and not broken:
+        rejected.append(1)
+
+
+# 기존 블록 형식 줄들을 columns에 쌓기
+def parse_legacy_lines(lines, columns=None):
+    columns = columns if columns is not None else SensorColumns()
+    rejected = []
+    for timestamp, values in iter_legacy_records(lines, rejected):
+        try:
+            seconds = timestamp_to_seconds(timestamp)
+        except ValueError:
+            columns.rejected += 1
+            continue
+        columns.append(seconds, [values[field] for field in SENSOR_FIELDS])
+    columns.rejected += len(rejected)
+    return columns
+
+
+# 형식을 알아서 판단해서 파일 전체를 읽기 (한 줄씩 스트리밍)
+def parse_sensor_log(path):
+    parse = parse_structured_lines if is_structured_log(path) else parse_legacy_lines
+    with open(path, "r", encoding="utf-8") as file:
+        return parse(file)
+
+
+# 기존 블록 형식 로그를 새 형식으로 변환 → (변환한 레코드 수, 버린 레코드 수)
+def convert_legacy_log(legacy_path, output_path):
+    rejected = []
+    count = 0
+    tmp_path = output_path + ".tmp"
+    with open(legacy_path, "r", encoding="utf-8") as source, \
+            open(tmp_path, "w", encoding="utf-8", newline="\n") as target:
+        target.write(format_header())
+        for timestamp, values in iter_legacy_records(source, rejected):
+            try:
+                timestamp_to_seconds(timestamp)
+            except ValueError:
+                rejected.append(1)
+                continue
+            target.write(format_record(timestamp, values))
+            count += 1
+    os.replace(tmp_path, output_path)
+    return count, len(rejected)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert a legacy Mars sensor log to the one-line format")
+    parser.add_argument("legacy_log", help="기존 블록 형식 로그 경로")
+    parser.add_argument("output", help="저장할 새 형식 로그 경로")
+    args = parser.parse_args()
+
+    converted, dropped = convert_legacy_log(args.legacy_log, args.output)
+    print(f"변환 완료: {converted}개 레코드 → {args.output}" + (f" (버린 레코드 {dropped}개)" if dropped else ""))
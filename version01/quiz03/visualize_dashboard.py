@@ -1,7 +1,7 @@
-import os
 import matplotlib.pyplot as plt
 import platform
-from datetime import datetime
+
+from sensor_loader import find_sensor_log, load_sensor_series
 
 # 한글 폰트 설정 (운영체제별)
 if platform.system() == 'Windows':
@@ -10,45 +10,13 @@ elif platform.system() == 'Darwin':
     plt.rcParams['font.family'] = 'AppleGothic'
 plt.rcParams['axes.unicode_minus'] = False
 
-# 로그 파일 경로
+# 로그 파일 경로 (새 형식 mars_env_log.csv가 있으면 그것을, 없으면 기존 mars_env_log.txt)
 LOG_DIR = "문제3_미션컴퓨터리턴즈"
-LOG_PATH = os.path.join(LOG_DIR, "mars_env_log.txt")
+LOG_PATH = find_sensor_log(LOG_DIR)
 
-# 로그 파싱 함수
+# 로그 파싱 함수 (공용 로더: 캐시 파일을 쓰고, 로그가 늘어난 만큼만 새로 파싱한다)
 def parse_log():
-    timestamps = []
-    internal_temps = []
-    external_temps = []
-    humidities = []
-    illuminances = []
-    co2s = []
-    oxygens = []
-
-    with open(LOG_PATH, "r", encoding="utf-8") as file:
-        lines = file.readlines()
-
-    for i in range(0, len(lines), 8):
-        try:
-            timestamp = datetime.strptime(lines[i].strip()[1:-1], "%Y-%m-%d %H:%M:%S")
-            internal_temp = float(lines[i+1].split(":")[1].replace("도", "").strip())
-            external_temp = float(lines[i+2].split(":")[1].replace("도", "").strip())
-            humidity = float(lines[i+3].split(":")[1].replace("%", "").strip())
-            illuminance = float(lines[i+4].split(":")[1].replace("W/m2", "").strip())
-            co2 = float(lines[i+5].split(":")[1].replace("%", "").strip())
-            oxygen = float(lines[i+6].split(":")[1].replace("%", "").strip())
-
-            timestamps.append(timestamp)
-            internal_temps.append(internal_temp)
-            external_temps.append(external_temp)
-            humidities.append(humidity)
-            illuminances.append(illuminance)
-            co2s.append(co2)
-            oxygens.append(oxygen)
-        except Exception as e:
-            print(f"로그 파싱 오류: {e}")
-            continue
-
-    return timestamps, internal_temps, external_temps, humidities, illuminances, co2s, oxygens
+    return load_sensor_series(LOG_PATH)
 
 # 서브플롯으로 6개 그래프를 하나의 창에 출력
 def plot_dashboard(t, t_in, t_out, hum, light, co2, oxy):